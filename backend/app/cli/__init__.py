@@ -0,0 +1 @@
+"""Command-line tools, run from backend/ as `python -m app.cli.<tool>`."""
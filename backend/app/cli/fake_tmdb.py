@@ -0,0 +1,309 @@
+"""Local stand-in for the TMDb API, for benchmarks, load tests and integration tests.
+
+Serves `/search/movie` and `/movie/{id}` from a deterministic synthetic
+catalog (or a TMDb export file), with injectable latency, server errors and
+429 rate limiting. Point the backend at it with TMDB_BASE_URL.
+
+Usage (from backend/):
+    python -m app.cli.fake_tmdb --port 8001 --latency lognormal:40:15 --error-rate 0.02 --rate-limit-rate 0.05
+    TMDB_BASE_URL=http://127.0.0.1:8001/3 TMDB_API_KEY=fake uvicorn app.main:app
+"""
+import argparse
+import json
+import math
+import random
+import threading
+import time
+from dataclasses import dataclass, field
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+from urllib.parse import parse_qs, urlsplit
+
+PAGE_SIZE = 20
+
+_WORDS = (
+    "Shadow Star Night River Last Silent Golden Broken Iron Lost City Dream Storm Winter Summer "
+    "Secret Red Blue Black White Empire Return Rise Fall Edge Heart Ghost Machine Ocean Fire"
+).split()
+_GENRES = ["Action", "Comedy", "Drama", "Horror", "Romance", "Science Fiction", "Thriller", "Animation"]
+
+NOT_FOUND_BODY = {"success": False, "status_code": 34, "status_message": "The resource you requested could not be found."}
+RATE_LIMIT_BODY = {"success": False, "status_code": 25, "status_message": "Your request count is over the allowed limit."}
+SERVER_ERROR_BODY = {"success": False, "status_code": 11, "status_message": "Internal error: Something went wrong."}
+
+
+@dataclass
+class LatencyModel:
+    """Per-request delay in milliseconds drawn from a named distribution.
+
+    `constant:MEAN`, `uniform:LOW:HIGH`, `normal:MEAN:STDDEV`,
+    `lognormal:MEDIAN:SPREAD` (spread in ms around the median) or
+    `exponential:MEAN`. Negative draws are clamped to zero.
+    """
+    distribution: str = "constant"
+    a: float = 0.0
+    b: float = 0.0
+
+    @classmethod
+    def parse(cls, spec: str) -> "LatencyModel":
+        parts = spec.split(":")
+        numbers = [float(p) for p in parts[1:]] + [0.0, 0.0]
+        model = cls(parts[0], numbers[0], numbers[1])
+        if model.distribution not in ("constant", "uniform", "normal", "lognormal", "exponential"):
+            raise ValueError(f"Unknown latency distribution: {model.distribution}")
+        return model
+
+    def sample(self, rng: random.Random) -> float:
+        if self.distribution == "uniform":
+            ms = rng.uniform(self.a, self.b)
+        elif self.distribution == "normal":
+            ms = rng.gauss(self.a, self.b)
+        elif self.distribution == "lognormal":
+            sigma = math.log1p(self.b / self.a) if self.a > 0 else 0.0
+            ms = rng.lognormvariate(math.log(self.a), sigma) if self.a > 0 else 0.0
+        elif self.distribution == "exponential":
+            ms = rng.expovariate(1 / self.a) if self.a > 0 else 0.0
+        else:
+            ms = self.a
+        return max(ms, 0.0) / 1000
+
+
+@dataclass
+class FakeTMDbConfig:
+    latency: LatencyModel = field(default_factory=LatencyModel)
+    error_rate: float = 0.0           # fraction of requests answered with 503
+    rate_limit_rate: float = 0.0      # fraction of requests answered with 429
+    retry_after: float = 1.0          # Retry-After seconds sent with 429s
+    fail_first: int = 0               # answer the first N requests with 503 regardless of rates
+    api_key: Optional[str] = None     # when set, other keys/tokens get 401
+    seed: int = 1
+
+
+def synthetic_catalog(size: int = 5000, seed: int = 1) -> Dict[int, Dict[str, Any]]:
+    """Deterministic movies with TMDb-shaped detail fields, keyed by id."""
+    rng = random.Random(seed)
+    catalog: Dict[int, Dict[str, Any]] = {}
+    for i in range(1, size + 1):
+        title = " ".join(rng.sample(_WORDS, rng.randint(1, 3)))
+        catalog[i] = {
+            "id": i,
+            "title": f"{title} {i}" if rng.random() < 0.3 else title,
+            "overview": f"Synthetic overview for movie {i}.",
+            "release_date": f"{rng.randint(1950, 2025)}-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}",
+            "poster_path": f"/poster{i}.jpg",
+            "backdrop_path": f"/backdrop{i}.jpg",
+            "runtime": rng.randint(75, 180),
+            "genres": [{"id": g, "name": _GENRES[g]} for g in sorted(rng.sample(range(len(_GENRES)), 2))],
+            "popularity": round(rng.expovariate(0.1), 3),
+        }
+    return catalog
+
+
+def catalog_from_export(path: Path) -> Dict[int, Dict[str, Any]]:
+    """Movies from a TMDb daily export (see app.cli.import_tmdb_catalog)."""
+    from app.services.tmdb_catalog_service import iter_export
+
+    return {
+        row["tmdb_id"]: {
+            "id": row["tmdb_id"],
+            "title": row["title"],
+            "overview": row["overview"],
+            "release_date": row["release_date"],
+            "poster_path": row["poster_path"],
+            "backdrop_path": None,
+            "runtime": 0,
+            "genres": [],
+            "popularity": row["popularity"],
+        }
+        for row in iter_export(path)
+    }
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive, so client pooling is observable
+    server: "FakeTMDbServer"
+
+    def do_GET(self):
+        self.server.handle_api(self)
+
+    def send_json(self, status: int, body: Any, headers: Optional[Dict[str, str]] = None) -> None:
+        payload = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json;charset=utf-8")
+        self.send_header("Content-Length", str(len(payload)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, *args):
+        pass
+
+
+class FakeTMDbServer(ThreadingHTTPServer):
+    """Threaded fake TMDb. Use `with FakeTMDbServer() as tmdb:` and `tmdb.base_url`."""
+
+    daemon_threads = True
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        config: Optional[FakeTMDbConfig] = None,
+        catalog: Optional[Dict[int, Dict[str, Any]]] = None,
+    ):
+        super().__init__((host, port), _Handler)
+        self.config = config or FakeTMDbConfig()
+        self.catalog = catalog if catalog is not None else synthetic_catalog(seed=self.config.seed)
+        self._rng = random.Random(self.config.seed)
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self.stats: Dict[str, int] = {}
+        self.reset_stats()
+
+    @property
+    def base_url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}/3"
+
+    def reset_stats(self) -> None:
+        with self._lock:
+            self.stats = {"connections": 0, "requests": 0, "search": 0, "details": 0,
+                          "not_found": 0, "rate_limited": 0, "errors": 0, "unauthorized": 0}
+
+    def _count(self, name: str) -> None:
+        with self._lock:
+            self.stats[name] += 1
+
+    def process_request(self, request, client_address):
+        self._count("connections")
+        super().process_request(request, client_address)
+
+    def start(self) -> "FakeTMDbServer":
+        self._thread = threading.Thread(target=self.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self.shutdown()
+        self.server_close()
+
+    def __enter__(self) -> "FakeTMDbServer":
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
+
+    def _draw(self) -> Dict[str, Any]:
+        with self._lock:
+            self.stats["requests"] += 1
+            return {
+                "n": self.stats["requests"],
+                "delay": self.config.latency.sample(self._rng),
+                "roll": self._rng.random(),
+            }
+
+    def _authorized(self, handler: _Handler, query: Dict[str, List[str]]) -> bool:
+        expected = self.config.api_key
+        if not expected:
+            return True
+        bearer = handler.headers.get("Authorization", "")
+        return query.get("api_key", [None])[0] == expected or bearer == f"Bearer {expected}"
+
+    def handle_api(self, handler: _Handler) -> None:
+        url = urlsplit(handler.path)
+        query = parse_qs(url.query)
+        path = url.path[2:] if url.path.startswith("/3/") else url.path
+
+        if path == "/__stats":
+            with self._lock:
+                handler.send_json(200, dict(self.stats))
+            return
+
+        draw = self._draw()
+        if draw["delay"]:
+            time.sleep(draw["delay"])
+        if not self._authorized(handler, query):
+            self._count("unauthorized")
+            handler.send_json(401, {"success": False, "status_code": 7, "status_message": "Invalid API key."})
+            return
+        config = self.config
+        if draw["n"] <= config.fail_first or draw["roll"] < config.error_rate:
+            self._count("errors")
+            handler.send_json(503, SERVER_ERROR_BODY)
+            return
+        if draw["roll"] < config.error_rate + config.rate_limit_rate:
+            self._count("rate_limited")
+            handler.send_json(429, RATE_LIMIT_BODY, {"Retry-After": f"{config.retry_after:g}"})
+            return
+
+        if path == "/search/movie":
+            self._count("search")
+            handler.send_json(200, self.search(query.get("query", [""])[0], int(query.get("page", ["1"])[0])))
+        elif path.startswith("/movie/") and path[len("/movie/"):].isdigit():
+            self._count("details")
+            movie = self.catalog.get(int(path[len("/movie/"):]))
+            if movie is None:
+                self._count("not_found")
+                handler.send_json(404, NOT_FOUND_BODY)
+            else:
+                handler.send_json(200, movie)
+        else:
+            self._count("not_found")
+            handler.send_json(404, NOT_FOUND_BODY)
+
+    def search(self, text: str, page: int = 1) -> Dict[str, Any]:
+        needle = text.casefold().strip()
+        matches = [m for m in self.catalog.values() if needle and needle in m["title"].casefold()]
+        matches.sort(key=lambda m: -m["popularity"])
+        start = (max(page, 1) - 1) * PAGE_SIZE
+        results = [
+            {key: movie[key] for key in ("id", "title", "overview", "release_date", "poster_path", "popularity")}
+            for movie in matches[start:start + PAGE_SIZE]
+        ]
+        return {
+            "page": page,
+            "results": results,
+            "total_results": len(matches),
+            "total_pages": math.ceil(len(matches) / PAGE_SIZE),
+        }
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8001)
+    parser.add_argument("--latency", default="constant:0", help="e.g. constant:50, uniform:20:80, lognormal:40:15")
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--rate-limit-rate", type=float, default=0.0)
+    parser.add_argument("--retry-after", type=float, default=1.0)
+    parser.add_argument("--fail-first", type=int, default=0)
+    parser.add_argument("--api-key", default=None)
+    parser.add_argument("--catalog-size", type=int, default=5000)
+    parser.add_argument("--catalog", type=Path, default=None, help="serve movies from a TMDb export file instead")
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args(argv)
+
+    config = FakeTMDbConfig(
+        latency=LatencyModel.parse(args.latency),
+        error_rate=args.error_rate,
+        rate_limit_rate=args.rate_limit_rate,
+        retry_after=args.retry_after,
+        fail_first=args.fail_first,
+        api_key=args.api_key,
+        seed=args.seed,
+    )
+    catalog = catalog_from_export(args.catalog) if args.catalog else synthetic_catalog(args.catalog_size, args.seed)
+    server = FakeTMDbServer(args.host, args.port, config, catalog)
+    print(f"Fake TMDb serving {len(catalog)} movies at {server.base_url}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
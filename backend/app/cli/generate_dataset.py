@@ -0,0 +1,359 @@
+"""Generate a synthetic dataset in the app/data on-disk format for scale testing.
+
+Output is deterministic for a given seed and scale. Every file matches what
+the repositories write (same keys, two-space indented JSON arrays, BOM on
+reviews.json, review titles and bodies in reviews.text) and the data is
+consistent: reviews point at existing movies and users, review votes equal
+battle wins, and flagged reviews have flags.
+Files are streamed, so even the `large` scale needs little memory.
+
+Usage (from backend/):
+    python -m app.cli.generate_dataset --out /tmp/rb-data --scale large --seed 7
+    python -m app.cli.generate_dataset --out /tmp/rb-data --reviews 200000 --battles 0
+"""
+import argparse
+import json
+import math
+import random
+import sys
+import time
+import uuid
+from array import array
+from dataclasses import dataclass, fields, replace
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from typing import Any, BinaryIO, Dict, Iterable, Iterator, List, Optional, Tuple
+
+import bcrypt
+
+# Every synthetic account can log in with this password.
+SYNTHETIC_PASSWORD = "synthetic-pass"
+_BCRYPT_SALT = b"$2b$04$SyntheticDatasetSalt.."  # fixed so the output is deterministic
+
+# Shape of the shipped reviews: mostly 5 stars, ~680 character bodies.
+RATING_WEIGHTS = (5, 4, 12, 12, 67)  # percent for 1..5 stars
+REVIEW_BODY_MEDIAN = 680
+COMMENT_BODY_MEDIAN = 60
+
+_GENRES = ["Action", "Adventure", "Animation", "Comedy", "Crime", "Drama", "Family", "Fantasy",
+           "Horror", "Mystery", "Romance", "Science Fiction", "Thriller", "War", "Western"]
+_TITLE_WORDS = (
+    "Shadow Star Night River Last Silent Golden Broken Iron Lost City Dream Storm Winter Summer Secret "
+    "Red Blue Black White Empire Return Rise Fall Edge Heart Ghost Machine Ocean Fire Kingdom Garden "
+    "Road Signal Mirror Echo Harbor Valley Crown Wolf Glass Paper Thunder Velvet Hollow Northern"
+).split()
+_PROSE_WORDS = (
+    "the a of and to in is it that this film movie story was with for as but its performance director "
+    "cast scene plot character really great good bad pacing ending visuals score script acting one more "
+    "than like just about feels makes moments between never always audience screen camera dialogue "
+    "tension humor heart world time life best worst second act third twist surprisingly brilliant dull"
+).split()
+
+
+@dataclass
+class DatasetSpec:
+    users: int = 1_000
+    movies: int = 2_000
+    reviews: int = 50_000
+    battles: int = 100_000
+    comments: int = 20_000
+    flags: int = 1_000
+    watchlists: int = 500
+    seed: int = 1
+    end_date: date = date(2025, 12, 31)
+
+
+SCALES = {
+    "tiny": DatasetSpec(users=20, movies=15, reviews=200, battles=300, comments=100, flags=20, watchlists=10),
+    "small": DatasetSpec(),
+    "medium": DatasetSpec(users=5_000, movies=10_000, reviews=250_000, battles=1_000_000,
+                          comments=100_000, flags=5_000, watchlists=2_500),
+    "large": DatasetSpec(users=10_000, movies=50_000, reviews=1_000_000, battles=5_000_000,
+                         comments=500_000, flags=20_000, watchlists=5_000),
+}
+
+
+def write_json_array(path: Path, rows: Iterable[Dict[str, Any]], encoding: str = "utf-8") -> int:
+    """Stream rows to `path` exactly as json.dump(rows, indent=2, ensure_ascii=False) would."""
+    count = 0
+    with path.open("w", encoding=encoding) as f:
+        f.write("[")
+        for row in rows:
+            f.write(",\n  " if count else "\n  ")
+            f.write(json.dumps(row, ensure_ascii=False, indent=2).replace("\n", "\n  "))
+            count += 1
+        f.write("\n]" if count else "]")
+    return count
+
+
+def _skewed(rng: random.Random, n: int, power: float) -> int:
+    """Index in [0, n) biased towards 0; larger powers give a heavier head."""
+    return min(int(n * rng.random() ** power), n - 1)
+
+
+def _lognormal_length(rng: random.Random, median: int, low: int, high: int) -> int:
+    return max(low, min(high, int(rng.lognormvariate(math.log(median), 0.7))))
+
+
+def _uuid(rng: random.Random) -> str:
+    return str(uuid.UUID(int=rng.getrandbits(128), version=4))
+
+
+class _Prose:
+    """Word salad sliced from one pre-generated corpus, so long bodies are cheap."""
+
+    def __init__(self, rng: random.Random, size: int = 200_000):
+        words = []
+        length = 0
+        while length < size:
+            word = rng.choice(_PROSE_WORDS)
+            words.append(word)
+            length += len(word) + 1
+        self.corpus = " ".join(words) + " "
+
+    def text(self, rng: random.Random, length: int) -> str:
+        start = rng.randrange(len(self.corpus) - length - 1)
+        start = self.corpus.find(" ", start) + 1
+        body = self.corpus[start:start + length].rsplit(" ", 1)[0]
+        return body[:1].upper() + body[1:] + "."
+
+
+class _Generator:
+    def __init__(self, spec: DatasetSpec):
+        self.spec = spec
+        self.seed = spec.seed
+        self.prose = _Prose(self._rng("prose"))
+        self.end = datetime.combine(spec.end_date, datetime.min.time())
+        self.user_ids: List[str] = []
+        self.movie_ids: List[str] = []
+        self.movie_release: array = array("I")
+        # Per-review columns kept for consistency between files (about 10 bytes per review).
+        self.review_author = array("I")
+        self.review_rating = array("B")
+        self.review_day = array("I")
+        self.review_votes = array("I")
+        self.flags: List[Tuple[str, int, datetime]] = []
+        self.flagged: Dict[int, int] = {}
+
+    def _rng(self, name: str) -> random.Random:
+        return random.Random(f"{self.seed}:{name}")
+
+    # users.json
+    def users(self) -> Iterator[Dict[str, Any]]:
+        rng = self._rng("users")
+        hashed = bcrypt.hashpw(SYNTHETIC_PASSWORD.encode(), _BCRYPT_SALT).decode()
+        admins = max(1, self.spec.users // 1000)
+        for i in range(self.spec.users):
+            user_id = _uuid(rng)
+            self.user_ids.append(user_id)
+            banned = i >= admins and rng.random() < 0.005
+            warnings = rng.choice((1, 1, 1, 2, 3)) if banned or rng.random() < 0.02 else 0
+            created = self.end - timedelta(seconds=rng.randrange(5 * 365 * 86400), microseconds=rng.randrange(10 ** 6))
+            yield {
+                "id": user_id,
+                "username": f"admin{i:05d}" if i < admins else f"user{i:07d}",
+                "hashed_password": hashed,
+                "role": "admin" if i < admins else "user",
+                "created_at": created.isoformat(),
+                "active": not banned,
+                "warnings": warnings,
+                "token_epoch": 1 if banned else 0,
+            }
+
+    # movies.json
+    def movies(self) -> Iterator[Dict[str, Any]]:
+        rng = self._rng("movies")
+        for i in range(self.spec.movies):
+            from_tmdb = rng.random() < 0.1
+            movie_id = f"tmdb_{100000 + i}" if from_tmdb else _uuid(rng)
+            self.movie_ids.append(movie_id)
+            release = date(1950, 1, 1) + timedelta(days=rng.randrange((self.spec.end_date - date(1950, 1, 1)).days))
+            self.movie_release.append(release.toordinal())
+            title = " ".join(rng.sample(_TITLE_WORDS, rng.randint(1, 3)))
+            yield {
+                "id": movie_id,
+                "title": title if rng.random() < 0.8 else f"{title} {rng.randint(2, 5)}",
+                "description": self.prose.text(rng, _lognormal_length(rng, 160, 40, 400)),
+                "duration": max(60, min(240, int(rng.gauss(110, 20)))),
+                "genre": ", ".join(rng.sample(_GENRES, rng.randint(1, 3))),
+                "release": release.isoformat(),
+                "rating": None,
+                "posterUrl": f"https://image.tmdb.org/t/p/w500/poster{100000 + i}.jpg" if from_tmdb else None,
+            }
+
+    def _plan_reviews(self) -> None:
+        """Pick author, rating and date per review before battles and flags need them."""
+        rng = self._rng("review-plan")
+        end_day = self.spec.end_date.toordinal()
+        for _ in range(self.spec.reviews):
+            self.review_author.append(_skewed(rng, self.spec.users, 2.0))
+            self.review_rating.append(rng.choices(range(1, 6), weights=RATING_WEIGHTS)[0])
+            self.review_day.append(end_day - rng.randrange(3650))
+        self.review_votes = array("I", bytes(4 * self.spec.reviews))
+
+    # battles.json, generated twice from the same seed: once to count wins, once to write.
+    def _battle_plan(self) -> Iterator[Tuple[int, int, int, Optional[int], int, int, int]]:
+        rng = self._rng("battles")
+        n = self.spec.reviews
+        if n < 2:
+            return
+        for _ in range(self.spec.battles):
+            first = _skewed(rng, n, 1.5)
+            second = rng.randrange(n - 1)
+            second += second >= first
+            voter = rng.randrange(self.spec.users)
+            if voter in (self.review_author[first], self.review_author[second]):
+                voter = (voter + 1) % self.spec.users
+            # Higher-rated reviews win more often.
+            p_first = min(0.9, max(0.1, 0.5 + 0.1 * (self.review_rating[first] - self.review_rating[second])))
+            winner = None if rng.random() < 0.02 else (first if rng.random() < p_first else second)
+            started = rng.randrange(365 * 86400)  # seconds before the end date
+            yield first, second, voter, winner, started, rng.randint(1, 30), rng.getrandbits(128)
+
+    def _count_wins(self) -> None:
+        for _, _, _, winner, _, _, _ in self._battle_plan():
+            if winner is not None:
+                self.review_votes[winner] += 1
+
+    def battles(self) -> Iterator[Dict[str, Any]]:
+        for first, second, voter, winner, started, seconds, id_bits in self._battle_plan():
+            started_at = self.end - timedelta(seconds=started)
+            yield {
+                "id": str(uuid.UUID(int=id_bits, version=4)),
+                "review1Id": first + 1,
+                "review2Id": second + 1,
+                "winnerId": None if winner is None else winner + 1,
+                "userId": self.user_ids[voter],
+                "startedAt": started_at.isoformat(),
+                "endedAt": None if winner is None else (started_at + timedelta(seconds=seconds)).isoformat(),
+            }
+
+    # flags.json
+    def _plan_flags(self) -> None:
+        rng = self._rng("flags")
+        seen = set()
+        attempts = 0
+        while len(self.flags) < self.spec.flags and attempts < self.spec.flags * 10 and self.spec.reviews:
+            attempts += 1
+            review = _skewed(rng, self.spec.reviews, 3.0)
+            user = rng.randrange(self.spec.users)
+            if (user, review) in seen:
+                continue
+            seen.add((user, review))
+            when = datetime.fromordinal(self.review_day[review]) + timedelta(seconds=rng.randrange(30 * 86400))
+            self.flags.append((self.user_ids[user], review + 1, when))
+            self.flagged[review] = self.flagged.get(review, 0) + 1
+
+    def flag_rows(self) -> Iterator[Dict[str, Any]]:
+        for user_id, review_id, when in self.flags:
+            yield {"user_id": user_id, "review_id": review_id, "timestamp": when.isoformat()}
+
+    # reviews.json, with titles and bodies written to `text` (reviews.text)
+    def reviews(self, text: BinaryIO) -> Iterator[Dict[str, Any]]:
+        rng = self._rng("reviews")
+        for i in range(self.spec.reviews):
+            movie = _skewed(rng, self.spec.movies, 3.0)
+            day = max(self.review_day[i], self.movie_release[movie])
+            flag_count = self.flagged.get(i, 0)
+            title = self.prose.text(rng, _lognormal_length(rng, 45, 10, 120)).rstrip(".").encode("utf-8")
+            body = self.prose.text(rng, _lognormal_length(rng, REVIEW_BODY_MEDIAN, 40, 6000)).encode("utf-8")
+            offset = text.tell()
+            text.write(title + body)
+            yield {
+                "id": i + 1,
+                "movieId": self.movie_ids[movie],
+                "authorId": self.user_ids[self.review_author[i]],
+                "rating": float(self.review_rating[i]),
+                "flagged": flag_count > 0,
+                "votes": self.review_votes[i],
+                "date": date.fromordinal(day).isoformat(),
+                # Heavily flagged reviews have usually been hidden by a moderator.
+                "visible": not (flag_count >= 3 and rng.random() < 0.5),
+                "textOffset": offset,
+                "titleLength": len(title),
+                "bodyLength": len(body),
+            }
+
+    # comments.json
+    def comments(self) -> Iterator[Dict[str, Any]]:
+        rng = self._rng("comments")
+        if not self.spec.reviews:
+            return
+        for i in range(self.spec.comments):
+            review = _skewed(rng, self.spec.reviews, 2.5)
+            when = datetime.fromordinal(self.review_day[review]) + timedelta(seconds=rng.randrange(60 * 86400))
+            yield {
+                "id": i + 1,
+                "reviewId": review + 1,
+                "authorId": self.user_ids[rng.randrange(self.spec.users)],
+                "commentBody": self.prose.text(rng, _lognormal_length(rng, COMMENT_BODY_MEDIAN, 5, 500)),
+                "date": when.isoformat(),
+            }
+
+    # watchlist.json
+    def watchlists(self) -> Iterator[Dict[str, Any]]:
+        rng = self._rng("watchlists")
+        owners = rng.sample(range(self.spec.users), min(self.spec.watchlists, self.spec.users))
+        for i, owner in enumerate(owners):
+            size = min(self.spec.movies, _lognormal_length(rng, 6, 1, 100))
+            movies = list(dict.fromkeys(self.movie_ids[_skewed(rng, self.spec.movies, 2.0)] for _ in range(size)))
+            yield {"id": i + 1, "authorId": self.user_ids[owner], "movieIds": movies}
+
+
+def generate(spec: DatasetSpec, out_dir: Path, progress=None) -> Dict[str, int]:
+    """Write every data file for `spec` into `out_dir` and return row counts."""
+    out_dir = Path(out_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    gen = _Generator(spec)
+    report = progress or (lambda name, count, seconds: None)
+    counts: Dict[str, int] = {}
+
+    def write(name: str, rows: Iterable[Dict[str, Any]], encoding: str = "utf-8") -> None:
+        started = time.perf_counter()
+        counts[name] = write_json_array(out_dir / f"{name}.json", rows, encoding)
+        report(name, counts[name], time.perf_counter() - started)
+
+    write("users", gen.users())
+    write("movies", gen.movies())
+    gen._plan_reviews()
+    gen._count_wins()
+    gen._plan_flags()
+    with (out_dir / "reviews.text").open("wb") as text:
+        write("reviews", gen.reviews(text), encoding="utf-8-sig")
+    write("battles", gen.battles())
+    write("flags", gen.flag_rows())
+    write("comments", gen.comments())
+    write("watchlist", gen.watchlists())
+    return counts
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--out", type=Path, required=True, help="directory to write the JSON files into")
+    parser.add_argument("--scale", choices=sorted(SCALES), default="small")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--force", action="store_true", help="overwrite existing data files in --out")
+    for f in fields(DatasetSpec):
+        if f.type in (int, "int") and f.name != "seed":
+            parser.add_argument(f"--{f.name}", type=int, default=None, help=f"override the scale's {f.name} count")
+    args = parser.parse_args(argv)
+
+    counts = {f.name: getattr(args, f.name, None) for f in fields(DatasetSpec) if f.name not in ("seed", "end_date")}
+    spec = replace(SCALES[args.scale], seed=args.seed, **{k: v for k, v in counts.items() if v is not None})
+    if spec.users < 1 or (spec.reviews and spec.movies < 1):
+        print("Need at least one user, and one movie when generating reviews", file=sys.stderr)
+        return 1
+    if args.out.exists() and any(args.out.glob("*.json")) and not args.force:
+        print(f"{args.out} already contains data files; pass --force to overwrite", file=sys.stderr)
+        return 1
+
+    def report(name: str, count: int, seconds: float) -> None:
+        print(f"{name + '.json':<16} {count:>10,} rows  {seconds:7.1f}s", flush=True)
+
+    generate(spec, args.out, progress=report)
+    print(f"Done. Log in as any user with password '{SYNTHETIC_PASSWORD}'.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
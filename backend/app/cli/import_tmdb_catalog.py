@@ -0,0 +1,33 @@
+"""Import a TMDb daily export into the local search catalog.
+
+Usage (from backend/):
+    python -m app.cli.import_tmdb_catalog movie_ids_10_19_2026.json.gz
+"""
+import argparse
+import sys
+from pathlib import Path
+
+from app.repositories import tmdb_catalog_repo
+from app.services.tmdb_catalog_service import TMDB_CATALOG_BATCH_SIZE, import_export
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("export", type=Path, help="newline-delimited JSON export (.json or .json.gz)")
+    parser.add_argument("--batch-size", type=int, default=TMDB_CATALOG_BATCH_SIZE, help="rows per insert batch")
+    parser.add_argument("--include-adult", action="store_true", help="keep titles flagged adult")
+    args = parser.parse_args(argv)
+
+    if not args.export.exists():
+        print(f"Export file not found: {args.export}", file=sys.stderr)
+        return 1
+    result = import_export(args.export, batch_size=args.batch_size, include_adult=args.include_adult)
+    print(
+        f"Imported {result.imported} movies into {tmdb_catalog_repo.CATALOG_PATH} "
+        f"(skipped {result.skipped}, malformed {result.malformed})"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,35 @@
+"""Move review titles and bodies out of reviews.json into reviews.text.
+
+Rows written before reviews.text existed carry their text inline. The API
+reads them as they are and moves them on its next save of reviews.json;
+this does it up front. With --compact, reviews.text is also rewritten to
+drop text that edits and deletes left behind; stop the API first.
+
+Usage (from backend/):
+    python -m app.cli.migrate_review_text
+    python -m app.cli.migrate_review_text --compact
+"""
+import argparse
+import sys
+
+from app.repositories import review_repo
+from app.repositories.review_store import text_span
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--compact", action="store_true", help="also drop stale text from reviews.text")
+    args = parser.parse_args(argv)
+
+    reviews = review_repo.load_all(load_invisible=True)
+    inline = sum(1 for review in reviews if text_span(review) is None)
+    if inline:
+        review_repo.save_all(reviews)
+    print(f"Moved the text of {inline} of {len(reviews)} reviews to {review_repo.text_path()}")
+    if args.compact:
+        print(f"Compacted {review_repo.text_path()}, dropping {review_repo.compact_text():,} bytes of stale text")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,5 +1,6 @@
 from dotenv import load_dotenv
 load_dotenv()
+from contextlib import asynccontextmanager
 from fastapi.middleware.cors import CORSMiddleware
 
 from fastapi import FastAPI
@@ -14,6 +15,27 @@ from app.routers.achievements import router as achievements_router
 from app.routers.login import router as login_router
 from app.routers.tmdb import router as tmdb_router
 from app.routers.watchlist_endpoints import router as watchlist_router
+from app.routers.metrics import router as metrics_router
+from app.routers.profiles import router as profiles_router
+from app.routers.memory import router as memory_router
+from app.middleware.metrics_middleware import MetricsMiddleware
+from app.middleware.repo_io_middleware import RepoIOMiddleware
+from app.middleware.profiling_middleware import ProfilingMiddleware
+from app.services import tmdb_service
+from app.services.tmdb_enrichment import worker as enrichment_worker
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Open shared outbound clients and background workers on startup; stop them on shutdown."""
+    await tmdb_service.start_client()
+    await enrichment_worker.start()
+    try:
+        yield
+    finally:
+        await enrichment_worker.stop()
+        await tmdb_service.close_client()
+
 
 app = FastAPI(
     title="Review Battle API",
@@ -21,6 +43,7 @@ app = FastAPI(
     version="1.0.0",
     docs_url="/docs",
     redoc_url="/redoc",
+    lifespan=lifespan,
 )
 
 origins = [
@@ -63,6 +86,10 @@ app.add_middleware(
     allow_methods=["*"],
     allow_headers=["*"]
 )
+app.add_middleware(ProfilingMiddleware)
+app.add_middleware(RepoIOMiddleware)
+# Added last so it is outermost and also times CORS handling.
+app.add_middleware(MetricsMiddleware)
 
 app.include_router(movies_router)
 app.include_router(users_router)
@@ -75,3 +102,6 @@ app.include_router(leaderboard_router)
 app.include_router(tmdb_router)
 app.include_router(watchlist_router)
 app.include_router(achievements_router)
+app.include_router(metrics_router)
+app.include_router(profiles_router)
+app.include_router(memory_router)
@@ -3,6 +3,7 @@ import jwt
 
 from app.services.validate_access import validate_user_access
 from app.services.review_service import get_review_by_id
+from app.repositories.user_repo import get_user_status
 
 
 async def jwt_auth_dependency(request: Request):
@@ -11,13 +12,29 @@ async def jwt_auth_dependency(request: Request):
         raise HTTPException(status_code=401, detail="Access Token Missing")
 
     access_token = auth_header.split(" ")[1]
+    return authenticate_token(access_token)
 
+def authenticate_token(access_token: str) -> dict:
+    """Decode an access token and apply the user's current status; raises HTTPException if rejected."""
     try:
         payload = validate_user_access(access_token)
-        return payload
     except (jwt.ExpiredSignatureError, jwt.InvalidTokenError) as ex:
         raise HTTPException(status_code=401, detail=str(ex)) from ex
 
+    return _enforce_user_status(payload)
+
+def _enforce_user_status(payload: dict) -> dict:
+    """Apply bans, token revocation and role changes made after the token was issued."""
+    status = get_user_status(payload.get("user_id"))
+    if status is None:
+        raise HTTPException(status_code=401, detail="User no longer exists")
+    if not status.active:
+        raise HTTPException(status_code=403, detail="Account banned")
+    if payload.get("epoch", 0) < status.token_epoch:
+        raise HTTPException(status_code=401, detail="Token has been revoked")
+    payload["role"] = status.role
+    return payload
+
 async def user_is_author(review_id: int, current_user: dict = Depends(jwt_auth_dependency)):
     """Verify that the current user is the author of the review."""
     review = get_review_by_id(review_id)
@@ -0,0 +1,62 @@
+"""Per-route request metrics for the shared registry."""
+import time
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.utils.metrics import REGISTRY, Registry
+
+UNMATCHED_ROUTE = "unmatched"  # 404s share one label so scanned URLs cannot blow up the series count
+
+
+def route_template(scope: Scope) -> str:
+    """The path template of the route that handled the request, e.g. `/reviews/{review_id}`.
+
+    Read from `scope["route"]`, which routing fills in, so it is only known
+    once the app has run.
+    """
+    return getattr(scope.get("route"), "path", None) or UNMATCHED_ROUTE
+
+
+class MetricsMiddleware:
+    """Records request counts by status and latency histograms per route, and in-flight requests.
+
+    The in-flight gauge is per method: it has to be raised before routing
+    has picked the route. Pure ASGI rather than BaseHTTPMiddleware, so it
+    does not add a task and a stream copy to every request.
+    """
+
+    def __init__(self, app: ASGIApp, registry: Registry = REGISTRY):
+        self.app = app
+        self.requests = registry.counter(
+            "http_requests_total", "HTTP requests by route and status code.", ("method", "route", "status")
+        )
+        self.in_flight = registry.gauge(
+            "http_requests_in_flight", "HTTP requests currently being served.", ("method",)
+        )
+        self.latency = registry.histogram(
+            "http_request_duration_seconds", "Time to serve HTTP requests, in seconds.", ("method", "route")
+        )
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        status = 500  # if the app raises before starting a response
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        self.in_flight.inc(method=method)
+        start = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            route = route_template(scope)
+            self.latency.observe(time.perf_counter() - start, method=method, route=route)
+            self.requests.inc(method=method, route=route, status=status)
+            self.in_flight.dec(method=method)
@@ -0,0 +1,125 @@
+"""Profile single requests on demand for admins.
+
+Send `X-Profile: 1` (or add `?_profile=1`) with an admin bearer token and the
+request runs under the sampling profiler in app.utils.profiling. The
+collapsed stacks are stored through profile_repo and the response carries
+`X-Profile-Id`; `/admin/profiles` lists and downloads them. Anyone else's
+flag is ignored and the request is served normally.
+"""
+import asyncio
+import secrets
+import threading
+from datetime import datetime, timezone
+from urllib.parse import parse_qs
+
+from fastapi import HTTPException
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+import app.repositories.profile_repo as profile_repo
+from app.middleware.auth_middleware import authenticate_token
+from app.middleware.metrics_middleware import route_template
+from app.utils import profiling
+from app.utils.logger import get_logger
+
+PROFILE_HEADER = "X-Profile"
+PROFILE_QUERY_FLAG = "_profile"
+PROFILE_ID_HEADER = "X-Profile-Id"
+PROFILE_STATUS_HEADER = "X-Profile-Status"
+
+logger = get_logger()
+
+
+def _requested(scope: Scope, headers: Headers) -> bool:
+    if headers.get(PROFILE_HEADER, "").lower() in ("1", "true", "yes"):
+        return True
+    flags = parse_qs(scope.get("query_string", b"").decode("latin-1")).get(PROFILE_QUERY_FLAG, [])
+    return any(flag.lower() in ("1", "true", "yes") for flag in flags)
+
+
+def _admin(headers: Headers) -> bool:
+    auth = headers.get("Authorization", "")
+    if not auth.startswith("Bearer "):
+        return False
+    try:
+        payload = authenticate_token(auth.split(" ", 1)[1])
+    except HTTPException:
+        return False
+    return payload.get("role") == "admin"
+
+
+def _new_profile_id() -> str:
+    return f"{datetime.now(timezone.utc):%Y%m%dT%H%M%S}-{secrets.token_hex(4)}"
+
+
+class ProfilingMiddleware:
+    """Runs flagged admin requests under the profiler, one at a time."""
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+        self._busy = threading.Lock()
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        headers = Headers(scope=scope)
+        if not _requested(scope, headers):
+            await self.app(scope, receive, send)
+            return
+        if not _admin(headers):
+            await self.app(scope, receive, send)
+            return
+        if not self._busy.acquire(blocking=False):
+            await self.app(scope, receive, self._with_headers(send, {PROFILE_STATUS_HEADER: "busy"}))
+            return
+        try:
+            await self._profile(scope, receive, send)
+        finally:
+            self._busy.release()
+
+    @staticmethod
+    def _with_headers(send: Send, extra: dict) -> Send:
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                response_headers = MutableHeaders(scope=message)
+                for name, value in extra.items():
+                    response_headers.append(name, value)
+            await send(message)
+        return send_wrapper
+
+    async def _profile(self, scope: Scope, receive: Receive, send: Send) -> None:
+        profile_id = _new_profile_id()
+        session = profiling.ProfileSession()
+        status = 500
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        token = profiling.activate(session)
+        session.start()
+        try:
+            await self.app(scope, receive, self._with_headers(send_wrapper, {
+                PROFILE_ID_HEADER: profile_id, PROFILE_STATUS_HEADER: "captured",
+            }))
+        finally:
+            session.stop()
+            profiling.deactivate(token)
+            summary = {
+                "method": scope["method"],
+                "path": scope["path"],
+                "route": route_template(scope),
+                "status": status,
+                "duration_ms": round(session.duration * 1000, 2),
+                "samples": session.sample_count,
+                "interval_ms": session.interval * 1000,
+                "top_frames": profiling.top_frames(session),
+                "captured_at": datetime.now(timezone.utc).isoformat(),
+            }
+            try:
+                await asyncio.to_thread(profile_repo.save, profile_id, session.collapsed(), summary)
+            except OSError as e:
+                logger.error(f"Could not store request profile: {e}", component="profiling", profile_id=profile_id)
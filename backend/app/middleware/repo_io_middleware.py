@@ -0,0 +1,33 @@
+"""Attribute repository I/O to requests, and optionally report it in a response header."""
+import os
+
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.middleware.metrics_middleware import route_template
+from app.utils.repo_io import track_request
+
+HEADER_NAME = "X-Repo-IO"
+
+# Debug aid: when on, every response carries its load_all/save_all totals in X-Repo-IO.
+REPO_IO_DEBUG_HEADER = os.getenv("REPO_IO_DEBUG_HEADER", "false").lower() in ("1", "true", "yes")
+
+
+class RepoIOMiddleware:
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        with track_request(lambda: route_template(scope)) as request_io:
+            async def send_wrapper(message: Message) -> None:
+                if message["type"] == "http.response.start" and REPO_IO_DEBUG_HEADER:
+                    value = request_io.header_value()
+                    if value:
+                        MutableHeaders(scope=message).append(HEADER_NAME, value)
+                await send(message)
+
+            await self.app(scope, receive, send_wrapper)
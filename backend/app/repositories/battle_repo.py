@@ -3,9 +3,12 @@ from pathlib import Path
 import json, os
 from typing import List, Dict, Any
 
+from app.utils.repo_io import instrumented
+
 DATA_PATH = Path(__file__).resolve().parents[1] / "data" / "battles.json"
 
 
+@instrumented("battles", "load", lambda: DATA_PATH)
 def load_all() -> List[Dict[str, Any]]:
     """Load all battles from battles.json"""
     if not DATA_PATH.exists():
@@ -16,6 +19,7 @@ def load_all() -> List[Dict[str, Any]]:
     except json.JSONDecodeError:
         return []
 
+@instrumented("battles", "save", lambda: DATA_PATH)
 def save_all(battles: List[Dict[str, Any]]) -> None:
     """Save all battles to battles.json safely using a temp file"""
     tmp = DATA_PATH.with_suffix(".tmp")
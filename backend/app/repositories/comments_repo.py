@@ -1,17 +1,63 @@
 from pathlib import Path
 import json, os
-from typing import List, Dict, Any
+from collections import defaultdict
+from typing import List, Dict, Any, NamedTuple
+
+from app.utils.file_index import FileIndex
+from app.utils.repo_io import instrumented
 
 DATA_PATH = Path(__file__).resolve().parents[1] / "data" / "comments.json"
 
+@instrumented("comments", "load", lambda: DATA_PATH)
 def load_all() -> List[Dict[str, Any]]:
     if not DATA_PATH.exists():
         return []
     with DATA_PATH.open("r", encoding="utf-8-sig") as f:
         return json.load(f)
-    
+
+@instrumented("comments", "save", lambda: DATA_PATH)
 def save_all(comments: List[Dict[str, Any]]) -> None:
     tmp = DATA_PATH.with_suffix(".tmp")
     with tmp.open("w", encoding="utf-8") as f:
         json.dump(comments, f, ensure_ascii=False, indent=2)
     os.replace(tmp, DATA_PATH)
+    _review_index.prime(comments)
+
+
+class _CommentIndex(NamedTuple):
+    by_review: Dict[int, List[Dict[str, Any]]]
+    counts: Dict[int, int]
+
+
+def _build_review_index(comments: List[Dict[str, Any]]) -> _CommentIndex:
+    """Group comments by reviewId, each group ordered by comment id."""
+    by_review: Dict[int, List[Dict[str, Any]]] = defaultdict(list)
+    for comment in comments:
+        by_review[comment.get("reviewId")].append(comment)
+    for group in by_review.values():
+        group.sort(key=lambda com: com.get("id", 0))
+    counts = {review_id: len(group) for review_id, group in by_review.items()}
+    return _CommentIndex(dict(by_review), counts)
+
+
+_review_index = FileIndex(lambda: DATA_PATH, lambda: load_all(), _build_review_index)
+
+
+def get_by_review_id(review_id: int) -> List[Dict[str, Any]]:
+    """Comments on a review in id order. Callers must not mutate the returned dicts."""
+    return _review_index.get().by_review.get(review_id, [])
+
+
+def count_by_review_id() -> Dict[int, int]:
+    """Comment totals per reviewId. Callers must not mutate the returned dict."""
+    return _review_index.get().counts
+
+
+def delete_by_review_id(review_id: int) -> int:
+    """Remove every comment on a review and return how many were removed."""
+    if not count_by_review_id().get(review_id):
+        return 0
+    comments = load_all()
+    remaining = [com for com in comments if com.get("reviewId") != review_id]
+    save_all(remaining)
+    return len(comments) - len(remaining)
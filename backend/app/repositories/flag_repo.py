@@ -1,19 +1,106 @@
-import json
-import os
-from typing import List, Dict, Any
+from pathlib import Path
+import json, os, tempfile, threading
+from collections import Counter
+from bisect import bisect_right
+from typing import List, Dict, Any, Iterator, NamedTuple, Optional, Set, Tuple
 
-DATA_FILE = "app/data/flags.json"
+from app.utils.file_index import FileIndex
+from app.utils.repo_io import instrumented
 
+DATA_PATH = Path(__file__).resolve().parents[1] / "data" / "flags.json"
+
+
+QueueKey = Tuple[int, str, int]
+
+# Held across each load-modify-save of flags.json so concurrent flag
+# requests in this process cannot overwrite each other's updates.
+_lock = threading.RLock()
+
+
+class _FlagIndex(NamedTuple):
+    flags: List[Dict[str, Any]]
+    pairs: Set[Tuple[str, int]]
+    counts: Dict[int, int]
+    first_flagged: Dict[int, str]
+    queue: List[QueueKey]
+
+
+@instrumented("flags", "load", lambda: DATA_PATH)
 def load_all() -> List[Dict[str, Any]]:
-    if not os.path.exists(DATA_FILE):
+    if not DATA_PATH.exists():
         return []
     try:
-        with open(DATA_FILE, "r") as f:
+        with DATA_PATH.open("r", encoding="utf-8") as f:
             return json.load(f)
-    except (json.JSONDecodeError, FileNotFoundError):
+    except json.JSONDecodeError:
         return []
 
+@instrumented("flags", "save", lambda: DATA_PATH)
 def save_all(flags: List[Dict[str, Any]]) -> None:
-    os.makedirs(os.path.dirname(DATA_FILE), exist_ok=True)
-    with open(DATA_FILE, "w") as f:
-        json.dump(flags, f, indent=2)
+    DATA_PATH.parent.mkdir(parents=True, exist_ok=True)
+    with _lock:
+        # A temp file per write: a shared flags.tmp could be replaced by another writer mid-dump.
+        with tempfile.NamedTemporaryFile("w", encoding="utf-8", dir=DATA_PATH.parent,
+                                         prefix="flags-", suffix=".tmp", delete=False) as f:
+            json.dump(flags, f, indent=2)
+        try:
+            os.replace(f.name, DATA_PATH)
+        except OSError:
+            os.unlink(f.name)
+            raise
+        _index.prime(flags)
+
+
+def _build_index(flags: List[Dict[str, Any]]) -> _FlagIndex:
+    pairs = {(f.get("user_id"), f.get("review_id")) for f in flags}
+    counts = Counter(f.get("review_id") for f in flags)
+    first_flagged: Dict[int, str] = {}
+    for f in flags:
+        review_id, timestamp = f.get("review_id"), f.get("timestamp") or ""
+        if review_id not in first_flagged or timestamp < first_flagged[review_id]:
+            first_flagged[review_id] = timestamp
+    # Most-flagged first, then the longest-waiting report, then review id.
+    queue = sorted((-count, first_flagged[review_id], review_id) for review_id, count in counts.items())
+    return _FlagIndex(list(flags), pairs, dict(counts), first_flagged, queue)
+
+
+_index = FileIndex(lambda: DATA_PATH, lambda: load_all(), _build_index)
+
+
+def add_flag(record: Dict[str, Any]) -> Optional[int]:
+    """Save `record` and return the review's new flag count, or None if that user already flagged it."""
+    with _lock:
+        index = _index.get()
+        review_id = record.get("review_id")
+        if (record.get("user_id"), review_id) in index.pairs:
+            return None
+        save_all(index.flags + [record])
+        return index.counts.get(review_id, 0) + 1
+
+def remove_flags_for_review(review_id: int) -> None:
+    with _lock:
+        save_all([f for f in _index.get().flags if f.get("review_id") != review_id])
+
+def all_flags() -> List[Dict[str, Any]]:
+    """Copy of every flag record, served from the index instead of re-reading the file."""
+    return list(_index.get().flags)
+
+def has_flagged(user_id: str, review_id: int) -> bool:
+    return (user_id, review_id) in _index.get().pairs
+
+def count_for_review(review_id: int) -> int:
+    return _index.get().counts.get(review_id, 0)
+
+def first_flagged_at(review_id: int) -> Optional[str]:
+    return _index.get().first_flagged.get(review_id)
+
+def queue_size() -> int:
+    """Number of distinct reviews with at least one flag."""
+    return len(_index.get().queue)
+
+def iter_queue(after: Optional[QueueKey] = None) -> Iterator[QueueKey]:
+    """Yield (-flag_count, first_flagged_at, review_id) keys in moderation order, after `after`."""
+    queue = _index.get().queue
+    start = 0 if after is None else bisect_right(queue, after)
+    for position in range(start, len(queue)):
+        yield queue[position]
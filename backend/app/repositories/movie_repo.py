@@ -1,17 +1,27 @@
 from pathlib import Path
-import json, os
+import json, os, threading
 from typing import List, Dict, Any
 
+from app.utils.repo_io import instrumented
+
 DATA_PATH = Path(__file__).resolve().parents[1] / "data" / "movies.json"
 
+# Hold across a load_all ... save_all cycle. Sync endpoints run in the
+# threadpool and TMDb enrichment in a worker thread, so without it one
+# writer can save over a movie another has just appended.
+write_lock = threading.RLock()
+
+@instrumented("movies", "load", lambda: DATA_PATH)
 def load_all() -> List[Dict[str, Any]]:
     if not DATA_PATH.exists():
         return []
     with DATA_PATH.open("r", encoding="utf-8-sig") as f:
         return json.load(f)
     
+@instrumented("movies", "save", lambda: DATA_PATH)
 def save_all(movies: List[Dict[str, Any]]) -> None:
-    tmp = DATA_PATH.with_suffix(".tmp")
-    with tmp.open("w", encoding="utf-8") as f:
-        json.dump(movies, f, ensure_ascii=False, indent=2)
-    os.replace(tmp, DATA_PATH)
+    with write_lock:
+        tmp = DATA_PATH.with_suffix(".tmp")
+        with tmp.open("w", encoding="utf-8") as f:
+            json.dump(movies, f, ensure_ascii=False, indent=2)
+        os.replace(tmp, DATA_PATH)
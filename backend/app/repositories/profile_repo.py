@@ -0,0 +1,79 @@
+"""Captured request profiles: a collapsed-stack file plus a JSON summary each.
+
+The directory is bounded by file count and total size; saving a profile
+deletes the oldest ones beyond either limit.
+"""
+import json
+import os
+import re
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+PROFILES_DIR = Path(os.getenv("PROFILES_DIR", str(Path(__file__).resolve().parents[1] / "data" / "profiles")))
+PROFILES_MAX_COUNT = int(os.getenv("PROFILES_MAX_COUNT", "50"))
+PROFILES_MAX_BYTES = int(os.getenv("PROFILES_MAX_BYTES", str(20 * 1024 * 1024)))
+
+PROFILE_ID = re.compile(r"^[0-9]{8}T[0-9]{6}-[0-9a-f]{8}$")
+
+
+def _paths(profile_id: str) -> Optional[tuple]:
+    if not PROFILE_ID.match(profile_id):
+        return None
+    return PROFILES_DIR / f"{profile_id}.collapsed", PROFILES_DIR / f"{profile_id}.json"
+
+
+def save(profile_id: str, collapsed: str, summary: Dict[str, Any]) -> None:
+    paths = _paths(profile_id)
+    if paths is None:
+        raise ValueError(f"Invalid profile id: {profile_id}")
+    stacks_path, summary_path = paths
+    PROFILES_DIR.mkdir(parents=True, exist_ok=True)
+    stacks_path.write_text(collapsed, encoding="utf-8")
+    summary_path.write_text(json.dumps({"id": profile_id, **summary}, indent=2), encoding="utf-8")
+    prune()
+
+
+def list_all() -> List[Dict[str, Any]]:
+    """Summaries of the stored profiles, newest first."""
+    if not PROFILES_DIR.exists():
+        return []
+    summaries = []
+    for path in sorted(PROFILES_DIR.glob("*.json"), reverse=True):
+        try:
+            summaries.append(json.loads(path.read_text(encoding="utf-8")))
+        except (OSError, json.JSONDecodeError):
+            continue
+    return summaries
+
+
+def stacks_path(profile_id: str) -> Optional[Path]:
+    """Path of a profile's collapsed stacks, or None if there is no such profile."""
+    paths = _paths(profile_id)
+    if paths is None or not paths[0].exists():
+        return None
+    return paths[0]
+
+
+def delete(profile_id: str) -> bool:
+    paths = _paths(profile_id)
+    if paths is None or not paths[0].exists():
+        return False
+    for path in paths:
+        path.unlink(missing_ok=True)
+    return True
+
+
+def prune() -> None:
+    """Delete the oldest profiles until both the count and size limits hold."""
+    if not PROFILES_DIR.exists():
+        return
+    ids = sorted({path.stem for path in PROFILES_DIR.iterdir() if PROFILE_ID.match(path.stem)})
+    sizes = {
+        profile_id: sum(p.stat().st_size for p in _paths(profile_id) if p.exists())
+        for profile_id in ids
+    }
+    total = sum(sizes.values())
+    while ids and (len(ids) > PROFILES_MAX_COUNT or total > PROFILES_MAX_BYTES):
+        oldest = ids.pop(0)
+        total -= sizes[oldest]
+        delete(oldest)
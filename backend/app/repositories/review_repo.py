@@ -1,18 +1,35 @@
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, List, Optional
 import json, os
 
 from app.repositories import movie_repo
+from app.repositories.review_store import BODY_LENGTH, TEXT_OFFSET, TITLE_LENGTH, ReviewStore, text_span
+from app.utils.file_index import FileIndex
+from app.utils.repo_io import instrumented
+from app.utils.text_blob import BlobView, append_texts
 
 DATA_PATH = Path(__file__).resolve().parents[1] / "data" / "reviews.json"
 
+TEXT_FIELDS = ("reviewTitle", "reviewBody")
 
+
+def text_path() -> Path:
+    """The append-only file holding review titles and bodies, beside reviews.json."""
+    return DATA_PATH.with_suffix(".text")
+
+
+@instrumented("reviews", "load", lambda: DATA_PATH)
 def load_all(load_invisible: bool = False) -> List[Dict[str, Any]]:
     """Loads reviews from reviews.json.
 
     If the output is user-facing, invisible reviews should not be loaded.
     Hidden reviews should be loaded in cases of subsequent save_all calls
     to prevent overwriting of data.
+
+    Rows hold where their title and body sit in the text file
+    (textOffset, titleLength, bodyLength) rather than the text itself;
+    pass the rows a caller returns through `with_text`. Rows not saved
+    since the text file was introduced still carry their text inline.
     """
     if not DATA_PATH.exists():
         return []
@@ -95,8 +112,116 @@ def get_all_reviews(
     return result
 
 
-def save_all(reviews: List[Dict[str, Any]]) -> None:
+def with_text(reviews: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Copies of `reviews` with reviewTitle and reviewBody read from the text file.
+
+    Only the given rows are decoded, so pass just the ones being returned.
+    Rows that still carry their text inline are copied unchanged.
+    """
+    view: Optional[BlobView] = None
+    result: List[Dict[str, Any]] = []
+    for review in reviews:
+        review = dict(review)
+        span = text_span(review)
+        if span is not None:
+            if view is None:
+                view = BlobView(text_path())
+            offset, title_length, body_length = span
+            for key in (TEXT_OFFSET, TITLE_LENGTH, BODY_LENGTH):
+                del review[key]
+            review["reviewTitle"] = view.read(offset, title_length)
+            review["reviewBody"] = view.read(offset + title_length, body_length)
+        result.append(review)
+    return result
+
+
+def _move_text_out(reviews: List[Dict[str, Any]], path: Path) -> List[Dict[str, Any]]:
+    """Append the inline titles and bodies to `path`; returns the rows with spans in their place."""
+    pending = [i for i, review in enumerate(reviews) if any(key in review for key in TEXT_FIELDS)]
+    result = list(reviews)
+    if not pending:
+        return result
+    texts = [str(reviews[i].get(key) or "") for i in pending for key in TEXT_FIELDS]
+    offset, lengths = append_texts(path, texts)
+    for n, i in enumerate(pending):
+        row = {key: value for key, value in reviews[i].items() if key not in TEXT_FIELDS}
+        title_length, body_length = lengths[2 * n], lengths[2 * n + 1]
+        row.update({TEXT_OFFSET: offset, TITLE_LENGTH: title_length, BODY_LENGTH: body_length})
+        offset += title_length + body_length
+        result[i] = row
+    return result
+
+
+def _write_rows(reviews: List[Dict[str, Any]]) -> None:
     tmp = DATA_PATH.with_suffix(".tmp")
     with tmp.open("w", encoding="utf-8-sig") as f:
         json.dump(reviews, f, ensure_ascii=False, indent=2)
     os.replace(tmp, DATA_PATH)
+
+
+@instrumented("reviews", "save", lambda: DATA_PATH)
+def save_all(reviews: List[Dict[str, Any]]) -> None:
+    """Write reviews.json; rows carrying reviewTitle/reviewBody have it moved to the text file.
+
+    That covers new and edited reviews as well as rows saved before the
+    text file existed, so the first save migrates a whole old file. The
+    text is appended before reviews.json is replaced, so the file never
+    points at text that is not there yet. Edits leave the old text behind
+    until `compact_text` runs.
+    """
+    reviews = _move_text_out(reviews, text_path())
+    _write_rows(reviews)
+    _store.prime(reviews)
+
+
+def compact_text() -> int:
+    """Rewrite the text file with only the text reviews.json points at; returns the bytes dropped.
+
+    The text file and reviews.json are replaced one after the other, so a
+    server reading reviews in between could pair the old rows with the new
+    text: run this while the API is stopped.
+    """
+    path = text_path()
+    before = path.stat().st_size if path.exists() else 0
+    tmp = path.with_suffix(".text.tmp")
+    tmp.unlink(missing_ok=True)
+    reviews = _move_text_out(with_text(load_all(load_invisible=True)), tmp)
+    tmp.touch()
+    os.replace(tmp, path)
+    _write_rows(reviews)
+    _store.invalidate()
+    return before - path.stat().st_size
+
+
+def _build_store(reviews: List[Dict[str, Any]]) -> ReviewStore:
+    return ReviewStore.from_rows(reviews, BlobView(text_path()))
+
+
+_store = FileIndex(lambda: DATA_PATH, lambda: load_all(load_invisible=True), _build_store)
+
+
+def load_store() -> ReviewStore:
+    """Every review, hidden ones included, as a columnar store kept in sync with reviews.json.
+
+    Callers must check `ReviewRow.visible` (or the VISIBLE flag) before
+    showing a review to users.
+    """
+    return _store.get()
+
+
+def get_by_id(review_id: int, include_invisible: bool = False) -> Optional[Dict[str, Any]]:
+    """One review, rebuilt from the review store's columns without re-reading the file.
+
+    The dict is not the row as stored in reviews.json: it has exactly the
+    fields of ReviewRow.to_dict(), with ratings as floats and keys outside
+    the review schema dropped. A rating or date the store could not parse
+    is left out.
+    """
+    store = _store.get()
+    pos = store.position(review_id)
+    if pos is None:
+        return None
+    row = store.row(pos)
+    if not include_invisible and not row.visible:
+        return None
+    return row.to_dict()
@@ -0,0 +1,308 @@
+"""Columnar in-memory copy of reviews.json.
+
+A list of review dicts costs several hundred bytes per review before the
+text is counted: a dict, boxed ints and floats, and a separate copy of every
+movieId/authorId string. `ReviewStore` keeps one typed `array` per numeric
+field instead and stores movieId/authorId as small integer codes into
+interned tables. Callers read reviews through `ReviewRow` views, or the
+columns directly for filters and sorts.
+
+Titles and bodies, most of each review's size, are not in reviews.json:
+review_repo keeps them in an append-only text file beside it, and each row
+only records where its text starts and how long the title and body are.
+The store maps that file and decodes a review's text only when a caller
+reads it, typically for the few rows a page returns. Rows still carrying
+their text inline (written before the text file existed, and not saved
+since) keep it in memory until they are migrated.
+
+Rows keep file order; `position` maps a review id back to its row.
+"""
+import sys
+from array import array
+from bisect import bisect_left
+from datetime import date
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+from app.utils.logger import get_logger
+from app.utils.text_blob import BlobView
+
+FLAGGED = 1
+VISIBLE = 2
+
+NO_RATING = float("nan")
+NO_DATE = 0
+
+# Where each row's text lives in the text file; written by review_repo.save_all.
+TEXT_OFFSET = "textOffset"
+TITLE_LENGTH = "titleLength"
+BODY_LENGTH = "bodyLength"
+
+logger = get_logger()
+
+
+def _review_id(value: Any) -> Optional[int]:
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _rating(value: Any) -> float:
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return NO_RATING
+
+
+def _date_ordinal(value: Any) -> int:
+    if isinstance(value, date):
+        return value.toordinal()
+    try:
+        return date.fromisoformat(str(value)[:10]).toordinal()
+    except ValueError:
+        return NO_DATE
+
+
+def _intern(value: Any) -> Any:
+    return sys.intern(value) if isinstance(value, str) else value
+
+
+def text_span(review: Dict[str, Any]) -> Optional[Tuple[int, int, int]]:
+    """(offset, title length, body length) of a row's text in the text file; None for inline text."""
+    try:
+        span = (int(review[TEXT_OFFSET]), int(review[TITLE_LENGTH]), int(review[BODY_LENGTH]))
+    except (KeyError, TypeError, ValueError):
+        return None
+    return span if min(span) >= 0 else None
+
+
+class _Table:
+    """Distinct values and their codes, in first-seen order."""
+
+    __slots__ = ("values", "codes")
+
+    def __init__(self):
+        self.values: List[Any] = []
+        self.codes: Dict[Any, int] = {}
+
+    def code(self, value: Any) -> int:
+        code = self.codes.get(value)
+        if code is None:
+            code = self.codes[value] = len(self.values)
+            self.values.append(_intern(value))
+        return code
+
+
+class ReviewRow:
+    """Read-only view of one review in a `ReviewStore`."""
+
+    __slots__ = ("_store", "position")
+
+    def __init__(self, store: "ReviewStore", position: int):
+        self._store = store
+        self.position = position
+
+    @property
+    def id(self) -> int:
+        return self._store.ids[self.position]
+
+    @property
+    def movieId(self) -> Any:
+        return self._store.movie_table.values[self._store.movies[self.position]]
+
+    @property
+    def authorId(self) -> Any:
+        return self._store.author_table.values[self._store.authors[self.position]]
+
+    @property
+    def rating(self) -> Optional[float]:
+        value = self._store.ratings[self.position]
+        return None if value != value else value  # NaN marks a missing rating
+
+    @property
+    def votes(self) -> int:
+        return self._store.votes[self.position]
+
+    @property
+    def date(self) -> Optional[date]:
+        ordinal = self._store.dates[self.position]
+        return date.fromordinal(ordinal) if ordinal != NO_DATE else None
+
+    @property
+    def flagged(self) -> bool:
+        return bool(self._store.flags[self.position] & FLAGGED)
+
+    @property
+    def visible(self) -> bool:
+        return bool(self._store.flags[self.position] & VISIBLE)
+
+    @property
+    def reviewTitle(self) -> str:
+        return self._store.title(self.position)
+
+    @property
+    def reviewBody(self) -> str:
+        return self._store.body(self.position)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """The review as reviews.json stores it, e.g. for `Review(**row.to_dict())`.
+
+        A rating or date the store could not parse is left out, so building a
+        model from it fails the same way the original row would.
+        """
+        data: Dict[str, Any] = {
+            "id": self.id,
+            "movieId": self.movieId,
+            "authorId": self.authorId,
+            "reviewTitle": self.reviewTitle,
+            "reviewBody": self.reviewBody,
+            "flagged": self.flagged,
+            "votes": self.votes,
+            "visible": self.visible,
+        }
+        if self.rating is not None:
+            data["rating"] = self.rating
+        if self.date is not None:
+            data["date"] = self.date.isoformat()
+        return data
+
+    def __repr__(self) -> str:
+        return f"ReviewRow(id={self.id!r}, position={self.position})"
+
+
+class ReviewStore:
+    """Reviews held column by column. Build with `from_rows`; treat as read-only."""
+
+    __slots__ = (
+        "ids", "ratings", "votes", "dates", "flags",
+        "movies", "authors", "movie_table", "author_table",
+        "text_offsets", "title_lengths", "body_lengths", "text", "inline_text",
+        "_id_positions",
+    )
+
+    def __init__(self, text: Optional[BlobView] = None):
+        self.ids = array("q")
+        self.ratings = array("d")  # NaN when missing or not numeric
+        self.votes = array("q")
+        self.dates = array("l")  # date ordinals, NO_DATE when missing
+        self.flags = array("B")  # FLAGGED | VISIBLE bits
+        self.movies = array("l")  # codes into movie_table
+        self.authors = array("l")  # codes into author_table
+        self.movie_table = _Table()
+        self.author_table = _Table()
+        self.text_offsets = array("q")  # title bytes, then body bytes, in the text file
+        self.title_lengths = array("I")
+        self.body_lengths = array("I")
+        self.text = text if text is not None else BlobView()
+        self.inline_text: Dict[int, Tuple[str, str]] = {}  # position -> (title, body) for unmigrated rows
+        self._id_positions: Optional[Dict[int, int]] = None  # only when ids are not ascending
+
+    @classmethod
+    def from_rows(cls, reviews: Iterable[Dict[str, Any]], text: Optional[BlobView] = None) -> "ReviewStore":
+        """Build a store from review dicts whose text spans point into `text`.
+
+        Rows without a usable id cannot be looked up, so they are left out
+        (and logged) rather than failing the whole build, as are text spans
+        running past the end of `text`, whose rows read as empty.
+        """
+        reviews = list(reviews)
+        store = cls(text)
+        size = store.text.size
+        skipped = broken = 0
+        for review in reviews:
+            review_id = _review_id(review.get("id"))
+            if review_id is None:
+                skipped += 1
+                continue
+            store.ids.append(review_id)
+            store.ratings.append(_rating(review.get("rating")))
+            store.votes.append(int(review.get("votes") or 0))
+            store.dates.append(_date_ordinal(review.get("date")))
+            store.flags.append(
+                (FLAGGED if review.get("flagged", False) else 0)
+                | (VISIBLE if review.get("visible", True) else 0)
+            )
+            store.movies.append(store.movie_table.code(review.get("movieId")))
+            store.authors.append(store.author_table.code(review.get("authorId")))
+            span = text_span(review)
+            if span is None:
+                store.inline_text[len(store.ids) - 1] = (
+                    str(review.get("reviewTitle") or ""), str(review.get("reviewBody") or ""),
+                )
+                span = (0, 0, 0)
+            elif sum(span) > size:
+                broken += 1
+                span = (0, 0, 0)
+            store.text_offsets.append(span[0])
+            store.title_lengths.append(span[1])
+            store.body_lengths.append(span[2])
+        if skipped:
+            logger.warning(f"Skipped {skipped} review(s) without a usable id", component="reviews")
+        if broken:
+            logger.warning(f"{broken} review(s) point past the end of the text file; their text reads as empty",
+                           component="reviews")
+        ids = store.ids
+        if any(ids[i] >= ids[i + 1] for i in range(len(ids) - 1)):
+            store._id_positions = {review_id: pos for pos, review_id in enumerate(ids)}
+        return store
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def position(self, review_id: int) -> Optional[int]:
+        """Row holding `review_id`, or None. Binary search while ids ascend, as new reviews get max + 1."""
+        if self._id_positions is not None:
+            return self._id_positions.get(review_id)
+        pos = bisect_left(self.ids, review_id)
+        if pos < len(self.ids) and self.ids[pos] == review_id:
+            return pos
+        return None
+
+    def title(self, position: int) -> str:
+        inline = self.inline_text.get(position)
+        if inline is not None:
+            return inline[0]
+        return self.text.read(self.text_offsets[position], self.title_lengths[position])
+
+    def body(self, position: int) -> str:
+        inline = self.inline_text.get(position)
+        if inline is not None:
+            return inline[1]
+        return self.text.read(self.text_offsets[position] + self.title_lengths[position], self.body_lengths[position])
+
+    def text_matches(self, query: str) -> Set[int]:
+        """Positions whose title or body contains `query` (already lower-case).
+
+        Every row's text is decoded and lower-cased in turn. A lower-cased
+        copy kept next to the text made this up to three times faster but
+        doubled the text file, so it is not kept.
+        """
+        matches = {pos for pos, (title, body) in self.inline_text.items()
+                   if query in title.lower() or query in body.lower()}
+        read = self.text.read
+        for pos, (offset, title_length, body_length) in enumerate(
+                zip(self.text_offsets, self.title_lengths, self.body_lengths)):
+            if (query in read(offset, title_length).lower()
+                    or query in read(offset + title_length, body_length).lower()):
+                matches.add(pos)
+        return matches
+
+    def row(self, position: int) -> ReviewRow:
+        return ReviewRow(self, position)
+
+    def rows(self, positions: Optional[Iterable[int]] = None) -> List[ReviewRow]:
+        """Views over `positions` (every row when omitted), in the order given."""
+        if positions is None:
+            positions = range(len(self.ids))
+        return [ReviewRow(self, pos) for pos in positions]
+
+    def visible_positions(self) -> List[int]:
+        """Rows a user-facing listing may show, in file order."""
+        flags = self.flags
+        return [pos for pos in range(len(flags)) if flags[pos] & VISIBLE]
+
+    def movie_code(self, movie_id: Any) -> Optional[int]:
+        return self.movie_table.codes.get(movie_id)
+
+    def author_code(self, author_id: Any) -> Optional[int]:
+        return self.author_table.codes.get(author_id)
@@ -0,0 +1,140 @@
+"""Local copy of the TMDb movie catalog, with a token index over titles."""
+import os
+import re
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+
+from app.utils.file_index import Signature, file_signature
+
+DEFAULT_CATALOG_PATH = Path(__file__).resolve().parents[1] / "data" / "tmdb_catalog.sqlite3"
+CATALOG_PATH = Path(os.getenv("TMDB_CATALOG_PATH", str(DEFAULT_CATALOG_PATH)))
+
+COLUMNS = ("tmdb_id", "title", "release_date", "poster_path", "overview", "popularity")
+
+_TOKEN = re.compile(r"\w+")
+
+
+def tokenize(title: str) -> List[str]:
+    """Casefolded word tokens of a title, in order, duplicates removed."""
+    return list(dict.fromkeys(_TOKEN.findall((title or "").casefold())))
+
+
+class CatalogWriter:
+    """Builds a new catalog file next to the live one and swaps it in on finish.
+
+    Searches keep using the previous catalog until `finish` replaces it, and
+    an import that fails leaves it untouched.
+    """
+
+    def __init__(self, path: Optional[Path] = None):
+        self.path = Path(path or CATALOG_PATH)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._tmp = self.path.with_suffix(".importing")
+        if self._tmp.exists():
+            self._tmp.unlink()
+        self._conn = sqlite3.connect(str(self._tmp))
+        self._conn.executescript(
+            """
+            PRAGMA journal_mode = OFF;
+            PRAGMA synchronous = OFF;
+            CREATE TABLE catalog (
+                tmdb_id INTEGER PRIMARY KEY,
+                title TEXT NOT NULL,
+                release_date TEXT,
+                poster_path TEXT,
+                overview TEXT,
+                popularity REAL NOT NULL DEFAULT 0
+            );
+            CREATE TABLE title_tokens (token TEXT NOT NULL, tmdb_id INTEGER NOT NULL);
+            """
+        )
+        self.count = 0
+
+    def add_batch(self, rows: Iterable[Dict[str, Any]]) -> None:
+        rows = list(rows)
+        self._conn.executemany(
+            "INSERT OR REPLACE INTO catalog VALUES (?, ?, ?, ?, ?, ?)",
+            [tuple(row.get(col) for col in COLUMNS) for row in rows],
+        )
+        self._conn.executemany(
+            "INSERT INTO title_tokens VALUES (?, ?)",
+            [(token, row["tmdb_id"]) for row in rows for token in tokenize(row["title"])],
+        )
+        self._conn.commit()
+        self.count += len(rows)
+
+    def finish(self) -> None:
+        # Indexes are built once at the end; that is much faster than per-insert upkeep.
+        self._conn.executescript(
+            """
+            CREATE INDEX title_tokens_token ON title_tokens (token, tmdb_id);
+            CREATE INDEX catalog_popularity ON catalog (popularity DESC);
+            """
+        )
+        self._conn.commit()
+        self._conn.close()
+        os.replace(self._tmp, self.path)
+
+    def abort(self) -> None:
+        self._conn.close()
+        if self._tmp.exists():
+            self._tmp.unlink()
+
+
+class _Reader:
+    """Shared read connection, reopened when an import replaces the file."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+        self._signature: Signature = None
+
+    def query(self, sql: str, params: Iterable[Any]) -> List[sqlite3.Row]:
+        signature = file_signature(CATALOG_PATH)
+        with self._lock:
+            if signature is None:
+                self._close()
+                return []
+            if signature != self._signature:
+                self._close()
+                self._conn = sqlite3.connect(f"file:{CATALOG_PATH}?mode=ro", uri=True, check_same_thread=False)
+                self._conn.row_factory = sqlite3.Row
+                self._signature = signature
+            return self._conn.execute(sql, tuple(params)).fetchall()
+
+    def _close(self) -> None:
+        if self._conn is not None:
+            self._conn.close()
+        self._conn, self._signature = None, None
+
+
+_reader = _Reader()
+
+
+def exists() -> bool:
+    return CATALOG_PATH.exists()
+
+
+def search(query: str, limit: int = 10) -> List[Dict[str, Any]]:
+    """Catalog movies whose titles contain every query word, most popular first.
+
+    The last word matches as a prefix so partially typed titles still match.
+    """
+    tokens = tokenize(query)
+    if not tokens:
+        return []
+    clauses = ["tmdb_id IN (SELECT tmdb_id FROM title_tokens WHERE token = ?)"] * (len(tokens) - 1)
+    clauses.append("tmdb_id IN (SELECT tmdb_id FROM title_tokens WHERE token >= ? AND token < ?)")
+    params: List[Any] = tokens[:-1] + [tokens[-1], tokens[-1] + "\U0010ffff", limit]
+    sql = (
+        f"SELECT {', '.join(COLUMNS)} FROM catalog WHERE {' AND '.join(clauses)} "
+        "ORDER BY popularity DESC, tmdb_id LIMIT ?"
+    )
+    return [dict(row) for row in _reader.query(sql, params)]
+
+
+def count() -> int:
+    rows = _reader.query("SELECT COUNT(*) AS n FROM catalog", ())
+    return rows[0]["n"] if rows else 0
@@ -1,17 +1,80 @@
 from pathlib import Path
 import json, os
-from typing import List, Dict, Any
+from typing import List, Dict, Any, NamedTuple, Optional, Set
+
+from app.utils.file_index import FileIndex
+from app.utils.repo_io import instrumented
 
 DATA_PATH = Path(__file__).resolve().parents[1] / "data" / "users.json"
 
+
+class UserStatus(NamedTuple):
+    """Per-user fields the auth dependency checks on every request."""
+    active: bool
+    role: str
+    token_epoch: int
+
+
+@instrumented("users", "load", lambda: DATA_PATH)
 def load_all() -> List[Dict[str, Any]]:
     if not DATA_PATH.exists():
         return []
     with DATA_PATH.open("r", encoding="utf-8") as f:
         return json.load(f)
-    
+
+@instrumented("users", "save", lambda: DATA_PATH)
 def save_all(users: List[Dict[str, Any]]) -> None:
     tmp = DATA_PATH.with_suffix(".tmp")
     with tmp.open("w", encoding="utf-8") as f:
         json.dump(users, f, ensure_ascii=False, indent=2)
-    os.replace(tmp, DATA_PATH)
\ No newline at end of file
+    os.replace(tmp, DATA_PATH)
+    _index.prime(users)
+
+
+class _UserIndex(NamedTuple):
+    by_id: Dict[str, Dict[str, Any]]
+    status: Dict[str, UserStatus]
+    warned_ids: Set[str]
+    banned_ids: Set[str]
+
+
+def _build_index(users: List[Dict[str, Any]]) -> _UserIndex:
+    by_id: Dict[str, Dict[str, Any]] = {}
+    status: Dict[str, UserStatus] = {}
+    warned_ids: Set[str] = set()
+    banned_ids: Set[str] = set()
+    for usr in users:
+        user_id = str(usr.get("id"))
+        by_id[user_id] = usr
+        active = usr.get("active", True) is not False
+        status[user_id] = UserStatus(
+            active=active,
+            role=usr.get("role", "user"),
+            token_epoch=int(usr.get("token_epoch") or 0),
+        )
+        if (usr.get("warnings") or 0) > 0:
+            warned_ids.add(user_id)
+        if not active:
+            banned_ids.add(user_id)
+    return _UserIndex(by_id, status, warned_ids, banned_ids)
+
+
+_index = FileIndex(lambda: DATA_PATH, lambda: load_all(), _build_index)
+
+
+def get_user_status(user_id: str) -> Optional[UserStatus]:
+    """Return the cached status for a user, or None if the user does not exist."""
+    return _index.get().status.get(str(user_id))
+
+def user_count() -> int:
+    return len(_index.get().by_id)
+
+def warned_users() -> List[Dict[str, Any]]:
+    """Users with at least one warning. Callers must not mutate the returned dicts."""
+    index = _index.get()
+    return [index.by_id[user_id] for user_id in sorted(index.warned_ids)]
+
+def banned_users() -> List[Dict[str, Any]]:
+    """Inactive users. Callers must not mutate the returned dicts."""
+    index = _index.get()
+    return [index.by_id[user_id] for user_id in sorted(index.banned_ids)]
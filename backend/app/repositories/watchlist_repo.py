@@ -2,14 +2,18 @@ from pathlib import Path
 import json, os
 from typing import List, Dict, Any
 
+from app.utils.repo_io import instrumented
+
 DATA_PATH = Path(__file__).resolve().parents[1] / "data" / "watchlist.json"
 
+@instrumented("watchlist", "load", lambda: DATA_PATH)
 def load_all() -> List[Dict[str, Any]]:
     if not DATA_PATH.exists():
         return []
     with DATA_PATH.open("r", encoding="utf-8-sig") as f:
         return json.load(f)
     
+@instrumented("watchlist", "save", lambda: DATA_PATH)
 def save_all(watchlist: List[Dict[str, Any]]) -> None:
     tmp = DATA_PATH.with_suffix(".tmp")
     with tmp.open("w", encoding="utf-8") as f:
@@ -1,21 +1,27 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, status, Query
 from app.services.admin_summary_service import get_admin_summary_data
+from app.services.admin_review_service import get_moderation_queue, DEFAULT_QUEUE_PAGE_SIZE
 from app.middleware.admin_dependency import admin_required
-from app.schemas.admin import AdminSummaryResponse
+from app.schemas.admin import AdminSummaryResponse, ModerationQueuePage
 from app.utils.logger import get_logger
 
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 
 logger = get_logger()
 router = APIRouter(prefix="/admin", tags=["admin"])
 
 
 @router.get("/", response_model=AdminSummaryResponse, status_code=status.HTTP_200_OK, summary="Get admin dashboard")
-def get_admin_summary(current_user: dict = Depends(admin_required)):
+def get_admin_summary(
+    cursor: Optional[str] = Query(None, description="Moderation queue cursor from a previous response"),
+    limit: int = Query(DEFAULT_QUEUE_PAGE_SIZE, ge=1, le=500),
+    current_user: dict = Depends(admin_required),
+):
     """
     Retrieve admin dashboard summary data.
     
     Includes user counts, flagged reviews, warned/banned users, and system statistics.
+    Flagged reviews are the first page of the moderation queue, most-reported first.
     Requires admin privileges.
     """
     logger.info(
@@ -24,4 +30,18 @@ def get_admin_summary(current_user: dict = Depends(admin_required)):
         admin_id=current_user.get("id"),
         admin_username=current_user.get("username")
     )
-    return get_admin_summary_data()
\ No newline at end of file
+    return get_admin_summary_data(cursor=cursor, limit=limit)
+
+
+@router.get("/flagged-reviews", response_model=ModerationQueuePage, summary="Get moderation queue")
+def get_flagged_reviews_queue(
+    cursor: Optional[str] = Query(None, description="Cursor from a previous page's next_cursor"),
+    limit: int = Query(DEFAULT_QUEUE_PAGE_SIZE, ge=1, le=500),
+    current_user: dict = Depends(admin_required),
+):
+    """
+    Page through flagged reviews ordered by flag count, then by oldest report.
+
+    Requires admin privileges.
+    """
+    return get_moderation_queue(cursor=cursor, limit=limit)
\ No newline at end of file
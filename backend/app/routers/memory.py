@@ -0,0 +1,91 @@
+from typing import Any, Dict, List, Literal
+
+from fastapi import APIRouter, Depends, Query, status
+
+from app.middleware.admin_dependency import admin_required
+from app.services import memory_diagnostics_service as memory
+
+router = APIRouter(prefix="/admin/memory", tags=["admin"])
+
+GroupBy = Literal["module", "package", "line"]
+
+
+@router.get("", summary="Memory and tracing status (Admin)")
+def get_memory_status(current_user: dict = Depends(admin_required)) -> Dict[str, Any]:
+    """
+    Report RSS, whether tracemalloc is tracing, traced memory and the stored snapshots.
+
+    Requires admin privileges.
+    """
+    return memory.status()
+
+
+@router.post("/tracing/start", summary="Start tracemalloc (Admin)")
+def start_tracing(
+    frames: int = Query(memory.DEFAULT_TRACE_FRAMES, ge=1, le=50, description="Frames kept per allocation"),
+    current_user: dict = Depends(admin_required),
+) -> Dict[str, Any]:
+    """
+    Start tracing allocations. Tracing slows the server and adds memory, so
+    stop it when done. Requires admin privileges.
+    """
+    return memory.start_tracing(frames)
+
+
+@router.post("/tracing/stop", summary="Stop tracemalloc (Admin)")
+def stop_tracing(current_user: dict = Depends(admin_required)) -> Dict[str, Any]:
+    """Stop tracing and discard stored snapshots. Requires admin privileges."""
+    return memory.stop_tracing()
+
+
+@router.post("/snapshots", status_code=status.HTTP_201_CREATED, summary="Take a memory snapshot (Admin)")
+def take_snapshot(current_user: dict = Depends(admin_required)) -> Dict[str, Any]:
+    """
+    Snapshot traced allocations. The oldest snapshots are dropped beyond
+    MEMORY_MAX_SNAPSHOTS. Requires admin privileges.
+    """
+    return memory.take_snapshot()
+
+
+@router.get("/snapshots/{snapshot_id}", summary="Top allocation sites in a snapshot (Admin)")
+def get_snapshot_top(
+    snapshot_id: str,
+    group_by: GroupBy = Query("module"),
+    limit: int = Query(20, ge=1, le=500),
+    current_user: dict = Depends(admin_required),
+) -> Dict[str, Any]:
+    """
+    List the largest allocation sites, grouped by module, top-level package
+    or source line. Requires admin privileges.
+    """
+    return memory.top_allocations(snapshot_id, group_by, limit)
+
+
+@router.delete("/snapshots/{snapshot_id}", status_code=status.HTTP_204_NO_CONTENT, summary="Delete a snapshot (Admin)")
+def delete_snapshot(snapshot_id: str, current_user: dict = Depends(admin_required)):
+    """Discard a stored snapshot. Requires admin privileges."""
+    memory.delete_snapshot(snapshot_id)
+
+
+@router.get("/diff", summary="Diff two memory snapshots (Admin)")
+def diff_snapshots(
+    base: str = Query(..., description="Earlier snapshot id"),
+    target: str = Query(..., description="Later snapshot id"),
+    group_by: GroupBy = Query("module"),
+    limit: int = Query(20, ge=1, le=500),
+    current_user: dict = Depends(admin_required),
+) -> Dict[str, Any]:
+    """
+    Show which allocation sites grew or shrank from `base` to `target`,
+    largest change first. Requires admin privileges.
+    """
+    return memory.diff_snapshots(base, target, group_by, limit)
+
+
+@router.get("/caches", response_model=List[Dict[str, Any]], summary="Estimated cache sizes (Admin)")
+def get_cache_sizes(current_user: dict = Depends(admin_required)):
+    """
+    Estimate the memory held by each repository index and the TMDb memory
+    cache. Works without tracemalloc. Requires admin privileges.
+    """
+    return memory.cache_sizes()
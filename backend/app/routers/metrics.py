@@ -0,0 +1,24 @@
+import os
+import secrets
+
+from fastapi import APIRouter, HTTPException, Request, status
+from fastapi.responses import Response
+
+from app.utils.metrics import CONTENT_TYPE, REGISTRY
+
+# When set, scrapers must send `Authorization: Bearer <METRICS_TOKEN>`.
+METRICS_TOKEN = os.getenv("METRICS_TOKEN", "")
+
+router = APIRouter(tags=["status"])
+
+
+@router.get("/metrics", include_in_schema=False)
+def metrics(request: Request) -> Response:
+    """
+    Request, repository and TMDb client metrics in the Prometheus text format.
+    """
+    if METRICS_TOKEN:
+        supplied = request.headers.get("Authorization", "")
+        if not secrets.compare_digest(supplied, f"Bearer {METRICS_TOKEN}"):
+            raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid metrics token")
+    return Response(content=REGISTRY.render(), media_type=CONTENT_TYPE)
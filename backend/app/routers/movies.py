@@ -34,8 +34,10 @@ def post_movie(payload: MovieCreate):
 @router.get("/search/all", response_model=Dict[str, Any])
 async def search_movies_all(title: str = Query(..., min_length=1)):
     """
-    Smart search: Searches local database first, then TMDb if needed.
-    Returns both local and external results in a structured format.
+    Smart search: Searches the local database, the imported TMDb catalog and
+    TMDb concurrently. External results are included when there are fewer
+    than 3 local matches. Whatever has not answered within the overall
+    search deadline is left out and the response has `partial: true`.
     """
     return await search_all_movies(title)
 
@@ -0,0 +1,39 @@
+from typing import Any, Dict, List
+
+from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.responses import FileResponse
+
+import app.repositories.profile_repo as profile_repo
+from app.middleware.admin_dependency import admin_required
+
+router = APIRouter(prefix="/admin/profiles", tags=["admin"])
+
+
+@router.get("", response_model=List[Dict[str, Any]], summary="List captured request profiles (Admin)")
+def list_profiles(current_user: dict = Depends(admin_required)):
+    """
+    List profiles captured with the `X-Profile: 1` header, newest first.
+
+    Each entry has the request's route, status, duration, sample count and
+    hottest frames. Requires admin privileges.
+    """
+    return profile_repo.list_all()
+
+
+@router.get("/{profile_id}", summary="Download a request profile (Admin)")
+def download_profile(profile_id: str, current_user: dict = Depends(admin_required)):
+    """
+    Download a profile's collapsed stacks, ready for flamegraph.pl,
+    speedscope or inferno. Requires admin privileges.
+    """
+    path = profile_repo.stacks_path(profile_id)
+    if path is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Profile not found")
+    return FileResponse(path, media_type="text/plain; charset=utf-8", filename=path.name)
+
+
+@router.delete("/{profile_id}", status_code=status.HTTP_204_NO_CONTENT, summary="Delete a request profile (Admin)")
+def delete_profile(profile_id: str, current_user: dict = Depends(admin_required)):
+    """Delete a captured profile. Requires admin privileges."""
+    if not profile_repo.delete(profile_id):
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Profile not found")
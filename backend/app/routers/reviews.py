@@ -1,8 +1,10 @@
+from datetime import date
 from typing import List, Optional, Literal
-from fastapi import APIRouter, status, Query, HTTPException, Depends
+from fastapi import APIRouter, status, Query, HTTPException, Depends, Response
 from app.schemas.review import Review, ReviewCreate, ReviewUpdate, PaginatedReviews
 from app.schemas.search import MovieSearch, MovieWithReviews
 from app.schemas.comment import CommentWithAuthor, CommentCreate
+from app.schemas.flag import FlagStatus
 from app.services.review_service import (
     list_reviews_paginated,
     create_review,
@@ -11,7 +13,7 @@ from app.services.review_service import (
     get_review_by_id,
     get_reviews_by_author,
 )
-from app.services.comment_service import get_comments_by_review_id, create_comment
+from app.services.comment_service import get_comments_page, create_comment
 from app.services.search_service import search_movies_with_reviews
 from app.services import flag_service
 from app.middleware.auth_middleware import jwt_auth_dependency, user_is_author
@@ -47,8 +49,14 @@ def search_reviews_slash(title: str = Query(..., min_length=1)):
 @router.get("", response_model=PaginatedReviews, summary="List and filter reviews")
 def list_or_filter_reviews(
     rating: Optional[float] = Query(None, ge=1, le=5),
+    min_rating: Optional[float] = Query(None, ge=1, le=5),
+    max_rating: Optional[float] = Query(None, ge=1, le=5),
+    date_from: Optional[date] = Query(None),
+    date_to: Optional[date] = Query(None),
+    movie_id: Optional[str] = Query(None, min_length=1),
+    author_id: Optional[str] = Query(None, min_length=1),
     search: Optional[str] = Query(None, min_length=1),
-    sort_by: Optional[Literal["rating", "movie"]] = Query(None),
+    sort_by: Optional[Literal["rating", "movie", "votes", "date"]] = Query(None),
     order: Literal["asc", "desc"] = Query("asc"),
     page: int = Query(1, ge=1),
     per_page: int = Query(50, ge=1, le=500),
@@ -57,20 +65,29 @@ def list_or_filter_reviews(
     Retrieve reviews with optional filtering, sorting, and pagination.
     
     - **rating**: Filter by exact rating (1-5)
+    - **min_rating** / **max_rating**: Filter by rating range (inclusive)
+    - **date_from** / **date_to**: Filter by review date range (inclusive)
+    - **movie_id** / **author_id**: Only reviews of one movie or by one author
     - **search**: Search in review text
-    - **sort_by**: Sort by 'rating' or 'movie' title
+    - **sort_by**: Sort by 'rating', 'movie' title, 'votes' or 'date'
     - **order**: Sort order ('asc' or 'desc')
     - **page**: Page number for pagination
     - **per_page**: Results per page (max 500)
     """
     service_sort = None
-    if sort_by == "rating":
-        service_sort = "rating"
-    elif sort_by == "movie":
+    if sort_by == "movie":
         service_sort = "movieTitle"
+    elif sort_by is not None:
+        service_sort = sort_by
 
     return list_reviews_paginated(
         rating=rating,
+        min_rating=min_rating,
+        max_rating=max_rating,
+        date_from=date_from,
+        date_to=date_to,
+        movie_id=movie_id,
+        author_id=author_id,
         search=search,
         sort_by=service_sort,
         order=order,
@@ -88,7 +105,23 @@ def filter_reviews(
     page: int = Query(1, ge=1),
     per_page: int = Query(50, ge=1, le=500),
 ):
-    return list_or_filter_reviews(rating=rating, search=search, sort_by=sort_by, order=order, page=page, per_page=per_page)
+    return list_or_filter_reviews(
+        rating=rating, min_rating=None, max_rating=None, date_from=None, date_to=None,
+        movie_id=None, author_id=None,
+        search=search, sort_by=sort_by, order=order, page=page, per_page=per_page,
+    )
+
+@router.get("/flag-status", response_model=List[FlagStatus], summary="Check flag status for many reviews")
+def get_flag_statuses(
+    review_ids: List[int] = Query(..., max_length=500),
+    current_user: dict = Depends(jwt_auth_dependency),
+):
+    """
+    Check the current user's flag status and the total flag count for several reviews at once.
+
+    - **review_ids**: Review IDs to check, e.g. `?review_ids=1&review_ids=2` (max 500)
+    """
+    return flag_service.get_flag_statuses(current_user.get("user_id"), review_ids)
 
 @router.get("/{review_id}", response_model=Review, summary="Get review by ID")
 def get_review(review_id: int):
@@ -155,9 +188,22 @@ def unflag_review_endpoint(review_id: int, current_user: dict = Depends(admin_re
     flag_service.unflag_review(review_id)
 
 @router.get("/{review_id}/comments", response_model=List[CommentWithAuthor], status_code=200, summary="Get review comments")
-def get_comments(review_id: int):
-    """Retrieve all comments on a specific review."""
-    return get_comments_by_review_id(review_id)
+def get_comments(
+    review_id: int,
+    response: Response,
+    cursor: Optional[int] = Query(None, description="Return comments after this comment id"),
+    limit: Optional[int] = Query(None, ge=1, le=200),
+):
+    """
+    Retrieve comments on a specific review, oldest first.
+
+    - **cursor**: Continue after this comment id (from the `X-Next-Cursor` header)
+    - **limit**: Maximum number of comments to return (default: all)
+    """
+    page = get_comments_page(review_id, cursor=cursor, limit=limit)
+    if page.next_cursor is not None:
+        response.headers["X-Next-Cursor"] = str(page.next_cursor)
+    return page.comments
 
 @router.post("/{review_id}/comments", status_code=204, summary="Add comment")
 def post_comment(payload: CommentCreate, review_id: int, current_user: dict = Depends(jwt_auth_dependency)):
@@ -1,6 +1,9 @@
-from fastapi import APIRouter, Query, HTTPException
+from fastapi import APIRouter, Query, HTTPException, Depends
 from typing import List, Dict, Any
-from app.services.tmdb_service import search_tmdb_movies, get_tmdb_movie_details, create_tmdb_movie_id
+from app.services.tmdb_service import search_tmdb_movies, get_tmdb_movie_details, create_tmdb_movie_id, tmdb_health
+from app.services.tmdb_cache import get_cache
+from app.services.tmdb_enrichment import worker as enrichment_worker
+from app.middleware.admin_dependency import admin_required
 
 router = APIRouter(prefix="/tmdb", tags=["TMDb External Movies"])
 
@@ -33,3 +36,25 @@ async def get_external_movie_details(tmdb_id: int):
         raise HTTPException(status_code=404, detail="Movie not found on TMDb")
     details["movie_id"] = create_tmdb_movie_id(tmdb_id)
     return details
+
+
+@router.get("/health", summary="TMDb integration health")
+def get_tmdb_health():
+    """
+    Report the TMDb circuit breaker and rate limiter state.
+
+    `status` is `ok` while the breaker is closed, `degraded` while it is
+    probing TMDb again, and `unavailable` while calls fail fast.
+    `enrichment` shows the background poster/description backfill queue.
+    """
+    return {**tmdb_health(), "enrichment": enrichment_worker.snapshot()}
+
+
+@router.get("/cache/stats", summary="TMDb cache statistics (Admin)")
+def get_cache_stats(current_user: dict = Depends(admin_required)):
+    """
+    Report TMDb response cache hits, misses and hit rate since startup.
+
+    Requires admin privileges.
+    """
+    return get_cache().stats()
@@ -1,8 +1,23 @@
 from pydantic import BaseModel
-from typing import List, Any
+from typing import List, Any, Optional
+from datetime import datetime
+from .review import Review
+
+class FlaggedReview(Review):
+    """Review in the moderation queue with its report volume"""
+    flagCount: int
+    firstFlaggedAt: Optional[datetime] = None
+
+class ModerationQueuePage(BaseModel):
+    """A page of the moderation queue; pass `next_cursor` back as `cursor` to continue"""
+    reviews: List[FlaggedReview]
+    total: int
+    next_cursor: Optional[str] = None
 
 class AdminSummaryResponse(BaseModel):
     total_users: int
     warned_users: List[Any]
     banned_users: List[Any]
-    flagged_reviews: List[Any]
\ No newline at end of file
+    flagged_reviews: List[Any]
+    flagged_reviews_total: int = 0
+    flagged_reviews_next_cursor: Optional[str] = None
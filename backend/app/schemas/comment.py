@@ -1,4 +1,5 @@
 from pydantic import BaseModel
+from typing import List, Optional
 from datetime import datetime
 
 class Comment(BaseModel):
@@ -12,4 +13,9 @@ class CommentWithAuthor(Comment):
     authorUsername: str
 
 class CommentCreate(BaseModel):
-    commentBody: str
\ No newline at end of file
+    commentBody: str
+
+class CommentPage(BaseModel):
+    """A page of review comments; pass `next_cursor` back as `cursor` to continue."""
+    comments: List[CommentWithAuthor]
+    next_cursor: Optional[int] = None
@@ -5,3 +5,8 @@ class Flag(BaseModel):
     user_id: str
     review_id: int
     timestamp: datetime
+
+class FlagStatus(BaseModel):
+    review_id: int
+    has_flagged: bool
+    flag_count: int
@@ -84,6 +84,7 @@ class ReviewWithMovie(BaseModel):
     votes: int = 0
     date: date
     visible: bool = True
+    commentCount: int = 0
 
 
 class PaginatedReviews(BaseModel):
@@ -15,6 +15,7 @@ class User(BaseModel):
     created_at: datetime
     active: bool = True
     warnings: int = 0
+    token_epoch: int = 0
     
 class UserCreate(BaseModel):
     """Schema for user registration"""
@@ -3,6 +3,7 @@ from datetime import datetime, date
 from typing import Dict, List, Any
 
 from app.repositories import review_repo, user_repo, battle_repo
+from app.repositories.review_store import NO_DATE, VISIBLE
 from app.schemas.achievement import AchievementCategory, AchievementWinner
 
 
@@ -30,13 +31,24 @@ def _load_usernames() -> Dict[str, str]:
 
 def _aggregate_reviews() -> Dict[str, Dict[str, Any]]:
     """Aggregate counts, votes, and latest date per author."""
+    store = review_repo.load_store()
+    counts: Dict[int, int] = defaultdict(int)
+    votes: Dict[int, int] = defaultdict(int)
+    latest: Dict[int, int] = defaultdict(int)
+    for author, flags, rv_votes, ordinal in zip(store.authors, store.flags, store.votes, store.dates):
+        if not flags & VISIBLE:
+            continue
+        counts[author] += 1
+        votes[author] += rv_votes
+        if ordinal > latest[author]:
+            latest[author] = ordinal
+
     aggregates: Dict[str, Dict[str, Any]] = defaultdict(lambda: {"count": 0, "votes": 0, "latest": date.min})
-    for rv in review_repo.load_all():
-        author = str(rv.get("authorId"))
-        agg = aggregates[author]
-        agg["count"] += 1
-        agg["votes"] += int(rv.get("votes") or 0)
-        rv_date = _to_date(rv.get("date"))
+    for author, count in counts.items():
+        agg = aggregates[str(store.author_table.values[author])]
+        agg["count"] += count
+        agg["votes"] += votes[author]
+        rv_date = date.fromordinal(latest[author]) if latest[author] != NO_DATE else date.min
         if rv_date > agg["latest"]:
             agg["latest"] = rv_date
     return aggregates
@@ -1,17 +1,65 @@
 from app.schemas.review import Review
-from typing import List
-from app.services.review_service import list_reviews, save_all, NOT_FOUND, REVIEW_NOT_FOUND
+from app.schemas.admin import FlaggedReview, ModerationQueuePage
+from typing import List, Optional
+from app.services.review_service import save_all, NOT_FOUND, REVIEW_NOT_FOUND
 from app.utils.list_helpers import find_dict_by_id
-from app.repositories.review_repo import load_all
+from app.repositories.review_repo import load_all, with_text
+from app.repositories import flag_repo, review_repo
+from app.repositories.review_store import VISIBLE
 from fastapi import HTTPException
 from typing import Dict, Any
 from app.utils.logger import get_logger
 
 logger = get_logger()
 
-def get_flagged_reviews() -> List[Review]:
-    reviews = list_reviews()
-    return [review for review in reviews if review.flagged]
+DEFAULT_QUEUE_PAGE_SIZE = 50
+
+def _encode_queue_cursor(key: flag_repo.QueueKey) -> str:
+    neg_count, first_flagged, review_id = key
+    return f"{-neg_count}_{first_flagged}_{review_id}"
+
+def _decode_queue_cursor(cursor: str) -> flag_repo.QueueKey:
+    try:
+        count, rest = cursor.split("_", 1)
+        first_flagged, review_id = rest.rsplit("_", 1)
+        return (-int(count), first_flagged, int(review_id))
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+def _queue_total() -> int:
+    """Queued reviews the moderation queue can show, i.e. ones that still exist and are visible."""
+    store = review_repo.load_store()
+    total = 0
+    for _, _, review_id in flag_repo.iter_queue():
+        pos = store.position(review_id)
+        if pos is not None and store.flags[pos] & VISIBLE:
+            total += 1
+    return total
+
+def get_moderation_queue(cursor: Optional[str] = None, limit: Optional[int] = DEFAULT_QUEUE_PAGE_SIZE) -> ModerationQueuePage:
+    """Page through flagged reviews, most-reported first, oldest report breaking ties.
+
+    Hidden and deleted reviews are skipped, and left out of `total` too; only
+    reviews on the returned page are looked up.
+    """
+    after = _decode_queue_cursor(cursor) if cursor else None
+    page: List[FlaggedReview] = []
+    next_cursor = None
+    for key in flag_repo.iter_queue(after):
+        if limit is not None and len(page) == limit:
+            next_cursor = _encode_queue_cursor(last_key)
+            break
+        neg_count, first_flagged, review_id = key
+        review = review_repo.get_by_id(review_id)
+        last_key = key
+        if review is None:
+            continue
+        page.append(FlaggedReview(**review, flagCount=-neg_count, firstFlaggedAt=first_flagged or None))
+    return ModerationQueuePage(reviews=page, total=_queue_total(), next_cursor=next_cursor)
+
+def get_flagged_reviews() -> List[FlaggedReview]:
+    """All visible flagged reviews in moderation order"""
+    return get_moderation_queue(limit=None).reviews
 
 def hide_review(review_id: int) -> Review:
     """Marks a review's visible field as False"""
@@ -34,4 +82,4 @@ def hide_review(review_id: int) -> Review:
         review_id=review_id,
         author_id=reviews[index].get("authorId")
     )
-    return Review(**reviews[index])
\ No newline at end of file
+    return Review(**with_text([reviews[index]])[0])
\ No newline at end of file
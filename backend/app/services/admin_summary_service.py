@@ -1,11 +1,15 @@
-from app.services.admin_review_service import get_flagged_reviews
+from typing import Optional
+from app.services.admin_review_service import get_moderation_queue, DEFAULT_QUEUE_PAGE_SIZE
 from app.services.admin_user_service import get_banned_users, get_user_count, get_warned_users
 from app.schemas.admin import AdminSummaryResponse
 
-def get_admin_summary_data():
+def get_admin_summary_data(cursor: Optional[str] = None, limit: int = DEFAULT_QUEUE_PAGE_SIZE):
+    queue = get_moderation_queue(cursor=cursor, limit=limit)
     return AdminSummaryResponse(
         total_users=get_user_count(),
         warned_users=get_warned_users(),
         banned_users=get_banned_users(),
-        flagged_reviews=get_flagged_reviews()
-    )
\ No newline at end of file
+        flagged_reviews=queue.reviews,
+        flagged_reviews_total=queue.total,
+        flagged_reviews_next_cursor=queue.next_cursor,
+    )
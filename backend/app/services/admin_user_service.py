@@ -1,18 +1,18 @@
-from app.repositories.user_repo import load_all
+from app.repositories import user_repo
 from app.schemas.user import User
-from app.services.user_service import list_users
-from typing import List
+from typing import List, Dict, Any
+
+def _to_public_users(rows: List[Dict[str, Any]]) -> List[User]:
+    users = [User(**usr) for usr in rows]
+    for user in users:
+        user.hashed_password = None
+    return users
 
 def get_user_count() -> int:
-    users = load_all()
-    return len(users)
+    return user_repo.user_count()
 
 def get_warned_users() -> List[User]:
-    users = list_users()
-    warned_users = [user for user in users if user.warnings > 0]
-    return warned_users
+    return _to_public_users(user_repo.warned_users())
 
 def get_banned_users() -> List[User]:
-    users = list_users()
-    banned_users = [user for user in users if not user.active]
-    return banned_users
\ No newline at end of file
+    return _to_public_users(user_repo.banned_users())
@@ -1,19 +1,36 @@
-from typing import List, Dict, Any
+from bisect import bisect_right
+from typing import List, Dict, Any, Optional
 from fastapi import HTTPException
-from app.schemas.comment import Comment, CommentCreate, CommentWithAuthor
-from app.repositories.comments_repo import load_all, save_all
+from app.schemas.comment import Comment, CommentCreate, CommentWithAuthor, CommentPage
+from app.repositories.comments_repo import load_all, save_all, get_by_review_id
 from app.services.review_service import get_review_by_id
-from app.services.user_service import get_user_by_id
+from app.services.user_service import get_usernames_by_ids
 import datetime
 
+UNKNOWN_AUTHOR = "Unknown User"
+
+def _with_authors(comments: List[Dict[str, Any]]) -> List[CommentWithAuthor]:
+    """Attach author usernames, resolving every author in one batched lookup"""
+    usernames = get_usernames_by_ids({comment["authorId"] for comment in comments})
+    return [
+        CommentWithAuthor(**comment, authorUsername=usernames.get(str(comment["authorId"]), UNKNOWN_AUTHOR))
+        for comment in comments
+    ]
+
 def get_comments_by_review_id(reviewId: int) -> List[CommentWithAuthor]:
     """Get all comments for a certain review"""
-    comments_for_id = [comment for comment in load_all() if comment["reviewId"] == reviewId]
-    for comment in comments_for_id:
-        comment_poster = get_user_by_id(comment["authorId"])
-        comment["authorUsername"] = comment_poster.username
-        comment = CommentWithAuthor(**comment)
-    return comments_for_id
+    return _with_authors(get_by_review_id(reviewId))
+
+def get_comments_page(review_id: int, *, cursor: Optional[int] = None, limit: Optional[int] = None) -> CommentPage:
+    """Get comments for a review in id order, starting after the `cursor` comment id"""
+    comments = get_by_review_id(review_id)
+    start = 0
+    if cursor is not None:
+        start = bisect_right([com.get("id", 0) for com in comments], cursor)
+    end = len(comments) if limit is None else start + limit
+    page = comments[start:end]
+    next_cursor = page[-1].get("id") if page and end < len(comments) else None
+    return CommentPage(comments=_with_authors(page), next_cursor=next_cursor)
 
 def create_comment(payload: CommentCreate, review_id: int, user_id: str) -> Comment:
     review = get_review_by_id(review_id)
@@ -23,4 +40,4 @@ def create_comment(payload: CommentCreate, review_id: int, user_id: str) -> Comm
     new_comment = Comment(id=new_comment_id, reviewId=review_id, authorId=user_id, commentBody=payload.commentBody, date=datetime.datetime.now())
     comments.append(new_comment.model_dump(mode="json"))
     save_all(comments)
-    return new_comment
\ No newline at end of file
+    return new_comment
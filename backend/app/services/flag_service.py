@@ -1,5 +1,7 @@
 from datetime import datetime
+from typing import List
 from app.repositories import flag_repo
+from app.schemas.flag import FlagStatus
 from app.services.review_service import get_review_by_id, mark_review_as_flagged, mark_review_as_unflagged
 from app.utils.logger import get_logger
 
@@ -9,9 +11,14 @@ def flag_review(user_id: str, review_id: int) -> dict:
     """Flag a review as inappropriate"""
     review = get_review_by_id(review_id)
     
-    flags = flag_repo.load_all()
+    flag_record = {
+        "user_id": user_id,
+        "review_id": review_id,
+        "timestamp": datetime.now().isoformat()
+    }
     
-    if any(f.get("user_id") == user_id and f.get("review_id") == review_id for f in flags):
+    flag_count = flag_repo.add_flag(flag_record)
+    if flag_count is None:
         logger.warning(
             "Duplicate flag attempt blocked",
             component="moderation",
@@ -20,18 +27,8 @@ def flag_review(user_id: str, review_id: int) -> dict:
         )
         raise ValueError("User has already flagged this review")
     
-    flag_record = {
-        "user_id": user_id,
-        "review_id": review_id,
-        "timestamp": datetime.now().isoformat()
-    }
-    
-    flags.append(flag_record)
-    flag_repo.save_all(flags)
-    
     mark_review_as_flagged(review)
     
-    flag_count = len([f for f in flags if f.get("review_id") == review_id])
     logger.warning(
         "Review flagged by user",
         component="moderation",
@@ -46,19 +43,26 @@ def unflag_review(review_id: int) -> None:
     """Unflag a review"""
     review = get_review_by_id(review_id)
 
-    flags = flag_repo.load_all()
-
-    updated_flags = [f for f in flags if f.get("review_id") != review_id]
-    flag_repo.save_all(updated_flags)
+    flag_repo.remove_flags_for_review(review_id)
 
     mark_review_as_unflagged(review)
 
 def get_flagged_reviews_count(review_id: int) -> int:
     """Get the number of users who have flagged a specific review"""
-    flags = flag_repo.load_all()
-    return sum(1 for flag in flags if flag.get("review_id") == review_id)
+    return flag_repo.count_for_review(review_id)
 
 def has_user_flagged_review(user_id: str, review_id: int) -> bool:
     """Check if a specific user has flagged a specific review"""
-    flags = flag_repo.load_all()
-    return any(f.get("user_id") == user_id and f.get("review_id") == review_id for f in flags)
+    return flag_repo.has_flagged(user_id, review_id)
+
+def get_flag_statuses(user_id: str, review_ids: List[int]) -> List[FlagStatus]:
+    """Flag status and total flag count for several reviews, in request order"""
+    unique_ids = list(dict.fromkeys(review_ids))
+    return [
+        FlagStatus(
+            review_id=review_id,
+            has_flagged=flag_repo.has_flagged(user_id, review_id),
+            flag_count=flag_repo.count_for_review(review_id),
+        )
+        for review_id in unique_ids
+    ]
@@ -0,0 +1,221 @@
+"""tracemalloc snapshots, allocation reports and cache size estimates for admins."""
+import os
+import sys
+import threading
+import tracemalloc
+from collections import defaultdict
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from fastapi import HTTPException
+
+from app.utils import file_index
+from app.utils.logger import get_logger
+
+MEMORY_MAX_SNAPSHOTS = int(os.getenv("MEMORY_MAX_SNAPSHOTS", "10"))
+DEFAULT_TRACE_FRAMES = 1
+
+GROUP_BY = ("module", "package", "line")
+
+logger = get_logger()
+
+_lock = threading.Lock()
+_snapshots: Dict[str, Tuple[tracemalloc.Snapshot, str]] = {}  # id -> (snapshot, taken_at), oldest first
+_next_id = 1
+
+# tracemalloc's own bookkeeping and import machinery only add noise.
+_NOISE = (
+    tracemalloc.Filter(False, tracemalloc.__file__),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap_external>"),
+    tracemalloc.Filter(False, "<unknown>"),
+)
+
+
+def _rss_bytes() -> Optional[int]:
+    """Resident set size from /proc, where available."""
+    try:
+        with open("/proc/self/status") as f:
+            for line in f:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1]) * 1024
+    except OSError:
+        pass
+    return None
+
+
+def status() -> Dict[str, Any]:
+    tracing = tracemalloc.is_tracing()
+    current, peak = tracemalloc.get_traced_memory() if tracing else (0, 0)
+    with _lock:
+        snapshots = [{"id": sid, "taken_at": taken_at} for sid, (_, taken_at) in _snapshots.items()]
+    return {
+        "tracing": tracing,
+        "frames": tracemalloc.get_traceback_limit() if tracing else None,
+        "traced_current_bytes": current,
+        "traced_peak_bytes": peak,
+        "tracemalloc_overhead_bytes": tracemalloc.get_tracemalloc_memory() if tracing else 0,
+        "rss_bytes": _rss_bytes(),
+        "snapshots": snapshots,
+    }
+
+
+def start_tracing(frames: int = DEFAULT_TRACE_FRAMES) -> Dict[str, Any]:
+    """Start tracing allocations. Only memory allocated from now on is traced."""
+    if tracemalloc.is_tracing():
+        raise HTTPException(status_code=409, detail="tracemalloc is already tracing")
+    tracemalloc.start(frames)
+    logger.info("tracemalloc started", component="memory", frames=frames)
+    return status()
+
+
+def stop_tracing() -> Dict[str, Any]:
+    """Stop tracing and drop the stored snapshots."""
+    if not tracemalloc.is_tracing():
+        raise HTTPException(status_code=409, detail="tracemalloc is not tracing")
+    tracemalloc.stop()
+    with _lock:
+        _snapshots.clear()
+    logger.info("tracemalloc stopped", component="memory")
+    return status()
+
+
+def take_snapshot() -> Dict[str, Any]:
+    """Store a snapshot (evicting the oldest past MEMORY_MAX_SNAPSHOTS) and summarise it."""
+    global _next_id
+    if not tracemalloc.is_tracing():
+        raise HTTPException(status_code=409, detail="Start tracing before taking snapshots")
+    snapshot = tracemalloc.take_snapshot().filter_traces(_NOISE)
+    taken_at = datetime.now(timezone.utc).isoformat()
+    with _lock:
+        snapshot_id = str(_next_id)
+        _next_id += 1
+        _snapshots[snapshot_id] = (snapshot, taken_at)
+        while len(_snapshots) > MEMORY_MAX_SNAPSHOTS:
+            _snapshots.pop(next(iter(_snapshots)))
+    stats = snapshot.statistics("filename")
+    return {
+        "id": snapshot_id,
+        "taken_at": taken_at,
+        "traced_bytes": sum(stat.size for stat in stats),
+        "blocks": sum(stat.count for stat in stats),
+    }
+
+
+def delete_snapshot(snapshot_id: str) -> None:
+    with _lock:
+        if _snapshots.pop(snapshot_id, None) is None:
+            raise HTTPException(status_code=404, detail="Snapshot not found")
+
+
+def _get_snapshot(snapshot_id: str) -> tracemalloc.Snapshot:
+    with _lock:
+        entry = _snapshots.get(snapshot_id)
+    if entry is None:
+        raise HTTPException(status_code=404, detail=f"Snapshot {snapshot_id} not found")
+    return entry[0]
+
+
+def _module_names() -> Dict[str, str]:
+    """Source filename -> module name for everything imported."""
+    names = {}
+    for name, module in list(sys.modules.items()):
+        path = getattr(module, "__file__", None)
+        if path:
+            names[os.path.abspath(path)] = name
+    return names
+
+
+def _group_key(traceback: tracemalloc.Traceback, group_by: str, modules: Dict[str, str]) -> str:
+    frame = traceback[0]
+    if group_by == "line":
+        return f"{frame.filename}:{frame.lineno}"
+    module = modules.get(os.path.abspath(frame.filename), frame.filename)
+    return module.split(".")[0] if group_by == "package" else module
+
+
+def _grouped(stats: Iterable[Any], group_by: str, diff: bool) -> List[Dict[str, Any]]:
+    modules = _module_names()
+    totals: Dict[str, Dict[str, int]] = defaultdict(lambda: defaultdict(int))
+    for stat in stats:
+        entry = totals[_group_key(stat.traceback, group_by, modules)]
+        entry["size_bytes"] += stat.size
+        entry["count"] += stat.count
+        if diff:
+            entry["size_diff_bytes"] += stat.size_diff
+            entry["count_diff"] += stat.count_diff
+    return [{"site": site, **values} for site, values in totals.items()]
+
+
+def top_allocations(snapshot_id: str, group_by: str = "module", limit: int = 20) -> Dict[str, Any]:
+    """Largest allocation sites in a snapshot, grouped by module, package or line."""
+    snapshot = _get_snapshot(snapshot_id)
+    key_type = "lineno" if group_by == "line" else "filename"
+    rows = _grouped(snapshot.statistics(key_type), group_by, diff=False)
+    rows.sort(key=lambda row: row["size_bytes"], reverse=True)
+    return {
+        "snapshot": snapshot_id,
+        "group_by": group_by,
+        "traced_bytes": sum(row["size_bytes"] for row in rows),
+        "top": rows[:limit],
+    }
+
+
+def diff_snapshots(base_id: str, target_id: str, group_by: str = "module", limit: int = 20) -> Dict[str, Any]:
+    """What grew (or shrank) between two snapshots, largest absolute change first."""
+    base, target = _get_snapshot(base_id), _get_snapshot(target_id)
+    key_type = "lineno" if group_by == "line" else "filename"
+    rows = _grouped(target.compare_to(base, key_type), group_by, diff=True)
+    rows = [row for row in rows if row["size_diff_bytes"] or row["count_diff"]]
+    rows.sort(key=lambda row: abs(row["size_diff_bytes"]), reverse=True)
+    return {
+        "base": base_id,
+        "target": target_id,
+        "group_by": group_by,
+        "size_diff_bytes": sum(row["size_diff_bytes"] for row in rows),
+        "top": rows[:limit],
+    }
+
+
+def deep_sizeof(obj: Any) -> int:
+    """Estimated bytes reachable from `obj`: containers, instance dicts and slots.
+
+    Each object is counted once per call, so a cache's estimate includes
+    rows it shares with other caches. Classes, modules and functions are
+    not followed.
+    """
+    seen = set()
+    stack = [obj]
+    total = 0
+    while stack:
+        current = stack.pop()
+        if id(current) in seen or isinstance(current, (type, type(sys), type(deep_sizeof))):
+            continue
+        seen.add(id(current))
+        total += sys.getsizeof(current)
+        if isinstance(current, dict):
+            stack.extend(current.keys())
+            stack.extend(current.values())
+        elif isinstance(current, (list, tuple, set, frozenset)):
+            stack.extend(current)
+        elif not isinstance(current, (str, bytes, int, float, bool)):
+            if hasattr(current, "__dict__"):
+                stack.append(vars(current))
+            for slot in getattr(type(current), "__slots__", ()):
+                if hasattr(current, slot):
+                    stack.append(getattr(current, slot))
+    return total
+
+
+def cache_sizes() -> List[Dict[str, Any]]:
+    """Estimated size of every in-memory repository index and the TMDb memory cache."""
+    from app.services.tmdb_cache import get_cache
+
+    sizes = []
+    for index in file_index.instances():
+        value = index.cached()
+        sizes.append({"cache": index.label, "built": value is not None, "bytes": deep_sizeof(value) if value is not None else 0})
+    memory = get_cache().memory
+    sizes.append({"cache": "tmdb_cache:memory", "built": True, "entries": len(memory), "bytes": deep_sizeof(memory)})
+    sizes.sort(key=lambda row: row["bytes"], reverse=True)
+    return sizes
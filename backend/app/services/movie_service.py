@@ -1,5 +1,5 @@
-import uuid
 import asyncio
+import uuid
 from datetime import date as date_type
 from typing import Any, Dict, List
 
@@ -7,13 +7,17 @@ from fastapi import HTTPException
 
 from app.schemas.movie import Movie, MovieCreate, MovieUpdate, MovieSummary, MovieWithReviews
 import app.repositories.movie_repo as movie_repo
-from app.repositories.review_repo import load_all as load_reviews
+from app.repositories.review_repo import load_all as load_reviews, with_text
 from app.utils.list_helpers import find_dict_by_id, NOT_FOUND
+from app.utils.single_flight import SingleFlight
 from app.services.tmdb_service import (
     get_tmdb_movie_details,
     validate_tmdb_movie_id,
-    is_tmdb_movie_id,
 )
+from app.services.tmdb_enrichment import needs_enrichment, worker as enrichment_worker
+
+
+_tmdb_imports = SingleFlight()
 
 
 def _parse_tmdb_to_movie_dict(movie_id: str, tmdb_data: Dict[str, Any]) -> Dict[str, Any]:
@@ -36,7 +40,7 @@ def _parse_tmdb_to_movie_dict(movie_id: str, tmdb_data: Dict[str, Any]) -> Dict[
 
 def _get_reviews_for_movie(movie_id: str) -> List[Dict[str, Any]]:
     """Get reviews for a movie by its ID."""
-    return [rv for rv in load_reviews() if rv.get("movieId") == movie_id]
+    return with_text(rv for rv in load_reviews() if rv.get("movieId") == movie_id)
 
 
 def load_all() -> List[Dict[str, Any]]:
@@ -106,45 +110,22 @@ def list_movies(sort_by: str | None = None, order: str = "asc") -> List[Movie]:
 
 
 def create_movie(payload: MovieCreate) -> Movie:
-    movies = load_all()
-    new_movie_id = str(uuid.uuid4())
-    if any(mov.get("id") == new_movie_id for mov in movies):
-        raise HTTPException(status_code=409, detail="ID collision; retry")
-    new_movie = Movie(
-        id=new_movie_id,
-        title=payload.title.strip(),
-        genre=payload.genre.strip(),
-        release=payload.release,
-        description=payload.description.strip(),
-        duration=payload.duration,
-    )
-    movies.append(new_movie.model_dump(mode="json"))
-    save_all(movies)
-    return new_movie
-
-
-def _refresh_tmdb_fields_if_missing(
-    movie_id: str, movie: Dict[str, Any], movies: List[Dict[str, Any]], idx: int
-) -> Dict[str, Any]:
-    """Populate missing TMDb-backed fields synchronously when possible."""
-    if not (is_tmdb_movie_id(movie_id) and not movie.get("posterUrl")):
-        return movie
-
-    tmdb_id = validate_tmdb_movie_id(movie_id)
-    try:
-        tmdb_data = asyncio.run(get_tmdb_movie_details(tmdb_id))
-    except RuntimeError:
-        # If an event loop is already running, skip the refresh instead of crashing.
-        tmdb_data = None
-
-    if tmdb_data:
-        movie["posterUrl"] = tmdb_data.get("poster_url") or movie.get("posterUrl")
-        movie["description"] = movie.get("description") or tmdb_data.get("description")
-        movie["genre"] = movie.get("genre") or tmdb_data.get("genre")
-        movies[idx] = movie
+    with movie_repo.write_lock:
+        movies = load_all()
+        new_movie_id = str(uuid.uuid4())
+        if any(mov.get("id") == new_movie_id for mov in movies):
+            raise HTTPException(status_code=409, detail="ID collision; retry")
+        new_movie = Movie(
+            id=new_movie_id,
+            title=payload.title.strip(),
+            genre=payload.genre.strip(),
+            release=payload.release,
+            description=payload.description.strip(),
+            duration=payload.duration,
+        )
+        movies.append(new_movie.model_dump(mode="json"))
         save_all(movies)
-
-    return movie
+    return new_movie
 
 
 def get_movie_by_id(movie_id: str) -> MovieWithReviews:
@@ -154,7 +135,10 @@ def get_movie_by_id(movie_id: str) -> MovieWithReviews:
     if idx == NOT_FOUND:
         raise HTTPException(status_code=404, detail=f"Movie '{movie_id}' not found")
 
-    movie = _refresh_tmdb_fields_if_missing(movie_id, movies[idx], movies, idx)
+    movie = movies[idx]
+    if needs_enrichment(movie):
+        # Filled in by the background worker; this response uses what we have.
+        enrichment_worker.enqueue(movie_id)
 
     return MovieWithReviews(
         id=movie.get("id"),
@@ -197,49 +181,69 @@ def movie_summary_by_id(movie_id: str) -> List[MovieSummary]:
 
 
 def update_movie(movie_id: str, payload: MovieUpdate) -> Movie:
-    movies = load_all()
-    index = find_dict_by_id(movies, "id", movie_id)
-    if index == NOT_FOUND:
-        raise HTTPException(status_code=404, detail=f"Movie '{movie_id}' not found")
-    updated = Movie(
-        id=movie_id,
-        title=payload.title.strip(),
-        genre=payload.genre.strip(),
-        release=payload.release,
-        description=payload.description.strip(),
-        duration=payload.duration,
-    )
-    movies[index] = updated.model_dump(mode="json")
-    save_all(movies)
+    with movie_repo.write_lock:
+        movies = load_all()
+        index = find_dict_by_id(movies, "id", movie_id)
+        if index == NOT_FOUND:
+            raise HTTPException(status_code=404, detail=f"Movie '{movie_id}' not found")
+        updated = Movie(
+            id=movie_id,
+            title=payload.title.strip(),
+            genre=payload.genre.strip(),
+            release=payload.release,
+            description=payload.description.strip(),
+            duration=payload.duration,
+        )
+        movies[index] = updated.model_dump(mode="json")
+        save_all(movies)
     return updated
 
 
 def delete_movie(movie_id: str) -> None:
-    movies = load_all()
-    new_movies = [movie for movie in movies if movie.get("id") != movie_id]
-    if len(new_movies) == len(movies):
-        raise HTTPException(status_code=404, detail=f"Movie '{movie_id}' not found")
-    save_all(new_movies)
+    with movie_repo.write_lock:
+        movies = load_all()
+        new_movies = [movie for movie in movies if movie.get("id") != movie_id]
+        if len(new_movies) == len(movies):
+            raise HTTPException(status_code=404, detail=f"Movie '{movie_id}' not found")
+        save_all(new_movies)
 
 
 async def cache_tmdb_movie(movie_id: str) -> Movie:
-    """Fetch TMDb movie and cache to local movies.json. Returns existing if cached."""
-    movies = load_all()
+    """Fetch TMDb movie and cache to local movies.json. Returns existing if cached.
 
-    existing = next((m for m in movies if m.get("id") == movie_id), None)
+    Concurrent calls for the same movie share one import, so the movie is
+    fetched and appended once.
+    """
+    existing = next((m for m in load_all() if m.get("id") == movie_id), None)
     if existing:
         return Movie(**existing)
 
     tmdb_id = validate_tmdb_movie_id(movie_id)
+    return await _tmdb_imports.do(movie_id, lambda: _import_tmdb_movie(movie_id, tmdb_id))
+
+
+async def _import_tmdb_movie(movie_id: str, tmdb_id: int) -> Movie:
     tmdb_data = await get_tmdb_movie_details(tmdb_id)
 
     if not tmdb_data:
         raise HTTPException(status_code=404, detail=f"TMDb movie '{movie_id}' not found")
 
-    movie_dict = _parse_tmdb_to_movie_dict(movie_id, tmdb_data)
-    new_movie = Movie(**movie_dict)
+    # The file work blocks and may wait on write_lock, so keep it off the event loop.
+    return await asyncio.to_thread(_save_tmdb_movie, movie_id, tmdb_data)
+
 
-    movies.append(new_movie.model_dump(mode="json"))
-    save_all(movies)
+def _save_tmdb_movie(movie_id: str, tmdb_data: Dict[str, Any]) -> Movie:
+    with movie_repo.write_lock:
+        # Reload after the fetch: another import may have saved in the meantime.
+        movies = load_all()
+        existing = next((m for m in movies if m.get("id") == movie_id), None)
+        if existing:
+            return Movie(**existing)
+
+        movie_dict = _parse_tmdb_to_movie_dict(movie_id, tmdb_data)
+        new_movie = Movie(**movie_dict)
+
+        movies.append(new_movie.model_dump(mode="json"))
+        save_all(movies)
 
     return new_movie
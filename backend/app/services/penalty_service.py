@@ -41,6 +41,7 @@ def unwarn_user(user_id: str) -> User:
 def ban_user(user_id: str) -> User:
     user = get_user_by_id(user_id, show_password=True)
     user.active = False
+    user.token_epoch += 1  # revoke tokens issued before the ban
     _save_updated_user(user, user_id)
     logger.error(
         "User banned by admin",
@@ -0,0 +1,143 @@
+"""Filter and sort reviews over the columns of a ReviewStore.
+
+Filters become NumPy boolean masks over whole columns and sorts become a
+single `lexsort` over the selected rows, so no per-review Python callable
+runs and no per-review dicts are built.
+
+Ordering rules, kept from the original dict-based sorts:
+
+- rating: reviews without a numeric rating come first in both directions;
+- movieId / movieTitle: reviews whose movieId is not a string come first
+  ascending and last descending;
+- votes: ties broken by date in the same direction;
+- every sort is stable, so remaining ties keep file order.
+"""
+from dataclasses import dataclass
+from datetime import date
+from typing import Any, Dict, List, Optional, Sequence
+
+import numpy as np
+
+from app.repositories.review_store import FLAGGED, NO_DATE, VISIBLE, ReviewStore
+
+SORT_KEYS = ("rating", "votes", "date", "movieid", "movietitle")
+
+
+@dataclass
+class ReviewQuery:
+    """Which reviews to select and how to order them. None means "any"."""
+    rating: Optional[float] = None
+    min_rating: Optional[float] = None
+    max_rating: Optional[float] = None
+    date_from: Optional[date] = None
+    date_to: Optional[date] = None
+    visible: Optional[bool] = True
+    flagged: Optional[bool] = None
+    movie_id: Optional[Any] = None
+    author_id: Optional[Any] = None
+    sort_by: Optional[str] = None
+    order: str = "asc"
+
+
+def _movie_ranks(store: ReviewStore, sort_key: str, movie_titles: Dict[str, str]) -> List[int]:
+    """Rank of every movie code under the movieId/movieTitle sort; equal keys share a rank."""
+    def key(movie_id: Any):
+        if not isinstance(movie_id, str):
+            return (0, "")
+        return (1, movie_id if sort_key == "movieid" else movie_titles.get(movie_id, ""))
+
+    keys = [key(movie_id) for movie_id in store.movie_table.values]
+    ranks = [0] * len(keys)
+    rank, previous = -1, None
+    for code in sorted(range(len(keys)), key=keys.__getitem__):
+        if keys[code] != previous:
+            rank, previous = rank + 1, keys[code]
+        ranks[code] = rank
+    return ranks
+
+
+def _codes(store: ReviewStore, query: ReviewQuery) -> tuple:
+    """movieId/authorId filters as store codes; -1 when the value never occurs."""
+    movie = author = None
+    if query.movie_id is not None:
+        movie = store.movie_code(query.movie_id)
+        movie = -1 if movie is None else movie
+    if query.author_id is not None:
+        author = store.author_code(query.author_id)
+        if author is None:
+            # Query strings are text, but system reviews use the integer author -1.
+            wanted = str(query.author_id)
+            author = next((code for code, value in enumerate(store.author_table.values) if str(value) == wanted), -1)
+    return movie, author
+
+
+def _ordinal(value: Optional[date]) -> Optional[int]:
+    return value.toordinal() if value is not None else None
+
+
+def _column(values) -> "np.ndarray":
+    return np.frombuffer(values, dtype=values.typecode) if len(values) else np.zeros(0, dtype=values.typecode)
+
+
+def filter_positions(store: ReviewStore, query: ReviewQuery) -> "np.ndarray":
+    """Positions of the reviews matching `query`'s filters, in file order."""
+    n = len(store)
+    mask = np.ones(n, dtype=bool)
+    ratings, flags = _column(store.ratings), _column(store.flags)
+    dates = _column(store.dates)
+    if query.visible is not None:
+        mask &= ((flags & VISIBLE) != 0) == query.visible
+    if query.flagged is not None:
+        mask &= ((flags & FLAGGED) != 0) == query.flagged
+    if query.rating is not None:
+        mask &= ratings == float(query.rating)
+    if query.min_rating is not None:
+        mask &= ratings >= float(query.min_rating)
+    if query.max_rating is not None:
+        mask &= ratings <= float(query.max_rating)
+    if query.date_from is not None:
+        mask &= dates >= _ordinal(query.date_from)
+    if query.date_to is not None:
+        mask &= (dates <= _ordinal(query.date_to)) & (dates != NO_DATE)
+    movie, author = _codes(store, query)
+    if movie is not None:
+        mask &= _column(store.movies) == movie
+    if author is not None:
+        mask &= _column(store.authors) == author
+    return np.flatnonzero(mask)
+
+
+def _sort(store: ReviewStore, positions: "np.ndarray", query: ReviewQuery,
+                movie_titles: Dict[str, str]) -> "np.ndarray":
+    key = (query.sort_by or "").lower()
+    if key not in SORT_KEYS or len(positions) == 0:
+        return positions
+    sign = -1 if query.order.lower() == "desc" else 1
+    if key == "rating":
+        ratings = _column(store.ratings)[positions]
+        missing = np.isnan(ratings)
+        keys = (sign * np.where(missing, 0.0, ratings), ~missing)
+    elif key == "votes":
+        dates = _column(store.dates)[positions].astype(np.int64)
+        keys = (sign * dates, sign * _column(store.votes)[positions])
+    elif key == "date":
+        keys = (sign * _column(store.dates)[positions].astype(np.int64),)
+    else:
+        ranks = np.asarray(_movie_ranks(store, key, movie_titles), dtype=np.int64)
+        keys = (sign * ranks[_column(store.movies)[positions]],)
+    # lexsort sorts by the last key first and is stable, so ties keep file order.
+    return positions[np.lexsort(keys)]
+
+
+def sort_positions(store: ReviewStore, positions: Sequence[int], query: ReviewQuery,
+                   movie_titles: Optional[Dict[str, str]] = None) -> Sequence[int]:
+    """Order selected `positions` by `query.sort_by`/`query.order`.
+
+    `movie_titles` maps movieId to title and is only needed for movieTitle sorts.
+    """
+    return _sort(store, np.asarray(positions, dtype=np.intp), query, movie_titles or {})
+
+
+def select(store: ReviewStore, query: ReviewQuery, movie_titles: Optional[Dict[str, str]] = None) -> Sequence[int]:
+    """Positions of the reviews matching `query`, in its sort order."""
+    return sort_positions(store, filter_positions(store, query), query, movie_titles)
@@ -1,33 +1,21 @@
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Sequence
 from datetime import datetime, date
 from math import ceil
 from fastapi import HTTPException
 from app.schemas.review import Review, ReviewCreate, ReviewUpdate, ReviewWithMovie, PaginatedReviews
-from app.repositories.review_repo import load_all, save_all
+from app.repositories.review_repo import load_all, load_store, save_all, with_text
+from app.repositories.review_store import ReviewRow, ReviewStore
 from app.utils.list_helpers import find_dict_by_id, NOT_FOUND
-from app.repositories import movie_repo
+from app.repositories import movie_repo, comments_repo
 from app.services.tmdb_service import is_tmdb_movie_id
 from app.services.movie_service import cache_tmdb_movie
+from app.services import review_query
+from app.services.review_query import ReviewQuery
 
 REVIEW_NOT_FOUND = "Review not found"
 DEFAULT_PAGE_SIZE = 20
 
 
-def _to_float(val: Any) -> Optional[float]:
-    try:
-        return float(val)
-    except (TypeError, ValueError):
-        return None
-
-def _filter_by_rating_dicts(
-    reviews: List[Dict[str, Any]], rating: Optional[float]
-) -> List[Dict[str, Any]]:
-    if rating is None:
-        return list(reviews)
-    target = _to_float(rating)
-    return [rv for rv in reviews if _to_float(rv.get("rating")) == target]
-
-
 def _get_movie_title(
     raw_movie_id: Any,
     id_to_title: Dict[str, str],
@@ -39,39 +27,25 @@ def _get_movie_title(
     return default
 
 
-def _matches_search_query(
-    rv: Dict[str, Any],
-    query: str,
-    id_to_title: Dict[str, str],
-) -> bool:
-    """Check if a review matches a search query (title, body, or movie title)."""
-    if query in rv.get("reviewTitle", "").lower():
-        return True
-    if query in rv.get("reviewBody", "").lower():
-        return True
-    movie_title = _get_movie_title(rv.get("movieId"), id_to_title)
-    return query in movie_title.lower()
-
-
 def _filter_by_search(
-    reviews: List[Dict[str, Any]],
+    store: ReviewStore,
+    positions: Sequence[int],
     search: Optional[str],
     id_to_title: Dict[str, str],
-) -> List[Dict[str, Any]]:
-    """Filter reviews by search query (title, body, or movie title)."""
+) -> Sequence[int]:
+    """Keep reviews whose title, body or movie title contains the search query."""
     if not search:
-        return reviews
+        return positions
     query = search.lower()
-    return [rv for rv in reviews if _matches_search_query(rv, query, id_to_title)]
-
-def _make_rating_sort_key(descending: bool = False):
-    def _key(rv: Dict[str, Any]):
-        val = _to_float(rv.get("rating"))
-        if val is None:
-            return (0, 0.0)
-        return (1, -val) if descending else (1, val)
+    # The movie title test only depends on the movie, so run it once per movie.
+    title_match = [
+        query in _get_movie_title(movie_id, id_to_title).lower()
+        for movie_id in store.movie_table.values
+    ]
+    text_match = store.text_matches(query)
+    movies = store.movies
+    return [pos for pos in positions if title_match[movies[pos]] or pos in text_match]
 
-    return _key
 
 def _build_movie_title_index() -> Dict[str, str]:
     movies = movie_repo.load_all()
@@ -81,54 +55,9 @@ def _build_movie_title_index() -> Dict[str, str]:
         if isinstance(mv.get("id"), str)
     }
 
-def _make_movie_id_sort_key():
-    def _key(rv: Dict[str, Any]):
-        mid = rv.get("movieId")
-        if not isinstance(mid, str):
-            return (0, "")
-        return (1, mid)
-
-    return _key
-
-def _make_movie_title_sort_key(
-    id_to_title: Dict[str, str]
-):
-    def _key(rv: Dict[str, Any]):
-        mid = rv.get("movieId")
-        if not isinstance(mid, str):
-            return (0, "")
-        return (1, id_to_title.get(mid, ""))
-
-    return _key
-
-def _sort_reviews(
-    reviews: List[Dict[str, Any]],
-    sort_by: Optional[str],
-    order: str,
-    id_to_title: Dict[str, str],
-) -> List[Dict[str, Any]]:
-    """Apply sorting to a list of review dicts."""
-    if not sort_by:
-        return reviews
-
-    key_name = sort_by.lower()
-    descending = order.lower() == "desc"
-
-    if key_name == "rating":
-        return sorted(reviews, key=_make_rating_sort_key(descending))
-
-    if key_name in ("movieid", "movietitle"):
-        if key_name == "movieid":
-            sort_key = _make_movie_id_sort_key()
-        else:
-            sort_key = _make_movie_title_sort_key(id_to_title)
-        return sorted(reviews, key=sort_key, reverse=descending)
-
-    return reviews
-
 def _paginate(
-    items: List[Dict[str, Any]], page: int, per_page: int
-) -> tuple[List[Dict[str, Any]], int, int]:
+    items: Sequence[int], page: int, per_page: int
+) -> tuple[Sequence[int], int, int]:
     """Return (paginated_items, total, total_pages)."""
     total = len(items)
     total_pages = ceil(total / per_page) if per_page > 0 else 1
@@ -136,16 +65,22 @@ def _paginate(
     return items[start : start + per_page], total, total_pages
 
 def _enrich_with_movie_titles(
-    reviews: List[Dict[str, Any]],
+    rows: List[ReviewRow],
     id_to_title: Dict[str, str],
 ) -> List[ReviewWithMovie]:
-    """Convert review dicts to ReviewWithMovie models with titles."""
+    """Convert review rows to ReviewWithMovie models with titles and comment counts."""
+    comment_counts = comments_repo.count_by_review_id()
     result = []
-    for review in reviews:
+    for row in rows:
+        review = row.to_dict()
         movie_id = review.get("movieId")
         title = _get_movie_title(movie_id, id_to_title, "Unknown Movie")
         review_data = {**review, "movieId": str(movie_id or "")}
-        result.append(ReviewWithMovie(**review_data, movieTitle=title))
+        result.append(ReviewWithMovie(
+            **review_data,
+            movieTitle=title,
+            commentCount=comment_counts.get(review.get("id"), 0),
+        ))
     return result
 
 def filter_and_sort_reviews(
@@ -155,29 +90,50 @@ def filter_and_sort_reviews(
     order: str = "asc",
 ) -> List[Review]:
     """Filter and sort reviews, returning Review models."""
-    reviews_raw = load_all()
-    result = _filter_by_rating_dicts(reviews_raw, rating)
-    id_to_title = _build_movie_title_index()
-    result = _sort_reviews(result, sort_by, order, id_to_title)
-    return [Review(**review) for review in result]
+    store = load_store()
+    query = ReviewQuery(rating=rating, sort_by=sort_by, order=order)
+    id_to_title = _build_movie_title_index() if (sort_by or "").lower() == "movietitle" else {}
+    positions = review_query.select(store, query, id_to_title)
+    return [Review(**row.to_dict()) for row in store.rows(positions)]
 
 def list_reviews_paginated(
     *,
     rating: Optional[float] = None,
+    min_rating: Optional[float] = None,
+    max_rating: Optional[float] = None,
+    date_from: Optional[date] = None,
+    date_to: Optional[date] = None,
+    movie_id: Optional[str] = None,
+    author_id: Optional[str] = None,
     search: Optional[str] = None,
     sort_by: Optional[str] = None,
     order: str = "asc",
     page: int = 1,
     per_page: int = DEFAULT_PAGE_SIZE,
 ) -> PaginatedReviews:
-    """Return paginated reviews with movie titles."""
-    reviews_raw = load_all()
-    filtered = _filter_by_rating_dicts(reviews_raw, rating)
+    """Return paginated reviews with movie titles.
+
+    Filters and sorts run over the review store's columns; only the rows on
+    the requested page are turned into models.
+    """
+    store = load_store()
+    query = ReviewQuery(
+        rating=rating,
+        min_rating=min_rating,
+        max_rating=max_rating,
+        date_from=date_from,
+        date_to=date_to,
+        movie_id=movie_id,
+        author_id=author_id,
+        sort_by=sort_by,
+        order=order,
+    )
     id_to_title = _build_movie_title_index()
-    filtered = _filter_by_search(filtered, search, id_to_title)
-    sorted_reviews = _sort_reviews(filtered, sort_by, order, id_to_title)
-    paginated, total, total_pages = _paginate(sorted_reviews, page, per_page)
-    reviews_with_movies = _enrich_with_movie_titles(paginated, id_to_title)
+    positions = review_query.filter_positions(store, query)
+    positions = _filter_by_search(store, positions, search, id_to_title)
+    positions = review_query.sort_positions(store, positions, query, id_to_title)
+    paginated, total, total_pages = _paginate(positions, page, per_page)
+    reviews_with_movies = _enrich_with_movie_titles(store.rows(paginated), id_to_title)
 
     return PaginatedReviews(
         reviews=reviews_with_movies,
@@ -200,16 +156,9 @@ def get_leaderboard_reviews(limit: int = 10) -> List[Review]:
     """Return top reviews ranked by votes (descending), limited to `limit`.
     Ties on votes are broken by review date (most recent first).
     """
-    reviews = list_reviews()
-    sorted_reviews = sorted(
-        reviews,
-        key=lambda r: (
-            getattr(r, "votes", 0),
-            getattr(r, "date", None) or date.min,
-        ),
-        reverse=True,
-    )
-    return sorted_reviews[:limit]
+    store = load_store()
+    positions = review_query.select(store, ReviewQuery(sort_by="votes", order="desc"))
+    return [Review(**row.to_dict()) for row in store.rows(positions[:limit])]
 
 def get_review_by_id(review_id: int) -> Review:
     """Get a review by ID."""
@@ -217,7 +166,7 @@ def get_review_by_id(review_id: int) -> Review:
     index = find_dict_by_id(reviews, "id", review_id)
     if index == NOT_FOUND:
         raise HTTPException(status_code=404, detail=REVIEW_NOT_FOUND)
-    return Review(**reviews[index])
+    return Review(**with_text([reviews[index]])[0])
 
 async def create_review(payload: ReviewCreate, *, author_id: str) -> Review:
     """Create a new review. For TMDb movies, caches to local movies.json."""
@@ -276,7 +225,11 @@ def update_review(review_id: int, payload: ReviewUpdate) -> Review:
     return updated_review
 
 def delete_review(review_id: int):
-    """Delete a review by ID."""
+    """Delete a review by ID along with its comments.
+
+    Review ids are reused (max + 1), so leftover comments would otherwise
+    reappear under the next review created.
+    """
     reviews = load_all(load_invisible=True)
     index = find_dict_by_id(reviews, "id", review_id)
     
@@ -285,6 +238,7 @@ def delete_review(review_id: int):
     
     reviews.pop(index)
     save_all(reviews)
+    comments_repo.delete_by_review_id(review_id)
 
 def increment_vote(review_id: int) -> None:
     """Increment the vote count for a review."""
@@ -299,7 +253,7 @@ def increment_vote(review_id: int) -> None:
 
 def mark_review_as_flagged(review: Review) -> None:
     """Mark a review as flagged"""
-    reviews = load_all()
+    reviews = load_all(load_invisible=True)
     index = find_dict_by_id(reviews, "id", review.id)
     
     if index == NOT_FOUND:
@@ -322,8 +276,5 @@ def mark_review_as_unflagged(review: Review) -> None:
     
 
 def get_reviews_by_author(user_id: str) -> List[Review]:
-    results = []
-    for rv in load_all():
-        if rv.get("authorId") == user_id:
-            results.append(Review(**rv))
-    return results
+    own = [rv for rv in load_all() if rv.get("authorId") == user_id]
+    return [Review(**rv) for rv in with_text(own)]
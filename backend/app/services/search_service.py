@@ -1,9 +1,9 @@
-from typing import Dict, List, Set, Optional
+from typing import Any, Dict, List, Set, Optional
 
 from app.schemas.search import MovieSearch, MovieWithReviews
 from app.schemas.review import Review
 from app.repositories.movie_repo import load_all as load_movies
-from app.repositories.review_repo import load_all as load_reviews
+from app.repositories.review_repo import load_all as load_reviews, with_text
 
 
 def _matching_movie_ids(search: MovieSearch) -> Set[str]:
@@ -54,7 +54,7 @@ def _iter_matching_reviews(search: MovieSearch, *, page: int, per_page: int) ->
     start = (page - 1) * per_page
     taken = 0
     seen = 0
-    results: List[Review] = []
+    rows: List[Dict[str, Any]] = []
 
     for rv in load_reviews():
         resolved = _resolve_movie_id(rv.get("movieId"), legacy_map)
@@ -65,12 +65,12 @@ def _iter_matching_reviews(search: MovieSearch, *, page: int, per_page: int) ->
             continue
         rv_copy = dict(rv)
         rv_copy["movieId"] = resolved
-        results.append(Review(**rv_copy))
+        rows.append(rv_copy)
         taken += 1
         seen += 1
         if taken >= per_page:
-            return results
-    return results
+            break
+    return [Review(**rv) for rv in with_text(rows)]
 
 
 def all_matching_reviews(search: MovieSearch) -> List[Review]:
@@ -79,15 +79,15 @@ def all_matching_reviews(search: MovieSearch) -> List[Review]:
         return []
 
     legacy_map = _legacy_index_to_id_map()
-    results: List[Review] = []
+    rows: List[Dict[str, Any]] = []
     for rv in load_reviews():
         resolved = _resolve_movie_id(rv.get("movieId"), legacy_map)
         if resolved is None or resolved not in matched_movie_ids:
             continue
         rv_copy = dict(rv)
         rv_copy["movieId"] = resolved
-        results.append(Review(**rv_copy))
-    return results
+        rows.append(rv_copy)
+    return [Review(**rv) for rv in with_text(rows)]
 
 
 def search_reviews_by_title(search: MovieSearch, *, page: int = 1, per_page: int = 50) -> List[Review]:
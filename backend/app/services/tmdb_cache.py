@@ -0,0 +1,239 @@
+"""Two-tier cache for TMDb responses: in-memory LRU with TTL over a sqlite store."""
+import asyncio
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+DEFAULT_CACHE_PATH = Path(__file__).resolve().parents[1] / "data" / "tmdb_cache.sqlite3"
+
+TMDB_CACHE_PATH = os.getenv("TMDB_CACHE_PATH", str(DEFAULT_CACHE_PATH))  # empty disables the disk tier
+TMDB_CACHE_SIZE = int(os.getenv("TMDB_CACHE_SIZE", "1024"))
+TMDB_CACHE_TTL = float(os.getenv("TMDB_CACHE_TTL", str(24 * 3600)))
+TMDB_SEARCH_CACHE_TTL = float(os.getenv("TMDB_SEARCH_CACHE_TTL", str(3600)))
+TMDB_NEGATIVE_CACHE_TTL = float(os.getenv("TMDB_NEGATIVE_CACHE_TTL", "300"))
+# How long past expiry an entry may still be served while TMDb is unavailable.
+TMDB_STALE_TTL = float(os.getenv("TMDB_STALE_TTL", str(7 * 24 * 3600)))
+
+MISS = object()
+
+
+def search_key(query: str) -> str:
+    """Normalize search text so case and spacing variants share one entry."""
+    return "search:" + " ".join((query or "").split()).casefold()
+
+
+def details_key(tmdb_id: int) -> str:
+    return f"movie:{int(tmdb_id)}"
+
+
+class MemoryTTLCache:
+    """Least-recently-used cache whose entries also expire after a TTL."""
+
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self._entries: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str, now: float) -> Any:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return MISS
+            expires_at, value = entry
+            if expires_at <= now:
+                return MISS  # kept until evicted so it can be served stale
+            self._entries.move_to_end(key)
+            return value
+
+    def peek(self, key: str) -> Tuple[Any, Optional[float]]:
+        """Return (value, expires_at) ignoring expiry, or (MISS, None)."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return MISS, None
+            return entry[1], entry[0]
+
+    def set(self, key: str, value: Any, expires_at: float) -> None:
+        with self._lock:
+            self._entries[key] = (expires_at, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class SqliteCacheStore:
+    """Persistent key/value store with per-entry expiry that survives restarts."""
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS tmdb_cache (key TEXT PRIMARY KEY, value TEXT NOT NULL, expires_at REAL NOT NULL)"
+        )
+        self._conn.commit()
+
+    def get(self, key: str, now: float) -> Tuple[Any, Optional[float]]:
+        value, expires_at = self.peek(key)
+        if value is MISS or expires_at <= now:
+            return MISS, None
+        return value, expires_at
+
+    def peek(self, key: str) -> Tuple[Any, Optional[float]]:
+        """Return (value, expires_at) ignoring expiry, or (MISS, None)."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value, expires_at FROM tmdb_cache WHERE key = ?", (key,)
+            ).fetchone()
+        if row is None:
+            return MISS, None
+        return json.loads(row[0]), row[1]
+
+    def set(self, key: str, value: Any, expires_at: float) -> None:
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO tmdb_cache (key, value, expires_at) VALUES (?, ?, ?)",
+                (key, json.dumps(value), expires_at),
+            )
+            self._conn.commit()
+
+    def purge_expired(self, now: float) -> int:
+        with self._lock:
+            removed = self._conn.execute("DELETE FROM tmdb_cache WHERE expires_at <= ?", (now,)).rowcount
+            self._conn.commit()
+            return removed
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+class TMDbResponseCache:
+    """Memory tier in front of an optional disk tier, with hit-rate counters.
+
+    Values must be JSON-serializable. Negative results (no match, 404) are
+    cached too, under a shorter TTL.
+    """
+
+    def __init__(self, max_size: int = TMDB_CACHE_SIZE, path: Optional[str] = TMDB_CACHE_PATH, clock=time.time):
+        self.memory = MemoryTTLCache(max_size)
+        self.disk = SqliteCacheStore(Path(path)) if path else None
+        self._clock = clock
+        self._stats_lock = threading.Lock()
+        self._stats = {"memory_hits": 0, "disk_hits": 0, "negative_hits": 0, "misses": 0, "stores": 0, "stale_hits": 0}
+        if self.disk is not None:
+            self.disk.purge_expired(clock() - TMDB_STALE_TTL)
+
+    def _count(self, name: str) -> None:
+        with self._stats_lock:
+            self._stats[name] += 1
+
+    def get(self, key: str) -> Any:
+        """Return the cached value (which may be a cached negative) or MISS."""
+        now = self._clock()
+        value = self.memory.get(key, now)
+        if value is not MISS:
+            self._count("memory_hits")
+        elif self.disk is not None:
+            value, expires_at = self.disk.get(key, now)
+            if value is not MISS:
+                self._count("disk_hits")
+                self.memory.set(key, value, expires_at)
+        if value is MISS:
+            self._count("misses")
+        elif _is_negative(value):
+            self._count("negative_hits")
+        return value
+
+    def get_stale(self, key: str) -> Any:
+        """Return an entry even if expired (within TMDB_STALE_TTL), or MISS.
+
+        Used as a fallback while TMDb cannot be reached.
+        """
+        value, expires_at = self.memory.peek(key)
+        if value is MISS and self.disk is not None:
+            value, expires_at = self.disk.peek(key)
+        if value is MISS or expires_at + TMDB_STALE_TTL <= self._clock():
+            return MISS
+        self._count("stale_hits")
+        return value
+
+    def set(self, key: str, value: Any, ttl: float) -> None:
+        if _is_negative(value):
+            ttl = min(ttl, TMDB_NEGATIVE_CACHE_TTL)
+        expires_at = self._clock() + ttl
+        self.memory.set(key, value, expires_at)
+        if self.disk is not None:
+            self.disk.set(key, value, expires_at)
+        self._count("stores")
+
+    # Async variants for request handlers: sqlite calls block, so anything that
+    # may reach the disk tier runs in a worker thread instead of on the event loop.
+
+    async def aget(self, key: str) -> Any:
+        if self.disk is None or self.memory.get(key, self._clock()) is not MISS:
+            return self.get(key)
+        return await asyncio.to_thread(self.get, key)
+
+    async def aget_stale(self, key: str) -> Any:
+        if self.disk is None:
+            return self.get_stale(key)
+        return await asyncio.to_thread(self.get_stale, key)
+
+    async def aset(self, key: str, value: Any, ttl: float) -> None:
+        if self.disk is None:
+            return self.set(key, value, ttl)
+        await asyncio.to_thread(self.set, key, value, ttl)
+
+    def clear_memory(self) -> None:
+        self.memory.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._stats_lock:
+            stats = dict(self._stats)
+        lookups = stats["memory_hits"] + stats["disk_hits"] + stats["misses"]
+        stats["lookups"] = lookups
+        stats["hit_rate"] = round((stats["memory_hits"] + stats["disk_hits"]) / lookups, 4) if lookups else 0.0
+        stats["memory_entries"] = len(self.memory)
+        stats["disk_enabled"] = self.disk is not None
+        return stats
+
+    def close(self) -> None:
+        if self.disk is not None:
+            self.disk.close()
+
+
+def _is_negative(value: Any) -> bool:
+    return value is None or value == []
+
+
+_cache: Optional[TMDbResponseCache] = None
+
+
+def get_cache() -> TMDbResponseCache:
+    """Return the process-wide TMDb cache, opening it on first use."""
+    global _cache
+    if _cache is None:
+        _cache = TMDbResponseCache()
+    return _cache
+
+
+def set_cache(cache: Optional[TMDbResponseCache]) -> None:
+    """Swap the process-wide cache (tests, alternative storage)."""
+    global _cache
+    if _cache is not None and _cache is not cache:
+        _cache.close()
+    _cache = cache
@@ -0,0 +1,117 @@
+"""Import TMDb daily exports into the local catalog and search it."""
+import gzip
+import json
+import os
+from pathlib import Path
+from typing import Any, Dict, IO, Iterator, List, NamedTuple, Optional
+
+import app.repositories.tmdb_catalog_repo as catalog_repo
+from app.services.tmdb_service import build_image_url
+from app.utils.logger import get_logger
+
+TMDB_CATALOG_BATCH_SIZE = int(os.getenv("TMDB_CATALOG_BATCH_SIZE", "5000"))
+
+logger = get_logger()
+
+
+class ImportResult(NamedTuple):
+    imported: int
+    skipped: int
+    malformed: int
+
+
+def _open_export(path: Path) -> IO[str]:
+    if path.suffix == ".gz":
+        return gzip.open(path, "rt", encoding="utf-8")
+    return path.open("r", encoding="utf-8")
+
+
+def _to_row(entry: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """Map one export line to a catalog row, or None if it has no usable id/title."""
+    tmdb_id = entry.get("id")
+    title = entry.get("title") or entry.get("original_title")
+    if not isinstance(tmdb_id, int) or not title:
+        return None
+    return {
+        "tmdb_id": tmdb_id,
+        "title": title,
+        "release_date": entry.get("release_date") or "",
+        "poster_path": entry.get("poster_path"),
+        "overview": entry.get("overview") or "",
+        "popularity": float(entry.get("popularity") or 0),
+    }
+
+
+def iter_export(path: Path, include_adult: bool = False, counts: Optional[Dict[str, int]] = None) -> Iterator[Dict[str, Any]]:
+    """Yield catalog rows from a newline-delimited JSON export, one line at a time.
+
+    Accepts plain or gzipped files. Adult titles and videos are skipped
+    unless asked for. Undecodable lines are counted in `counts["malformed"]`.
+    """
+    counts = counts if counts is not None else {}
+    counts.setdefault("skipped", 0)
+    counts.setdefault("malformed", 0)
+    with _open_export(Path(path)) as export:
+        for line in export:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                entry = json.loads(line)
+            except json.JSONDecodeError:
+                counts["malformed"] += 1
+                continue
+            if not isinstance(entry, dict):
+                counts["malformed"] += 1
+                continue
+            if (entry.get("adult") and not include_adult) or entry.get("video"):
+                counts["skipped"] += 1
+                continue
+            row = _to_row(entry)
+            if row is None:
+                counts["malformed"] += 1
+                continue
+            yield row
+
+
+def import_export(path: Path, batch_size: int = TMDB_CATALOG_BATCH_SIZE, include_adult: bool = False) -> ImportResult:
+    """Stream an export into a fresh catalog, holding at most one batch in memory."""
+    counts: Dict[str, int] = {}
+    writer = catalog_repo.CatalogWriter()
+    batch: List[Dict[str, Any]] = []
+    try:
+        for row in iter_export(path, include_adult=include_adult, counts=counts):
+            batch.append(row)
+            if len(batch) >= batch_size:
+                writer.add_batch(batch)
+                batch = []
+        if batch:
+            writer.add_batch(batch)
+        writer.finish()
+    except BaseException:
+        writer.abort()
+        raise
+    result = ImportResult(writer.count, counts["skipped"], counts["malformed"])
+    logger.info(
+        f"Imported {result.imported} movies into the TMDb catalog",
+        component="tmdb",
+        source=str(path),
+        skipped=result.skipped,
+        malformed=result.malformed,
+    )
+    return result
+
+
+def search_catalog(query: str, limit: int = 10) -> List[Dict[str, Any]]:
+    """Search the local catalog. Rows use the same shape as search_tmdb_movies."""
+    return [
+        {
+            "tmdb_id": row["tmdb_id"],
+            "title": row["title"],
+            "overview": row["overview"] or "",
+            "release_date": row["release_date"] or "",
+            "poster_path": row["poster_path"],
+            "poster_url": build_image_url(row["poster_path"]),
+        }
+        for row in catalog_repo.search(query, limit)
+    ]
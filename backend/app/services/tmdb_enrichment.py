@@ -0,0 +1,197 @@
+"""Background worker that fills in missing TMDb fields on cached movies."""
+import asyncio
+import os
+import threading
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional, Set
+
+from fastapi import HTTPException
+
+import app.repositories.movie_repo as movie_repo
+from app.services.tmdb_service import get_tmdb_movie_details, extract_tmdb_id, is_tmdb_movie_id
+from app.utils.logger import get_logger
+
+TMDB_ENRICH_CONCURRENCY = int(os.getenv("TMDB_ENRICH_CONCURRENCY", "4"))
+TMDB_ENRICH_BATCH_SIZE = int(os.getenv("TMDB_ENRICH_BATCH_SIZE", "50"))
+TMDB_ENRICH_BATCH_DELAY = float(os.getenv("TMDB_ENRICH_BATCH_DELAY", "0.5"))  # seconds to gather a batch
+TMDB_ENRICH_MAX_PENDING = int(os.getenv("TMDB_ENRICH_MAX_PENDING", "1000"))
+# How long to wait before asking TMDb again about a movie it had no poster or description for.
+TMDB_ENRICH_RETRY_AFTER = float(os.getenv("TMDB_ENRICH_RETRY_AFTER", str(7 * 24 * 3600)))
+
+# Set on a movie when TMDb has answered an enrichment request for it.
+ENRICHED_AT_FIELD = "tmdbEnrichedAt"
+
+logger = get_logger()
+
+
+def needs_enrichment(movie: Dict[str, Any], now: Optional[datetime] = None) -> bool:
+    """TMDb movies cached without a poster or description.
+
+    Movies TMDb was already asked about are skipped until
+    TMDB_ENRICH_RETRY_AFTER has passed, since TMDb may simply not have them.
+    """
+    movie_id = str(movie.get("id") or "")
+    if not is_tmdb_movie_id(movie_id) or (movie.get("posterUrl") and movie.get("description")):
+        return False
+    try:
+        enriched_at = datetime.fromisoformat(movie.get(ENRICHED_AT_FIELD) or "")
+    except (TypeError, ValueError):
+        return True
+    now = now or datetime.now(timezone.utc)
+    return now - enriched_at >= timedelta(seconds=TMDB_ENRICH_RETRY_AFTER)
+
+
+class EnrichmentWorker:
+    """Deduplicated queue of movie ids drained by an asyncio task.
+
+    `enqueue` is safe to call from request threads. The worker fetches
+    details with at most `concurrency` TMDb calls in flight and applies a
+    whole batch with one movies.json write.
+    """
+
+    def __init__(
+        self,
+        concurrency: int = TMDB_ENRICH_CONCURRENCY,
+        batch_size: int = TMDB_ENRICH_BATCH_SIZE,
+        batch_delay: float = TMDB_ENRICH_BATCH_DELAY,
+        max_pending: int = TMDB_ENRICH_MAX_PENDING,
+    ):
+        self.concurrency = concurrency
+        self.batch_size = batch_size
+        self.batch_delay = batch_delay
+        self.max_pending = max_pending
+        self._lock = threading.Lock()
+        self._pending: Set[str] = set()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._wakeup: Optional[asyncio.Event] = None
+        self._task: Optional[asyncio.Task] = None
+        self._stats = {"enqueued": 0, "enriched": 0, "failed": 0, "batches": 0, "dropped": 0}
+
+    def enqueue(self, movie_id: str) -> bool:
+        """Queue a movie for enrichment. Returns False if already queued or full."""
+        with self._lock:
+            if movie_id in self._pending:
+                return False
+            if len(self._pending) >= self.max_pending:
+                self._stats["dropped"] += 1
+                return False
+            self._pending.add(movie_id)
+            self._stats["enqueued"] += 1
+            loop, wakeup = self._loop, self._wakeup
+        if loop is not None and not loop.is_closed():
+            loop.call_soon_threadsafe(wakeup.set)
+        return True
+
+    def pending(self) -> List[str]:
+        with self._lock:
+            return sorted(self._pending)
+
+    async def start(self) -> None:
+        """Start draining the queue on the running loop. Called from the app lifespan."""
+        if self._task is not None:
+            return
+        self._loop = asyncio.get_running_loop()
+        self._wakeup = asyncio.Event()
+        if self._pending:
+            self._wakeup.set()
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        task, self._task = self._task, None
+        with self._lock:
+            self._loop, self._wakeup = None, None
+        if task is not None:
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+
+    async def _run(self) -> None:
+        while True:
+            await self._wakeup.wait()
+            await asyncio.sleep(self.batch_delay)
+            self._wakeup.clear()
+            try:
+                await self.drain()
+            except Exception as e:
+                logger.error(f"TMDb enrichment batch failed: {e}", component="tmdb")
+
+    async def drain(self) -> int:
+        """Process everything queued so far; returns how many movies were updated."""
+        updated = 0
+        while True:
+            with self._lock:
+                batch = sorted(self._pending)[: self.batch_size]
+            if not batch:
+                return updated
+            try:
+                updated += await self._process(batch)
+            finally:
+                with self._lock:
+                    self._pending.difference_update(batch)
+
+    async def _process(self, batch: List[str]) -> int:
+        semaphore = asyncio.Semaphore(self.concurrency)
+
+        async def fetch(movie_id: str) -> Optional[Dict[str, Any]]:
+            tmdb_id = extract_tmdb_id(movie_id)
+            if tmdb_id is None:
+                return None
+            async with semaphore:
+                try:
+                    return await get_tmdb_movie_details(tmdb_id)
+                except HTTPException as e:
+                    self._stats["failed"] += 1
+                    logger.warning(
+                        f"TMDb enrichment skipped {movie_id}: {e.detail}", component="tmdb", movie_id=movie_id
+                    )
+                    # TMDb has no such movie: record the attempt. Other errors may be transient.
+                    return {} if e.status_code == 404 else None
+
+        details = await asyncio.gather(*(fetch(movie_id) for movie_id in batch))
+        found = {movie_id: data for movie_id, data in zip(batch, details) if data is not None}
+        self._stats["batches"] += 1
+        if not found:
+            return 0
+        updated = await asyncio.to_thread(_apply_details, found)
+        self._stats["enriched"] += updated
+        return updated
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            stats = dict(self._stats)
+            stats["pending"] = len(self._pending)
+        stats["running"] = self._task is not None and not self._task.done()
+        return stats
+
+
+def _apply_details(found: Dict[str, Dict[str, Any]]) -> int:
+    """Merge fetched details into movies.json with a single write; returns how many movies gained fields.
+
+    Every movie in `found` is stamped with ENRICHED_AT_FIELD, even when
+    TMDb had nothing to add, so it is not queued again on every view.
+    """
+    enriched_at = datetime.now(timezone.utc).isoformat()
+    with movie_repo.write_lock:
+        movies = movie_repo.load_all()
+        updated = 0
+        touched = False
+        for movie in movies:
+            tmdb_data = found.get(movie.get("id"))
+            if tmdb_data is None:
+                continue
+            filled = False
+            for field, key in (("posterUrl", "poster_url"), ("description", "description"), ("genre", "genre")):
+                if not movie.get(field) and tmdb_data.get(key):
+                    movie[field] = tmdb_data[key]
+                    filled = True
+            updated += filled
+            movie[ENRICHED_AT_FIELD] = enriched_at
+            touched = True
+        if touched:
+            movie_repo.save_all(movies)
+    return updated
+
+
+worker = EnrichmentWorker()
@@ -0,0 +1,187 @@
+"""Client-side protection for TMDb calls: rate limiting, retry backoff and a circuit breaker."""
+import asyncio
+import os
+import random
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from typing import Any, Dict, Optional
+
+TMDB_RATE_LIMIT = float(os.getenv("TMDB_RATE_LIMIT", "40"))  # requests per second
+TMDB_RATE_BURST = int(os.getenv("TMDB_RATE_BURST", "40"))
+TMDB_MAX_RETRIES = int(os.getenv("TMDB_MAX_RETRIES", "2"))
+TMDB_RETRY_BASE_DELAY = float(os.getenv("TMDB_RETRY_BASE_DELAY", "0.5"))
+TMDB_RETRY_MAX_DELAY = float(os.getenv("TMDB_RETRY_MAX_DELAY", "10.0"))
+TMDB_BREAKER_THRESHOLD = int(os.getenv("TMDB_BREAKER_THRESHOLD", "5"))
+TMDB_BREAKER_RESET = float(os.getenv("TMDB_BREAKER_RESET", "30.0"))
+
+RETRYABLE_STATUS = frozenset({429, 500, 502, 503, 504})
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitOpenError(Exception):
+    """Raised instead of calling TMDb while the breaker is open."""
+
+    def __init__(self, retry_in: float):
+        super().__init__(f"TMDb circuit open, retry in {retry_in:.1f}s")
+        self.retry_in = retry_in
+
+
+class TokenBucket:
+    """Token bucket shared by every TMDb call in the process.
+
+    Each call reserves a token up front; when the bucket is empty the caller
+    sleeps until its token has refilled. `defer` holds all callers back, e.g.
+    for a Retry-After received by one of them.
+    """
+
+    def __init__(self, rate: float = TMDB_RATE_LIMIT, burst: int = TMDB_RATE_BURST, clock=time.monotonic):
+        self.rate = rate
+        self.burst = burst
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._tokens = float(burst)
+        self._updated = clock()
+        self._blocked_until = 0.0
+
+    def _reserve(self) -> float:
+        """Take a token and return how long the caller must wait for it."""
+        with self._lock:
+            now = self._clock()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+            return max(wait, self._blocked_until - now)
+
+    async def acquire(self) -> None:
+        if self.rate <= 0:
+            return
+        wait = self._reserve()
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+    def defer(self, seconds: float) -> None:
+        with self._lock:
+            self._blocked_until = max(self._blocked_until, self._clock() + seconds)
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            now = self._clock()
+            tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            return {
+                "rate_per_second": self.rate,
+                "burst": self.burst,
+                "available_tokens": round(max(tokens, 0.0), 2),
+                "blocked_for": round(max(self._blocked_until - now, 0.0), 2),
+            }
+
+
+class CircuitBreaker:
+    """Consecutive-failure breaker.
+
+    After `threshold` failures in a row the breaker opens and calls fail fast
+    for `reset_timeout` seconds. It then goes half-open: one trial call is let
+    through while the others keep failing fast, and the trial's outcome closes
+    the breaker or re-opens it. A trial that never reports back (e.g. it was
+    cancelled without calling `release`) stops blocking others after
+    `reset_timeout`.
+    """
+
+    def __init__(self, threshold: int = TMDB_BREAKER_THRESHOLD, reset_timeout: float = TMDB_BREAKER_RESET, clock=time.monotonic):
+        self.threshold = threshold
+        self.reset_timeout = reset_timeout
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._state = CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._total_opens = 0
+        self._probe_started: Optional[float] = None  # set while the half-open trial call runs
+
+    def _current_state(self, now: float) -> str:
+        if self._state == OPEN and now - self._opened_at >= self.reset_timeout:
+            self._state = HALF_OPEN
+        return self._state
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            return self._current_state(self._clock())
+
+    def before_call(self) -> bool:
+        """Raise CircuitOpenError if calls should not reach TMDb right now.
+
+        Returns True when this call is the half-open trial; such a caller must
+        report an outcome or `release` the trial.
+        """
+        with self._lock:
+            now = self._clock()
+            state = self._current_state(now)
+            if state == OPEN:
+                raise CircuitOpenError(self.reset_timeout - (now - self._opened_at))
+            if state == HALF_OPEN:
+                if self._probe_started is not None and now - self._probe_started < self.reset_timeout:
+                    raise CircuitOpenError(self.reset_timeout - (now - self._probe_started))
+                self._probe_started = now
+                return True
+            return False
+
+    def release(self) -> None:
+        """Give up an admitted call without an outcome, so half-open can admit another trial."""
+        with self._lock:
+            self._probe_started = None
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._state = CLOSED
+            self._failures = 0
+            self._probe_started = None
+
+    def record_failure(self) -> None:
+        with self._lock:
+            now = self._clock()
+            self._failures += 1
+            self._probe_started = None
+            state = self._current_state(now)
+            if state == HALF_OPEN or (state == CLOSED and self._failures >= self.threshold):
+                self._state = OPEN
+                self._opened_at = now
+                self._total_opens += 1
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            now = self._clock()
+            state = self._current_state(now)
+            retry_in = self.reset_timeout - (now - self._opened_at) if state == OPEN else 0.0
+            return {
+                "state": state,
+                "consecutive_failures": self._failures,
+                "threshold": self.threshold,
+                "retry_in": round(max(retry_in, 0.0), 2),
+                "total_opens": self._total_opens,
+            }
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Seconds to wait from a Retry-After header (delta-seconds or HTTP date)."""
+    if not value:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        return max(parsedate_to_datetime(value).timestamp() - time.time(), 0.0)
+    except (TypeError, ValueError):
+        return None
+
+
+def backoff_delay(attempt: int, retry_after: Optional[float] = None) -> float:
+    """Full-jitter exponential backoff, or the server's Retry-After plus jitter."""
+    if retry_after is not None:
+        return retry_after + random.uniform(0, TMDB_RETRY_BASE_DELAY)
+    return random.uniform(0, min(TMDB_RETRY_MAX_DELAY, TMDB_RETRY_BASE_DELAY * (2 ** attempt)))
@@ -1,13 +1,76 @@
 """TMDb API integration service."""
+import asyncio
 import httpx
+import importlib.util
 import os
-from typing import Optional, Dict, Any, List
+import re
+import time
+from contextlib import asynccontextmanager
+from typing import Optional, Dict, Any, List, AsyncIterator
 from fastapi import HTTPException
+from app.utils.logger import get_logger
+from app.utils.metrics import REGISTRY
+from app.utils.single_flight import SingleFlight
+from app.services.tmdb_cache import (
+    MISS,
+    TMDB_CACHE_TTL,
+    TMDB_NEGATIVE_CACHE_TTL,
+    TMDB_SEARCH_CACHE_TTL,
+    details_key,
+    get_cache,
+    search_key,
+)
+from app.services import tmdb_resilience
+from app.services.tmdb_resilience import (
+    RETRYABLE_STATUS,
+    CircuitBreaker,
+    CircuitOpenError,
+    TokenBucket,
+    backoff_delay,
+    parse_retry_after,
+)
 
 TMDB_API_KEY = os.getenv("TMDB_API_KEY", "")
-TMDB_BASE_URL = "https://api.themoviedb.org/3"
+TMDB_BASE_URL = os.getenv("TMDB_BASE_URL", "https://api.themoviedb.org/3").rstrip("/")  # e.g. app.cli.fake_tmdb
 TMDB_IMAGE_BASE = os.getenv("TMDB_IMAGE_BASE", "https://image.tmdb.org/t/p/w500")
 
+# Connection pool settings for the shared client opened by the app lifespan.
+TMDB_TIMEOUT = float(os.getenv("TMDB_TIMEOUT", "10.0"))
+TMDB_CONNECT_TIMEOUT = float(os.getenv("TMDB_CONNECT_TIMEOUT", "5.0"))
+TMDB_MAX_CONNECTIONS = int(os.getenv("TMDB_MAX_CONNECTIONS", "20"))
+TMDB_MAX_KEEPALIVE = int(os.getenv("TMDB_MAX_KEEPALIVE", "10"))
+TMDB_KEEPALIVE_EXPIRY = float(os.getenv("TMDB_KEEPALIVE_EXPIRY", "30.0"))
+TMDB_HTTP2 = os.getenv("TMDB_HTTP2", "false").lower() in ("1", "true", "yes")
+
+logger = get_logger()
+
+_client: Optional[httpx.AsyncClient] = None
+_client_loop: Optional[asyncio.AbstractEventLoop] = None
+
+# Concurrent identical lookups share one upstream request.
+_in_flight = SingleFlight()
+
+# Process-wide protection for the upstream API.
+_rate_limiter = TokenBucket()
+_breaker = CircuitBreaker()
+
+_requests_total = REGISTRY.counter(
+    "tmdb_requests_total", "Outbound TMDb requests by endpoint and outcome (status code or error).", ("endpoint", "outcome")
+)
+_request_seconds = REGISTRY.histogram(
+    "tmdb_request_duration_seconds", "Time for one TMDb HTTP request, in seconds.", ("endpoint",)
+)
+_NUMERIC_SEGMENT = re.compile(r"/\d+(?=/|$)")
+
+
+def _endpoint_label(endpoint: str) -> str:
+    """`/movie/603` -> `/movie/{id}`, so ids do not become separate series."""
+    return _NUMERIC_SEGMENT.sub("/{id}", endpoint)
+
+
+class TMDbUnavailableError(Exception):
+    """TMDb could not be reached: breaker open, or retries exhausted on a transient error."""
+
 
 def _ensure_api_key() -> None:
     """Raise 503 if API key is not configured."""
@@ -34,66 +97,230 @@ def _get_auth_params() -> Dict[str, str]:
     return {}
 
 
-def _build_image_url(path: Optional[str]) -> Optional[str]:
+def build_image_url(path: Optional[str]) -> Optional[str]:
+    """Full TMDb image URL for a poster/backdrop path, or None without one."""
     if not path:
         return None
     return f"{TMDB_IMAGE_BASE}{path}"
 
 
+def _http2_available() -> bool:
+    return importlib.util.find_spec("h2") is not None
+
+
+def _build_client() -> httpx.AsyncClient:
+    """Create a pooled client using the TMDB_* pool and timeout settings."""
+    http2 = TMDB_HTTP2
+    if http2 and not _http2_available():
+        logger.warning("TMDB_HTTP2 requested but h2 is not installed; using HTTP/1.1", component="tmdb")
+        http2 = False
+    return httpx.AsyncClient(
+        http2=http2,
+        timeout=httpx.Timeout(TMDB_TIMEOUT, connect=TMDB_CONNECT_TIMEOUT),
+        limits=httpx.Limits(
+            max_connections=TMDB_MAX_CONNECTIONS,
+            max_keepalive_connections=TMDB_MAX_KEEPALIVE,
+            keepalive_expiry=TMDB_KEEPALIVE_EXPIRY,
+        ),
+    )
+
+
+async def start_client() -> None:
+    """Open the shared TMDb client. Called from the application lifespan."""
+    global _client, _client_loop
+    if _client is None:
+        _client = _build_client()
+        _client_loop = asyncio.get_running_loop()
+
+
+async def close_client() -> None:
+    """Close the shared TMDb client and its pooled connections."""
+    global _client, _client_loop
+    client, _client, _client_loop = _client, None, None
+    if client is not None:
+        await client.aclose()
+
+
+@asynccontextmanager
+async def _client_session() -> AsyncIterator[httpx.AsyncClient]:
+    """Yield the shared client, or a one-off client outside the app's event loop.
+
+    Pooled connections belong to the loop that opened them, so callers on
+    another loop (scripts, asyncio.run) get a short-lived client instead.
+    """
+    if _client is not None and _client_loop is asyncio.get_running_loop():
+        yield _client
+        return
+    async with httpx.AsyncClient(timeout=TMDB_TIMEOUT) as client:
+        yield client
+
+
 async def _tmdb_get(endpoint: str, params: Dict[str, Any] = None) -> Dict[str, Any]:
-    """Make authenticated GET request to TMDb API."""
+    """Make authenticated GET request to TMDb API.
+
+    Identical concurrent requests (same endpoint and params) are coalesced;
+    callers share the decoded body and must not mutate it.
+    """
     _ensure_api_key()
-    request_params = {"language": "en-US", **(params or {}), **_get_auth_params()}
-
-    async with httpx.AsyncClient() as client:
-        response = await client.get(
-            f"{TMDB_BASE_URL}{endpoint}",
-            params=request_params,
-            headers=_get_auth_headers(),
-            timeout=10.0
+    request_params = {"language": "en-US", **(params or {})}
+    key = (endpoint, tuple(sorted(request_params.items())))
+    return await _in_flight.do(key, lambda: _fetch(endpoint, request_params))
+
+
+async def _fetch(endpoint: str, params: Dict[str, Any]) -> Dict[str, Any]:
+    """Rate-limited GET that retries 429, 5xx and transport errors with backoff.
+
+    Raises TMDbUnavailableError when the breaker is open or retries run out;
+    other HTTP errors (e.g. 404) propagate unchanged.
+    """
+    label = _endpoint_label(endpoint)
+    try:
+        probe = _breaker.before_call()
+    except CircuitOpenError as e:
+        _requests_total.inc(endpoint=label, outcome="circuit_open")
+        raise TMDbUnavailableError(str(e)) from e
+    try:
+        return await _fetch_with_retries(endpoint, params, label)
+    except BaseException:
+        if probe:
+            _breaker.release()  # e.g. cancelled mid-call: let another half-open trial through
+        raise
+
+
+async def _fetch_with_retries(endpoint: str, params: Dict[str, Any], label: str) -> Dict[str, Any]:
+    attempt = 0
+    while True:
+        await _rate_limiter.acquire()
+        retry_after = None
+        outcome = "transport_error"
+        start = time.perf_counter()
+        try:
+            async with _client_session() as client:
+                response = await client.get(
+                    f"{TMDB_BASE_URL}{endpoint}",
+                    params={**params, **_get_auth_params()},
+                    headers=_get_auth_headers(),
+                )
+                outcome = str(response.status_code)
+                response.raise_for_status()
+                data = response.json()
+        except httpx.HTTPStatusError as e:
+            if e.response.status_code not in RETRYABLE_STATUS:
+                _breaker.record_success()  # TMDb answered; the request itself was bad
+                raise
+            error = e
+            retry_after = parse_retry_after(e.response.headers.get("Retry-After"))
+            if e.response.status_code == 429 and retry_after:
+                _rate_limiter.defer(retry_after)
+        except httpx.TransportError as e:
+            error = e
+        else:
+            _breaker.record_success()
+            return data
+        finally:
+            _request_seconds.observe(time.perf_counter() - start, endpoint=label)
+            _requests_total.inc(endpoint=label, outcome=outcome)
+
+        if attempt >= tmdb_resilience.TMDB_MAX_RETRIES or (
+            retry_after is not None and retry_after > tmdb_resilience.TMDB_RETRY_MAX_DELAY
+        ):
+            _breaker.record_failure()
+            raise TMDbUnavailableError(f"TMDb request failed after {attempt + 1} attempt(s): {error}") from error
+        delay = backoff_delay(attempt, retry_after)
+        attempt += 1
+        logger.warning(
+            f"TMDb request failed, retrying in {delay:.2f}s",
+            component="tmdb",
+            endpoint=endpoint,
+            attempt=attempt,
+            error=str(error),
         )
-        response.raise_for_status()
-        return response.json()
+        await asyncio.sleep(delay)
+
+
+def tmdb_health() -> Dict[str, Any]:
+    """Breaker and rate limiter state for the health endpoint."""
+    circuit = _breaker.snapshot()
+    status = {"closed": "ok", "half_open": "degraded"}.get(circuit["state"], "unavailable")
+    return {
+        "status": status,
+        "api_key_configured": bool(TMDB_API_KEY),
+        "circuit": circuit,
+        "rate_limiter": _rate_limiter.snapshot(),
+    }
 
 
 async def search_tmdb_movies(query: str, limit: int = 10) -> List[Dict[str, Any]]:
-    """Search TMDb for movies by title."""
-    try:
-        data = await _tmdb_get("/search/movie", {"query": query, "page": 1})
-        return [
+    """Search TMDb for movies by title. Results (including no matches) are cached."""
+    cache = get_cache()
+    key = search_key(query)
+    results = await cache.aget(key)
+    if results is MISS:
+        try:
+            data = await _tmdb_get("/search/movie", {"query": query, "page": 1})
+        except TMDbUnavailableError as e:
+            results = await cache.aget_stale(key)
+            if results is MISS:
+                raise HTTPException(status_code=503, detail=f"TMDb temporarily unavailable: {e}")
+            return [dict(m) for m in results[:limit]]
+        except httpx.HTTPError as e:
+            raise HTTPException(status_code=503, detail=f"TMDb API error: {e}")
+        results = [
             {
                 "tmdb_id": m.get("id"),
                 "title": m.get("title"),
                 "overview": m.get("overview", ""),
                 "release_date": m.get("release_date", ""),
                 "poster_path": m.get("poster_path"),
-                "poster_url": _build_image_url(m.get("poster_path")),
+                "poster_url": build_image_url(m.get("poster_path")),
             }
-            for m in data.get("results", [])[:limit]
+            for m in data.get("results", [])
         ]
-    except httpx.HTTPError as e:
-        raise HTTPException(status_code=503, detail=f"TMDb API error: {e}")
+        await cache.aset(key, results, TMDB_SEARCH_CACHE_TTL)
+    return [dict(m) for m in results[:limit]]
 
 
 async def get_tmdb_movie_details(tmdb_id: int) -> Optional[Dict[str, Any]]:
-    """Fetch movie details from TMDb by ID."""
+    """Fetch movie details from TMDb by ID. Details and 404s are cached."""
+    cache = get_cache()
+    key = details_key(tmdb_id)
+    details = await cache.aget(key)
+    if details is None:
+        raise HTTPException(status_code=404, detail="Movie not found on TMDb")
+    if details is not MISS:
+        return dict(details)
+
     try:
         movie = await _tmdb_get(f"/movie/{tmdb_id}")
-        genres = ", ".join(g["name"] for g in movie.get("genres", []))
-        return {
-            "tmdb_id": movie.get("id"),
-            "title": movie.get("title"),
-            "description": movie.get("overview", ""),
-            "duration": movie.get("runtime", 0),
-            "genre": genres or "Unknown",
-            "release": movie.get("release_date", ""),
-            "poster_path": movie.get("poster_path"),
-            "poster_url": _build_image_url(movie.get("poster_path")),
-            "backdrop_path": movie.get("backdrop_path"),
-        }
+    except TMDbUnavailableError as e:
+        details = await cache.aget_stale(key)
+        if details is MISS:
+            raise HTTPException(status_code=503, detail=f"TMDb temporarily unavailable: {e}")
+        if details is None:
+            raise HTTPException(status_code=404, detail="Movie not found on TMDb")
+        return dict(details)
+    except httpx.HTTPStatusError as e:
+        if e.response.status_code == 404:
+            await cache.aset(key, None, TMDB_NEGATIVE_CACHE_TTL)
+        raise HTTPException(status_code=404, detail=f"Movie not found on TMDb: {e}")
     except httpx.HTTPError as e:
         raise HTTPException(status_code=404, detail=f"Movie not found on TMDb: {e}")
 
+    genres = ", ".join(g["name"] for g in movie.get("genres", []))
+    details = {
+        "tmdb_id": movie.get("id"),
+        "title": movie.get("title"),
+        "description": movie.get("overview", ""),
+        "duration": movie.get("runtime", 0),
+        "genre": genres or "Unknown",
+        "release": movie.get("release_date", ""),
+        "poster_path": movie.get("poster_path"),
+        "poster_url": build_image_url(movie.get("poster_path")),
+        "backdrop_path": movie.get("backdrop_path"),
+    }
+    await cache.aset(key, details, TMDB_CACHE_TTL)
+    return dict(details)
+
 
 def is_tmdb_movie_id(movie_id: str) -> bool:
     return movie_id.startswith("tmdb_")
@@ -1,20 +1,28 @@
 """Unified movie search - local database with TMDb fallback."""
-from typing import List, Dict, Any
+import asyncio
+import os
+import time
+from typing import List, Dict, Any, Set
 from app.services.movie_service import search_movies_titles
+from app.services.tmdb_catalog_service import search_catalog
 from app.services.tmdb_service import search_tmdb_movies, create_tmdb_movie_id
+from app.utils.logger import get_logger
 
 LOCAL_RESULT_THRESHOLD = 3
 
+# Overall time budget for /movies/search/all, in seconds, counted from when the
+# request arrives. Results that have not arrived by then are left out of the
+# response, which is marked partial.
+UNIFIED_SEARCH_DEADLINE = float(os.getenv("UNIFIED_SEARCH_DEADLINE", "2.0"))
 
-async def search_all_movies(query: str) -> Dict[str, Any]:
-    """Search local DB first; include TMDb results if local results < 3."""
-    q = (query or "").strip()
-    if not q:
-        return {"local": [], "external": [], "source": "local"}
-    
-    local_results = search_movies_titles(q)
-    
-    local_movies = [
+logger = get_logger()
+
+# TMDb searches that outlived their deadline, kept referenced until they finish.
+_background_searches: Set["asyncio.Future"] = set()
+
+
+def _local_entries(local_results) -> List[Dict[str, Any]]:
+    return [
         {
             "movie_id": movie.id,
             "title": movie.title,
@@ -23,27 +31,116 @@ async def search_all_movies(query: str) -> Dict[str, Any]:
         }
         for movie in local_results
     ]
-    
-    if len(local_movies) >= LOCAL_RESULT_THRESHOLD:
-        return {"local": local_movies, "external": [], "source": "local"}
-    
-    try:
-        tmdb_results = await search_tmdb_movies(q)
-        external_movies = [
-            {
-                "movie_id": create_tmdb_movie_id(movie["tmdb_id"]),
-                "title": movie["title"],
-                "overview": movie.get("overview", ""),
-                "release_date": movie.get("release_date", ""),
-                "poster_path": movie.get("poster_path"),
-                "source": "tmdb"
-            }
-            for movie in tmdb_results
-        ]
-        return {
-            "local": local_movies,
-            "external": external_movies,
-            "source": "both" if local_movies else "tmdb"
+
+
+def _external_entries(tmdb_results) -> List[Dict[str, Any]]:
+    return [
+        {
+            "movie_id": create_tmdb_movie_id(movie["tmdb_id"]),
+            "title": movie["title"],
+            "overview": movie.get("overview", ""),
+            "release_date": movie.get("release_date", ""),
+            "poster_path": movie.get("poster_path"),
+            "source": "tmdb"
         }
-    except Exception:
-        return {"local": local_movies, "external": [], "source": "local"}
+        for movie in tmdb_results
+    ]
+
+
+def _search_catalog_safely(query: str) -> List[Dict[str, Any]]:
+    try:
+        return search_catalog(query)
+    except Exception as e:
+        logger.warning(f"TMDb catalog search failed: {e}", component="tmdb")
+        return []
+
+
+def _finish_in_background(task: "asyncio.Future") -> None:
+    """Let a TMDb search nobody waits for any more complete, so its result is still cached."""
+    _background_searches.add(task)
+
+    def done(finished: "asyncio.Future") -> None:
+        _background_searches.discard(finished)
+        if not finished.cancelled() and finished.exception() is not None:
+            logger.warning(f"Background TMDb search failed: {finished.exception()}", component="tmdb")
+
+    task.add_done_callback(done)
+
+
+def _settled(task: "asyncio.Future") -> bool:
+    """Done with a usable result (not cancelled, no exception)."""
+    return task.done() and not task.cancelled() and task.exception() is None
+
+
+async def search_all_movies(query: str, deadline: float = None) -> Dict[str, Any]:
+    """Search the local DB, the TMDb catalog and TMDb concurrently, within an overall deadline.
+
+    All three start together. External results are only used when fewer
+    than 3 local results are found, and the imported TMDb catalog is
+    preferred: TMDb is cancelled as soon as the catalog has a match.
+    Whatever has not arrived by the deadline is left out and the response
+    is marked `partial: True`. A TMDb request still running then is left
+    to finish in the background so its result lands in the TMDb cache.
+    """
+    q = (query or "").strip()
+    if not q:
+        return {"local": [], "external": [], "source": "local", "partial": False}
+
+    budget = UNIFIED_SEARCH_DEADLINE if deadline is None else deadline
+    start = time.monotonic()
+    local_task = asyncio.ensure_future(asyncio.to_thread(search_movies_titles, q))
+    catalog_task = asyncio.ensure_future(asyncio.to_thread(_search_catalog_safely, q))
+    tmdb_task = asyncio.ensure_future(search_tmdb_movies(q))
+    tasks = (local_task, catalog_task, tmdb_task)
+
+    try:
+        while True:
+            if local_task.done() and local_task.exception() is not None:
+                raise local_task.exception()
+            local_enough = local_task.done() and len(local_task.result()) >= LOCAL_RESULT_THRESHOLD
+            catalog_hit = _settled(catalog_task) and bool(catalog_task.result())
+            if local_enough or catalog_hit:
+                tmdb_task.cancel()
+            if local_enough or (local_task.done() and catalog_task.done() and (catalog_hit or tmdb_task.done())):
+                break
+            remaining = budget - (time.monotonic() - start)
+            if remaining <= 0:
+                break
+            await asyncio.wait([t for t in tasks if not t.done()], timeout=remaining,
+                               return_when=asyncio.FIRST_COMPLETED)
+    except BaseException:
+        local_task.cancel()
+        catalog_task.cancel()
+        if not tmdb_task.done():
+            _finish_in_background(tmdb_task)
+        raise
+
+    partial = not local_task.done()
+    local_movies = _local_entries(local_task.result()) if local_task.done() else []
+    local_task.cancel()
+    catalog_task.cancel()  # the worker thread finishes on its own; its result is not needed
+
+    external = None
+    if len(local_movies) < LOCAL_RESULT_THRESHOLD:
+        if _settled(catalog_task) and catalog_task.result():
+            external = _external_entries(catalog_task.result())
+        elif _settled(tmdb_task):
+            external = _external_entries(tmdb_task.result())
+        elif not tmdb_task.done():
+            partial = True
+    if not tmdb_task.done():
+        if partial and external is None:
+            _finish_in_background(tmdb_task)
+        else:
+            tmdb_task.cancel()
+    elif not tmdb_task.cancelled():
+        tmdb_task.exception()  # retrieved so a failed TMDb call is not reported as unhandled
+
+    if external is None:
+        return {"local": local_movies, "external": [], "source": "local", "partial": partial}
+    return {
+        "local": local_movies,
+        "external": external,
+        "source": "both" if local_movies else "tmdb",
+        "partial": partial,
+    }
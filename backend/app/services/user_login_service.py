@@ -23,6 +23,7 @@ def _build_access_token(found_user: dict) -> str:
         "username": found_user.get("username"),
         "exp": expiration_time,
         "role": found_user.get("role"),
+        "epoch": found_user.get("token_epoch", 0),
     }
     return jwt.encode(user_payload, JWT_SECRET, algorithm="HS256")
 
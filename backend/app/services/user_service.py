@@ -1,5 +1,5 @@
 import uuid
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Iterable
 from fastapi import HTTPException
 from app.schemas.user import User, UserCreate, UserUpdate
 from app.repositories.user_repo import load_all, save_all
@@ -46,6 +46,17 @@ def get_user_by_id(user_id: str, show_password=False) -> User:
         user_instance.hashed_password = None  # prevent exposing user passwords
     return user_instance
 
+def get_usernames_by_ids(user_ids: Iterable[str]) -> Dict[str, str]:
+    """Resolve many user ids to usernames with a single pass over the users file"""
+    wanted = {str(uid) for uid in user_ids}
+    if not wanted:
+        return {}
+    return {
+        str(usr.get("id")): usr.get("username")
+        for usr in load_all()
+        if str(usr.get("id")) in wanted
+    }
+
 def update_user(user_id: str, payload: UserUpdate) -> User:
     """Update a user's username or password by user_id"""
     users = load_all()
@@ -61,7 +72,8 @@ def update_user(user_id: str, payload: UserUpdate) -> User:
             password_update = _get_hashed_password(payload.password)
 
         updated = User(id=user_id, username=username_update.strip(), hashed_password=password_update, 
-                       role=user["role"], created_at=user["created_at"], active=user["active"])
+                       role=user["role"], created_at=user["created_at"], active=user["active"],
+                       token_epoch=user.get("token_epoch", 0))
         users[index] = updated.model_dump(mode="json")
         save_all(users)
         return updated
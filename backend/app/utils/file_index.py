@@ -0,0 +1,88 @@
+"""In-memory indexes kept in sync with the JSON data files."""
+
+import os
+import threading
+import weakref
+from pathlib import Path
+from typing import Any, Callable, Generic, List, Optional, Tuple, TypeVar
+
+T = TypeVar('T')
+
+Signature = Optional[Tuple[str, int, int, int]]
+
+_UNSET = object()
+
+_instances: "weakref.WeakSet[FileIndex]" = weakref.WeakSet()
+
+
+def file_signature(path: Path) -> Signature:
+    """Identify a file's current contents by path, inode, mtime and size."""
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return (str(path), st.st_ino, st.st_mtime_ns, st.st_size)
+
+
+class FileIndex(Generic[T]):
+    """Derived view of a data file that is only rebuilt when the file changes.
+
+    `path` is called on every access so repositories whose DATA_PATH is
+    swapped (tests, e2e servers) are picked up. `load` parses the file and
+    `build` turns the parsed rows into the index. Reads cost one stat call.
+    """
+
+    def __init__(
+        self,
+        path: Callable[[], Path],
+        load: Callable[[], List[Any]],
+        build: Callable[[List[Any]], T],
+    ):
+        self._path = path
+        self._load = load
+        self._build = build
+        self._lock = threading.Lock()
+        self._signature: Any = _UNSET
+        self._value: Optional[T] = None
+        _instances.add(self)
+
+    def get(self) -> T:
+        """Return the index, rebuilding it if the file changed since last use."""
+        signature = file_signature(self._path())
+        with self._lock:
+            if signature != self._signature:
+                self._value = self._build(self._load())
+                self._signature = signature
+            return self._value
+
+    def prime(self, rows: List[Any]) -> None:
+        """Rebuild from rows that were just written, skipping a re-parse."""
+        with self._lock:
+            self._value = self._build(rows)
+            self._signature = file_signature(self._path())
+
+    @property
+    def label(self) -> str:
+        """e.g. `reviews.json:_build_id_index`, for diagnostics."""
+        return f"{Path(self._path()).name}:{getattr(self._build, '__name__', 'index')}"
+
+    def cached(self) -> Optional[T]:
+        """The index as last built, without checking the file; None if not built."""
+        return self._value
+
+    def invalidate(self) -> None:
+        """Force the next access to reload from disk."""
+        with self._lock:
+            self._signature = _UNSET
+            self._value = None
+
+
+def instances() -> List["FileIndex"]:
+    """Every live index, for memory diagnostics."""
+    return list(_instances)
+
+
+def invalidate_all() -> None:
+    """Drop every cached index, e.g. between tests that mock repository loads."""
+    for index in list(_instances):
+        index.invalidate()
@@ -0,0 +1,152 @@
+"""Sampling profiler for a single request, producing collapsed stacks.
+
+A background thread snapshots every thread's stack with
+`sys._current_frames()` at a fixed interval and keeps only the samples that
+belong to the profiled request:
+
+- on the event loop thread, when the running task's context carries the
+  request's `ProfileSession`;
+- on anyio worker threads (where Starlette runs sync endpoints and
+  dependencies) and executor threads (`asyncio.to_thread`), when the
+  context the worker is running carries it.
+
+Other requests served at the same time are therefore left out. The
+output is the "collapsed" format read by flamegraph.pl, speedscope and
+inferno: one `frame;frame;frame count` line per distinct stack.
+
+cProfile is not used because on Python 3.11 it only sees the thread that
+enabled it, and most of the work here happens on worker threads.
+"""
+import asyncio
+import os
+import sys
+import threading
+import time
+from collections import Counter
+from contextvars import Context, ContextVar
+from types import FrameType
+from typing import Dict, List, Optional
+
+PROFILE_SAMPLE_INTERVAL = float(os.getenv("PROFILE_SAMPLE_INTERVAL", "0.002"))  # seconds
+
+_ANYIO_WORKER_FILE = os.path.join("anyio", "_backends", "_asyncio.py")
+_EXECUTOR_WORKER_FILE = os.path.join("concurrent", "futures", "thread.py")
+_ASYNCIO_EVENTS_FILE = os.path.join("asyncio", "events.py")
+
+_session: ContextVar[Optional["ProfileSession"]] = ContextVar("profile_session", default=None)
+
+
+def _frame_label(frame: FrameType) -> str:
+    code = frame.f_code
+    module = frame.f_globals.get("__name__") or os.path.basename(code.co_filename)
+    return f"{module}.{getattr(code, 'co_qualname', code.co_name)}"
+
+
+def _task_context(task: "asyncio.Task") -> Optional[Context]:
+    get_context = getattr(task, "get_context", None)  # Python 3.12+
+    return get_context() if get_context else getattr(task, "_context", None)
+
+
+def _worker_context(frame: FrameType) -> Optional[Context]:
+    """The context a thread-pool worker frame is running its job in, if `frame` is one."""
+    code = frame.f_code
+    if code.co_name != "run":
+        return None
+    if code.co_filename.endswith(_ANYIO_WORKER_FILE):
+        context = frame.f_locals.get("context")
+    elif code.co_filename.endswith(_EXECUTOR_WORKER_FILE):
+        # asyncio.to_thread submits functools.partial(context.run, func, ...).
+        fn = getattr(frame.f_locals.get("self"), "fn", None)
+        context = getattr(getattr(fn, "func", None), "__self__", None)
+    else:
+        return None
+    return context if isinstance(context, Context) else None
+
+
+class ProfileSession:
+    """Samples collected for one request."""
+
+    def __init__(self, interval: float = PROFILE_SAMPLE_INTERVAL):
+        self.interval = interval
+        self.samples: Counter = Counter()
+        self.sample_count = 0
+        self.started = time.perf_counter()
+        self.duration = 0.0
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_thread: Optional[int] = None
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        """Start sampling. Call from the event loop serving the request, inside `activate`."""
+        self._loop = asyncio.get_running_loop()
+        self._loop_thread = threading.get_ident()
+        self._thread = threading.Thread(target=self._run, name="request-profiler", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+        self.duration = time.perf_counter() - self.started
+
+    def _run(self) -> None:
+        own = threading.get_ident()
+        while not self._stop.wait(self.interval):
+            for ident, frame in sys._current_frames().items():
+                if ident == own:
+                    continue
+                stack = self._request_stack(ident, frame)
+                if stack:
+                    self.samples[";".join(stack)] += 1
+                    self.sample_count += 1
+
+    def _request_stack(self, ident: int, frame: FrameType) -> Optional[List[str]]:
+        """The frames this request is running on thread `ident`, outermost first, or None."""
+        frames: List[FrameType] = []
+        while frame is not None:
+            frames.append(frame)
+            frame = frame.f_back
+        frames.reverse()
+
+        if ident == self._loop_thread:
+            task = asyncio.current_task(self._loop)
+            context = _task_context(task) if task is not None else None
+            if context is None or context.get(_session) is not self:
+                return None
+            # Drop the event loop machinery below the task step.
+            marker = next((i for i, f in enumerate(frames) if f.f_code.co_filename.endswith(_ASYNCIO_EVENTS_FILE)), -1)
+            return [_frame_label(f) for f in frames[marker + 1:]] or None
+
+        for i, f in enumerate(frames):
+            context = _worker_context(f)
+            if context is not None:
+                if context.get(_session) is self:
+                    return [_frame_label(inner) for inner in frames[i + 1:]] or None
+                return None
+        return None
+
+    def collapsed(self) -> str:
+        """Flamegraph input: `frame;frame;frame count` per stack, most frequent first."""
+        return "".join(f"{stack} {count}\n" for stack, count in self.samples.most_common())
+
+
+def activate(session: ProfileSession):
+    """Mark the current context as belonging to `session`; returns a token for `deactivate`."""
+    return _session.set(session)
+
+
+def deactivate(token) -> None:
+    _session.reset(token)
+
+
+def current() -> Optional[ProfileSession]:
+    return _session.get()
+
+
+def top_frames(session: ProfileSession, limit: int = 10) -> Dict[str, int]:
+    """Innermost frames by sample count, for a quick look without a flamegraph tool."""
+    leaves: Counter = Counter()
+    for stack, count in session.samples.items():
+        leaves[stack.rsplit(";", 1)[-1]] += count
+    return dict(leaves.most_common(limit))
@@ -0,0 +1,122 @@
+"""Call counts, bytes and time spent in the JSON repositories' load_all/save_all.
+
+Each repository wraps its `load_all` and `save_all` with `instrumented`.
+Every call is aggregated into the metrics registry, labelled with the route
+being served, and also added to the current request's `RequestIO` when one
+is active (see app.middleware.repo_io_middleware). That is how one request
+can report that it parsed reviews.json six times.
+"""
+import functools
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from pathlib import Path
+from typing import Callable, Dict, Iterator, List, Optional, Tuple, TypeVar
+
+from app.utils.metrics import REGISTRY
+
+NO_ROUTE = "none"  # calls made outside a request: workers, CLIs, startup
+
+F = TypeVar("F", bound=Callable)
+
+_calls = REGISTRY.counter(
+    "repository_io_calls_total", "Repository load_all/save_all calls by route.", ("repository", "op", "route")
+)
+_bytes = REGISTRY.counter(
+    "repository_io_bytes_total", "Bytes read by load_all and written by save_all.", ("repository", "op", "route")
+)
+_seconds = REGISTRY.histogram(
+    "repository_io_seconds", "Time to read and parse, or serialize and write, a repository file.", ("repository", "op")
+)
+
+
+class RequestIO:
+    """Repository calls made while serving one request.
+
+    Sync endpoints run on worker threads that share this object through a
+    copied context, so updates take a lock.
+    """
+
+    def __init__(self, route: Callable[[], str] = lambda: NO_ROUTE):
+        self.route = route
+        self._lock = threading.Lock()
+        self._totals: Dict[Tuple[str, str], List[float]] = {}  # (repository, op) -> [calls, bytes, seconds]
+
+    def add(self, repository: str, op: str, nbytes: int, seconds: float) -> None:
+        with self._lock:
+            totals = self._totals.setdefault((repository, op), [0, 0, 0.0])
+            totals[0] += 1
+            totals[1] += nbytes
+            totals[2] += seconds
+
+    def totals(self) -> Dict[str, Dict[str, float]]:
+        """`{"reviews.load": {"calls": 6, "bytes": ..., "ms": ...}}`."""
+        with self._lock:
+            items = sorted(self._totals.items())
+        return {
+            f"{repository}.{op}": {"calls": int(calls), "bytes": int(nbytes), "ms": round(seconds * 1000, 2)}
+            for (repository, op), (calls, nbytes, seconds) in items
+        }
+
+    def header_value(self) -> str:
+        """`reviews.load;calls=6;bytes=9134;ms=4.1, users.load;calls=1;...` (empty if no I/O)."""
+        return ", ".join(
+            f"{name};calls={t['calls']};bytes={t['bytes']};ms={t['ms']}" for name, t in self.totals().items()
+        )
+
+
+_current: ContextVar[Optional[RequestIO]] = ContextVar("repo_io_request", default=None)
+
+
+@contextmanager
+def track_request(route: Callable[[], str]) -> Iterator[RequestIO]:
+    """Collect repository I/O for the duration of a request.
+
+    `route` is called at each repository call, once routing has picked the route.
+    """
+    request_io = RequestIO(route)
+    token = _current.set(request_io)
+    try:
+        yield request_io
+    finally:
+        _current.reset(token)
+
+
+def current() -> Optional[RequestIO]:
+    return _current.get()
+
+
+def _file_size(path: Path) -> int:
+    try:
+        return path.stat().st_size
+    except OSError:
+        return 0
+
+
+def record(repository: str, op: str, nbytes: int, seconds: float) -> None:
+    request_io = _current.get()
+    route = request_io.route() if request_io is not None else NO_ROUTE
+    _calls.inc(repository=repository, op=op, route=route)
+    _bytes.inc(nbytes, repository=repository, op=op, route=route)
+    _seconds.observe(seconds, repository=repository, op=op)
+    if request_io is not None:
+        request_io.add(repository, op, nbytes, seconds)
+
+
+def instrumented(repository: str, op: str, path: Callable[[], Path]) -> Callable[[F], F]:
+    """Record each call of a repository's load_all ("load") or save_all ("save").
+
+    Bytes are the size of the file at `path()` after the call, i.e. what a
+    load read in full or a save wrote.
+    """
+    def decorator(fn: F) -> F:
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                record(repository, op, _file_size(path()), time.perf_counter() - start)
+        return wrapper
+    return decorator
@@ -0,0 +1,34 @@
+"""Coalesce concurrent identical async calls into one in-flight call."""
+
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, Hashable, Tuple, TypeVar
+
+T = TypeVar('T')
+
+
+class SingleFlight:
+    """Run at most one call per key at a time; concurrent callers share its result.
+
+    The first caller for a key starts the call as a task and later callers
+    await the same task, so they all get its return value or its exception.
+    Nothing is remembered once the call finishes — caching is up to the
+    caller. Calls are tracked per event loop because tasks cannot be awaited
+    across loops.
+    """
+
+    def __init__(self):
+        self._calls: Dict[Tuple[asyncio.AbstractEventLoop, Hashable], "asyncio.Task[Any]"] = {}
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[T]]) -> T:
+        loop = asyncio.get_running_loop()
+        call_key = (loop, key)
+        task = self._calls.get(call_key)
+        if task is None:
+            task = loop.create_task(fn())
+            self._calls[call_key] = task
+            task.add_done_callback(lambda _: self._calls.pop(call_key, None))
+        # Shield so one caller being cancelled does not cancel the shared call.
+        return await asyncio.shield(task)
+
+    def in_flight(self) -> int:
+        return len(self._calls)
@@ -0,0 +1,60 @@
+"""Append-only file of UTF-8 text, read back lazily through mmap.
+
+Entries are never rewritten: a changed text is appended again and the old
+bytes are left behind until the file is compacted, so an (offset, length)
+recorded once stays valid for as long as the file is.
+"""
+import mmap
+import os
+import threading
+from pathlib import Path
+from typing import List, Optional, Sequence, Tuple
+
+_append_lock = threading.Lock()
+
+
+def append_texts(path: Path, texts: Sequence[str]) -> Tuple[int, List[int]]:
+    """Write `texts` back to back at the end of `path`; returns their start offset and encoded lengths.
+
+    The bytes are flushed before returning, so whatever records the offsets
+    can be written next without ever pointing past the end of the file.
+    """
+    encoded = [text.encode("utf-8") for text in texts]
+    with _append_lock, Path(path).open("ab") as f:
+        offset = f.seek(0, os.SEEK_END)
+        f.write(b"".join(encoded))
+        f.flush()
+        os.fsync(f.fileno())
+    return offset, [len(chunk) for chunk in encoded]
+
+
+class BlobView:
+    """Read-only map of a blob file as it was when the view was opened.
+
+    Later appends are not visible, but mapped bytes never change, so a view
+    stays valid for as long as anything holds it, even if the file is
+    replaced by a compacted copy meanwhile. A missing file maps as empty.
+    """
+
+    __slots__ = ("_map", "size")
+
+    def __init__(self, path: Optional[Path] = None):
+        self._map: Optional[mmap.mmap] = None
+        self.size = 0
+        if path is None:
+            return
+        try:
+            f = Path(path).open("rb")
+        except FileNotFoundError:
+            return
+        with f:
+            size = os.fstat(f.fileno()).st_size
+            if size:
+                self._map = mmap.mmap(f.fileno(), size, access=mmap.ACCESS_READ)
+                self.size = size
+
+    def read(self, offset: int, length: int) -> str:
+        """Decode `length` bytes at `offset`; a span running past the end of the map reads as empty."""
+        if not length or offset + length > self.size:
+            return ""
+        return self._map[offset:offset + length].decode("utf-8")
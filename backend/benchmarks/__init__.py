@@ -0,0 +1,4 @@
+"""Service-level benchmarks over synthetic datasets.
+
+Run from backend/ with `python -m benchmarks --help`.
+"""
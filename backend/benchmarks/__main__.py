@@ -0,0 +1,63 @@
+"""Run the benchmark suite.
+
+Examples (from backend/):
+    python -m benchmarks --sizes tiny,small --out bench.json
+    python -m benchmarks --sizes small --baseline benchmarks/baseline.json --threshold 0.25
+    python -m benchmarks --sizes small --save-baseline benchmarks/baseline.json
+"""
+import argparse
+import json
+import sys
+from pathlib import Path
+
+from app.cli.generate_dataset import SCALES
+from benchmarks.cases import CASES_BY_NAME
+from benchmarks.compare import DEFAULT_METRICS, compare
+from benchmarks.dataset import CACHE_DIR
+from benchmarks.runner import run_suite
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark the service hot paths over synthetic datasets.")
+    parser.add_argument("--sizes", default="tiny,small", help=f"comma-separated scales from {sorted(SCALES)}")
+    parser.add_argument("--cases", default=",".join(CASES_BY_NAME), help="comma-separated case names")
+    parser.add_argument("--iterations", type=int, default=20)
+    parser.add_argument("--warmup", type=int, default=2)
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--data-dir", type=Path, default=CACHE_DIR, help="where generated datasets are cached")
+    parser.add_argument("--out", type=Path, default=None, help="write results JSON here")
+    parser.add_argument("--baseline", type=Path, default=None, help="compare against this results file")
+    parser.add_argument("--threshold", type=float, default=0.2, help="allowed slowdown, 0.2 = 20%%")
+    parser.add_argument("--metrics", default=",".join(DEFAULT_METRICS), help="metrics compared with the baseline")
+    parser.add_argument("--save-baseline", type=Path, default=None, help="also write results as the new baseline")
+    args = parser.parse_args(argv)
+
+    sizes = [s for s in args.sizes.split(",") if s]
+    cases = [CASES_BY_NAME[name] for name in args.cases.split(",") if name]
+
+    def report(key, measurement):
+        m = measurement
+        io = f"r={m.read_bytes} w={m.write_bytes}" if m.read_bytes is not None else "io=n/a"
+        print(f"{key:<45} p50={m.p50_ms:>9.2f}ms p90={m.p90_ms:>9.2f}ms "
+              f"p99={m.p99_ms:>9.2f}ms peak={m.alloc_peak_bytes / 1e6:8.1f}MB {io}", flush=True)
+
+    results = run_suite(sizes, cases, iterations=args.iterations, warmup=args.warmup,
+                        seed=args.seed, data_dir=args.data_dir, progress=report)
+
+    for path in (args.out, args.save_baseline):
+        if path is not None:
+            path.write_text(json.dumps(results, indent=2))
+
+    if args.baseline is not None:
+        baseline = json.loads(args.baseline.read_text())
+        regressions = compare(results, baseline, args.threshold, args.metrics.split(","))
+        for regression in regressions:
+            print(f"REGRESSION {regression}")
+        if regressions:
+            return 1
+        print(f"No regressions over {args.threshold:.0%} against {args.baseline}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,81 @@
+"""The service hot paths covered by the benchmark suite."""
+import asyncio
+from collections import Counter
+from dataclasses import dataclass
+from typing import Callable, Dict, List
+
+from app.repositories import movie_repo, review_repo, user_repo
+from app.schemas.review import ReviewCreate
+from app.schemas.search import MovieSearch
+from app.schemas.user import User
+from app.services import (
+    achievement_service,
+    battle_pair_selector,
+    movie_service,
+    review_service,
+    search_service,
+    user_summary_service,
+)
+
+
+@dataclass
+class Fixtures:
+    """Inputs picked from the loaded dataset so every run exercises the same rows."""
+    user: User
+    review_id: int
+    movie_id: str
+    title_word: str
+
+    @classmethod
+    def load(cls) -> "Fixtures":
+        reviews = review_repo.load_all()
+        authors = Counter(str(review["authorId"]) for review in reviews)
+        users = {user["id"]: user for user in user_repo.load_all()}
+        author_id = next(uid for uid, _ in authors.most_common() if uid in users)
+        local_movies = [movie for movie in movie_repo.load_all() if not str(movie["id"]).startswith("tmdb_")]
+        words = Counter(word for movie in local_movies for word in movie["title"].lower().split() if len(word) > 3)
+        return cls(
+            user=User(**users[author_id]),
+            review_id=reviews[len(reviews) // 2]["id"],
+            movie_id=local_movies[0]["id"],
+            title_word=words.most_common(1)[0][0],
+        )
+
+
+@dataclass
+class Case:
+    name: str
+    build: Callable[[Fixtures], Callable[[], object]]
+    writes: bool = False  # needs a scratch copy of the dataset
+
+
+def _create_review(fx: Fixtures) -> Callable[[], object]:
+    loop = asyncio.new_event_loop()
+    payload = ReviewCreate(
+        movieId=fx.movie_id,
+        rating=4,
+        reviewTitle="Benchmark review",
+        reviewBody="A steady, well paced film with a strong central performance and a memorable score.",
+    )
+    return lambda: loop.run_until_complete(review_service.create_review(payload, author_id=fx.user.id))
+
+
+CASES: List[Case] = [
+    Case("list_reviews_paginated", lambda fx: lambda: review_service.list_reviews_paginated(page=1)),
+    Case("list_reviews_paginated_search", lambda fx: lambda: review_service.list_reviews_paginated(search=fx.title_word)),
+    Case("list_reviews_paginated_sort", lambda fx: lambda: review_service.list_reviews_paginated(sort_by="movieTitle", order="desc")),
+    Case("list_reviews_paginated_rating_sort", lambda fx: lambda: review_service.list_reviews_paginated(
+        min_rating=3, sort_by="rating", order="desc")),
+    Case("list_reviews_paginated_votes_sort", lambda fx: lambda: review_service.list_reviews_paginated(sort_by="votes", order="desc")),
+    Case("get_leaderboard_reviews", lambda fx: lambda: review_service.get_leaderboard_reviews(limit=10)),
+    Case("list_movies_by_rating", lambda fx: lambda: movie_service.list_movies(sort_by="rating", order="desc")),
+    Case("search_movies_with_reviews", lambda fx: lambda: search_service.search_movies_with_reviews(MovieSearch(query=fx.title_word))),
+    Case("select_eligible_pair", lambda fx: lambda: battle_pair_selector.select_eligible_pair(
+        fx.user, battle_pair_selector.sample_reviews_for_battle(fx.user.id))),
+    Case("get_achievement_winners", lambda fx: achievement_service.get_achievement_winners),
+    Case("get_user_summary", lambda fx: lambda: user_summary_service.get_user_summary(fx.user.id)),
+    Case("increment_vote", lambda fx: lambda: review_service.increment_vote(fx.review_id), writes=True),
+    Case("create_review", _create_review, writes=True),
+]
+
+CASES_BY_NAME: Dict[str, Case] = {case.name: case for case in CASES}
@@ -0,0 +1,46 @@
+"""Compare a benchmark result file against a stored baseline."""
+from dataclasses import dataclass
+from typing import Any, Dict, List, Sequence
+
+DEFAULT_METRICS = ("p50_ms",)
+
+
+@dataclass
+class Regression:
+    key: str
+    metric: str
+    baseline: float
+    current: float
+
+    @property
+    def ratio(self) -> float:
+        return self.current / self.baseline if self.baseline else float("inf")
+
+    def __str__(self) -> str:
+        return f"{self.key} {self.metric}: {self.baseline} -> {self.current} ({(self.ratio - 1) * 100:+.1f}%)"
+
+
+def compare(
+    current: Dict[str, Any],
+    baseline: Dict[str, Any],
+    threshold: float = 0.2,
+    metrics: Sequence[str] = DEFAULT_METRICS,
+) -> List[Regression]:
+    """Results that got worse than the baseline by more than `threshold` (0.2 = 20%).
+
+    Only keys present in both files are compared; metrics that are missing
+    or null on either side (e.g. I/O bytes on non-Linux hosts) are skipped.
+    """
+    regressions = []
+    base_results = baseline.get("results", {})
+    for key, result in current.get("results", {}).items():
+        base = base_results.get(key)
+        if base is None:
+            continue
+        for metric in metrics:
+            old, new = base.get(metric), result.get(metric)
+            if old is None or new is None:
+                continue
+            if new > old * (1 + threshold):
+                regressions.append(Regression(key, metric, old, new))
+    return regressions
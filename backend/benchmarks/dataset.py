@@ -0,0 +1,79 @@
+"""Synthetic datasets for benchmarks, and pointing the repositories at them."""
+import shutil
+from contextlib import contextmanager
+from dataclasses import replace
+from pathlib import Path
+from typing import Dict, Iterator
+
+from app.cli.generate_dataset import SCALES, generate
+from app.repositories import (
+    battle_repo,
+    comments_repo,
+    flag_repo,
+    movie_repo,
+    review_repo,
+    user_repo,
+    watchlist_repo,
+)
+from app.utils.file_index import invalidate_all
+from app.utils.logger import get_logger
+
+CACHE_DIR = Path(__file__).resolve().parent / ".data"
+
+REPOSITORIES = {
+    "users.json": user_repo,
+    "movies.json": movie_repo,
+    "reviews.json": review_repo,
+    "battles.json": battle_repo,
+    "comments.json": comments_repo,
+    "flags.json": flag_repo,
+    "watchlist.json": watchlist_repo,
+}
+
+
+def dataset_dir(scale: str, seed: int, cache_dir: Path = CACHE_DIR) -> Path:
+    """Return a generated dataset for `scale`/`seed`, generating it on first use."""
+    path = Path(cache_dir) / f"{scale}-seed{seed}"
+    marker = path / ".complete"
+    # Datasets cached before review text moved out of reviews.json have no reviews.text.
+    if not marker.exists() or not (path / "reviews.text").exists():
+        if path.exists():
+            shutil.rmtree(path)
+        generate(replace(SCALES[scale], seed=seed), path)
+        marker.touch()
+    return path
+
+
+@contextmanager
+def use_data_dir(path: Path) -> Iterator[Path]:
+    """Point every JSON repository (and the log file) at `path` until exit."""
+    path = Path(path)
+    saved: Dict[object, Path] = {repo: repo.DATA_PATH for repo in REPOSITORIES.values()}
+    logger = get_logger()
+    saved_log = logger.log_file
+    for name, repo in REPOSITORIES.items():
+        repo.DATA_PATH = path / name
+    logger.log_file = path / "logs.json"
+    if not logger.log_file.exists():
+        logger.log_file.write_text("[]")
+    invalidate_all()
+    try:
+        yield path
+    finally:
+        for repo, original in saved.items():
+            repo.DATA_PATH = original
+        logger.log_file = saved_log
+        invalidate_all()
+
+
+@contextmanager
+def scratch_copy(source: Path, scratch_root: Path) -> Iterator[Path]:
+    """Copy a dataset so benchmarks that write do not alter the cached one."""
+    target = Path(scratch_root) / f"{Path(source).name}-scratch"
+    if target.exists():
+        shutil.rmtree(target)
+    shutil.copytree(source, target)
+    try:
+        yield target
+    finally:
+        shutil.rmtree(target, ignore_errors=True)
@@ -0,0 +1,107 @@
+"""Timing, allocation and I/O measurement for a single benchmark case."""
+import gc
+import os
+import random
+import time
+import tracemalloc
+from dataclasses import asdict, dataclass
+from typing import Callable, Dict, List, Optional, Tuple
+
+_PROC_IO = "/proc/self/io"
+
+
+def io_counters() -> Optional[Tuple[int, int]]:
+    """Bytes read and written by this process so far, where the OS reports it."""
+    try:
+        with open(_PROC_IO) as f:
+            fields = dict(line.split(": ") for line in f.read().splitlines())
+    except OSError:
+        return None
+    return int(fields["rchar"]), int(fields["wchar"])
+
+
+def percentile(sorted_values: List[float], pct: float) -> float:
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, -(-len(sorted_values) * pct // 100))
+    return sorted_values[int(rank) - 1]
+
+
+@dataclass
+class Measurement:
+    iterations: int
+    p50_ms: float
+    p90_ms: float
+    p99_ms: float
+    mean_ms: float
+    min_ms: float
+    max_ms: float
+    alloc_peak_bytes: int
+    alloc_net_bytes: int
+    read_bytes: Optional[int]
+    write_bytes: Optional[int]
+
+    def to_dict(self) -> Dict[str, object]:
+        return asdict(self)
+
+
+def measure(
+    fn: Callable[[], object],
+    *,
+    iterations: int,
+    warmup: int = 1,
+    alloc_iterations: int = 1,
+    seed: int = 0,
+) -> Measurement:
+    """Run `fn` repeatedly and summarise latency, allocations and I/O per call.
+
+    Latency is measured without tracemalloc (which slows Python several
+    times over); allocations come from separate traced calls. The random
+    module is reseeded first so randomised services behave the same each run.
+    """
+    random.seed(seed)
+    for _ in range(warmup):
+        fn()
+
+    gc.collect()
+    io_before = io_counters()
+    timings: List[float] = []
+    for _ in range(iterations):
+        started = time.perf_counter_ns()
+        fn()
+        timings.append((time.perf_counter_ns() - started) / 1e6)
+    io_after = io_counters()
+
+    peak = net = 0
+    tracemalloc.start()
+    try:
+        for _ in range(alloc_iterations):
+            gc.collect()
+            before, _ = tracemalloc.get_traced_memory()
+            tracemalloc.reset_peak()
+            fn()
+            after, call_peak = tracemalloc.get_traced_memory()
+            peak = max(peak, call_peak - before)
+            net = max(net, after - before)
+    finally:
+        tracemalloc.stop()
+
+    timings.sort()
+    read_bytes = write_bytes = None
+    if io_before and io_after:
+        read_bytes = (io_after[0] - io_before[0]) // iterations
+        write_bytes = (io_after[1] - io_before[1]) // iterations
+    return Measurement(
+        iterations=iterations,
+        p50_ms=round(percentile(timings, 50), 3),
+        p90_ms=round(percentile(timings, 90), 3),
+        p99_ms=round(percentile(timings, 99), 3),
+        mean_ms=round(sum(timings) / len(timings), 3),
+        min_ms=round(timings[0], 3),
+        max_ms=round(timings[-1], 3),
+        alloc_peak_bytes=peak,
+        alloc_net_bytes=net,
+        read_bytes=read_bytes,
+        write_bytes=write_bytes,
+    )
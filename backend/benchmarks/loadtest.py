@@ -0,0 +1,428 @@
+"""Load-test the FastAPI app in-process against a synthetic dataset.
+
+Virtual users log in and then loop over a weighted mix of scenarios until the
+duration (or scenario budget) runs out. Requests go through
+`httpx.ASGITransport` straight into `app.main:app`, or over TCP to a uvicorn
+server started on a background thread. TMDb calls are answered by the fake
+TMDb server, and writes land in a scratch copy of the dataset.
+
+Examples (from backend/):
+    python -m benchmarks.loadtest --scale small --users 50 --duration 30
+    python -m benchmarks.loadtest --target uvicorn --mix browse=6,search=2,battle=2 --out load.json
+    python -m benchmarks.loadtest --threadpool-size 10 --users 80
+"""
+import argparse
+import asyncio
+import json
+import os
+import random
+import socket
+import sys
+import tempfile
+import threading
+import time
+from collections import Counter, defaultdict
+from contextlib import ExitStack, asynccontextmanager, contextmanager
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Iterator, List, Optional
+
+# Tokens are minted and checked inside this process only.
+os.environ.setdefault("JWT_SECRET", "loadtest-secret-not-for-production-use")
+
+import anyio.to_thread  # noqa: E402
+import httpx  # noqa: E402
+
+from app.cli.fake_tmdb import FakeTMDbConfig, FakeTMDbServer, LatencyModel  # noqa: E402
+from app.cli.generate_dataset import SCALES, SYNTHETIC_PASSWORD  # noqa: E402
+from app.repositories import movie_repo, review_repo, user_repo  # noqa: E402
+from benchmarks.dataset import CACHE_DIR, dataset_dir, scratch_copy, use_data_dir  # noqa: E402
+from benchmarks.harness import percentile  # noqa: E402
+
+DEFAULT_MIX = {"browse": 5.0, "search": 3.0, "battle": 2.0, "login": 1.0, "dashboard": 2.0}
+TARGETS = ("asgi", "uvicorn")
+PER_PAGE = 20
+
+
+def parse_mix(spec: str) -> Dict[str, float]:
+    """Parse `browse=5,search=3` into scenario weights."""
+    mix: Dict[str, float] = {}
+    for part in filter(None, (p.strip() for p in spec.split(","))):
+        name, _, weight = part.partition("=")
+        if name not in SCENARIOS:
+            raise ValueError(f"Unknown scenario: {name} (choose from {', '.join(SCENARIOS)})")
+        mix[name] = float(weight or 1)
+    if not mix or sum(mix.values()) <= 0:
+        raise ValueError("The scenario mix needs at least one positive weight")
+    return mix
+
+
+@dataclass
+class LoadConfig:
+    scale: str = "tiny"
+    seed: int = 1
+    users: int = 20
+    duration: float = 10.0               # seconds of load after every user has logged in
+    scenarios: Optional[int] = None      # stop after this many scenarios instead
+    mix: Dict[str, float] = field(default_factory=lambda: dict(DEFAULT_MIX))
+    think_time: float = 0.0              # seconds a user pauses between scenarios
+    target: str = "asgi"
+    threadpool_size: Optional[int] = None  # anyio default (40) when unset
+    tmdb_latency: str = "constant:20"
+    data_dir: Path = CACHE_DIR
+
+
+class Recorder:
+    """Latencies and status codes per route label, plus scenario counts."""
+
+    def __init__(self):
+        self.latencies: Dict[str, List[float]] = defaultdict(list)
+        self.statuses: Dict[str, Counter] = defaultdict(Counter)
+        self.scenarios: Counter = Counter()
+
+    def record(self, route: str, seconds: float, status: str) -> None:
+        self.latencies[route].append(seconds * 1000)
+        self.statuses[route][status] += 1
+
+    def report(self, elapsed: float) -> Dict[str, Any]:
+        routes: Dict[str, Dict[str, Any]] = {}
+        for route in sorted(self.latencies):
+            values = sorted(self.latencies[route])
+            statuses = self.statuses[route]
+            errors = sum(n for status, n in statuses.items() if not status.startswith(("2", "3")))
+            routes[route] = {
+                "requests": len(values),
+                "rps": round(len(values) / elapsed, 2) if elapsed else 0.0,
+                "p50_ms": round(percentile(values, 50), 3),
+                "p95_ms": round(percentile(values, 95), 3),
+                "p99_ms": round(percentile(values, 99), 3),
+                "max_ms": round(values[-1], 3),
+                "mean_ms": round(sum(values) / len(values), 3),
+                "errors": errors,
+                "error_rate": round(errors / len(values), 4),
+                "status": dict(sorted(statuses.items())),
+            }
+        total = sum(r["requests"] for r in routes.values())
+        errors = sum(r["errors"] for r in routes.values())
+        return {
+            "requests": total,
+            "errors": errors,
+            "error_rate": round(errors / total, 4) if total else 0.0,
+            "throughput_rps": round(total / elapsed, 2) if elapsed else 0.0,
+            "scenarios": dict(sorted(self.scenarios.items())),
+            "routes": routes,
+        }
+
+
+class ThreadpoolSampler:
+    """Samples anyio's default thread limiter, which runs Starlette's sync endpoints.
+
+    Must run on the event loop that serves the app: the limiter is per loop.
+    """
+
+    def __init__(self, interval: float = 0.01):
+        self.interval = interval
+        self.total_tokens = 0
+        self.borrowed: List[int] = []
+        self.waiting: List[int] = []
+
+    async def run(self) -> None:
+        limiter = anyio.to_thread.current_default_thread_limiter()
+        while True:
+            self.total_tokens = int(limiter.total_tokens)
+            self.borrowed.append(limiter.borrowed_tokens)
+            self.waiting.append(limiter.statistics().tasks_waiting)
+            await asyncio.sleep(self.interval)
+
+    def report(self) -> Dict[str, Any]:
+        samples = len(self.borrowed)
+        if not samples:
+            return {"samples": 0}
+        return {
+            "samples": samples,
+            "total_tokens": self.total_tokens,
+            "max_busy": max(self.borrowed),
+            "mean_busy": round(sum(self.borrowed) / samples, 2),
+            "saturated_fraction": round(sum(b >= self.total_tokens for b in self.borrowed) / samples, 4),
+            "max_waiting": max(self.waiting),
+            "mean_waiting": round(sum(self.waiting) / samples, 2),
+        }
+
+
+@dataclass
+class Workload:
+    """Request inputs picked from the dataset and the fake TMDb catalog."""
+    usernames: List[str]
+    review_pages: int
+    search_terms: List[str]
+
+    @classmethod
+    def load(cls, tmdb: FakeTMDbServer) -> "Workload":
+        usernames = [u["username"] for u in user_repo.load_all() if u.get("active", True) and u.get("role") == "user"]
+        reviews = len(review_repo.load_all())
+        local_words = {w for m in movie_repo.load_all() for w in m["title"].lower().split() if len(w) > 3}
+        tmdb_words = {w for m in tmdb.catalog.values() for w in m["title"].lower().split() if len(w) > 3}
+        return cls(
+            usernames=sorted(usernames),
+            review_pages=max(1, -(-reviews // PER_PAGE)),
+            search_terms=sorted(local_words) + sorted(tmdb_words - local_words),
+        )
+
+
+class VirtualUser:
+    def __init__(self, client: httpx.AsyncClient, recorder: Recorder, workload: Workload, username: str, rng: random.Random):
+        self.client = client
+        self.recorder = recorder
+        self.workload = workload
+        self.username = username
+        self.rng = rng
+        self.headers: Dict[str, str] = {}
+
+    async def request(self, route: str, method: str, url: str, **kwargs) -> Optional[httpx.Response]:
+        """Send one request and record it under `route` (the path template, not the URL)."""
+        start = time.perf_counter()
+        try:
+            response = await self.client.request(method, url, headers=self.headers, **kwargs)
+        except httpx.HTTPError as e:
+            self.recorder.record(route, time.perf_counter() - start, type(e).__name__)
+            return None
+        self.recorder.record(route, time.perf_counter() - start, str(response.status_code))
+        return response
+
+    async def login(self) -> None:
+        response = await self.request("POST /login", "POST", "/login",
+                                      json={"username": self.username, "password": SYNTHETIC_PASSWORD})
+        if response is not None and response.status_code == 201:
+            self.headers = {"Authorization": f"Bearer {response.json()['access_token']}"}
+
+
+async def browse(user: VirtualUser) -> None:
+    page = user.rng.randint(1, user.workload.review_pages)
+    response = await user.request("GET /reviews", "GET", "/reviews", params={"page": page, "per_page": PER_PAGE})
+    if response is None or response.status_code != 200:
+        return
+    items = response.json().get("reviews") or []
+    if items:
+        review_id = user.rng.choice(items)["id"]
+        await user.request("GET /reviews/{review_id}", "GET", f"/reviews/{review_id}")
+
+
+async def search(user: VirtualUser) -> None:
+    term = user.rng.choice(user.workload.search_terms)
+    await user.request("GET /movies/search/all", "GET", "/movies/search/all", params={"title": term})
+
+
+async def battle(user: VirtualUser) -> None:
+    response = await user.request("POST /battles", "POST", "/battles")
+    if response is None or response.status_code != 201:
+        return
+    created = response.json()
+    winner = user.rng.choice((created["review1Id"], created["review2Id"]))
+    await user.request("POST /battles/{battle_id}/votes", "POST", f"/battles/{created['id']}/votes",
+                       json={"winnerId": winner})
+
+
+async def login(user: VirtualUser) -> None:
+    await user.login()
+
+
+async def dashboard(user: VirtualUser) -> None:
+    await user.request("GET /home/", "GET", "/home/")
+
+
+SCENARIOS: Dict[str, Callable[[VirtualUser], Awaitable[None]]] = {
+    "browse": browse,
+    "search": search,
+    "battle": battle,
+    "login": login,
+    "dashboard": dashboard,
+}
+
+
+@contextmanager
+def app_environment(config: LoadConfig) -> Iterator[FakeTMDbServer]:
+    """Scratch dataset, fake TMDb and a throwaway TMDb cache/catalog for the app."""
+    from app.repositories import tmdb_catalog_repo
+    from app.services import tmdb_service
+    from app.services.tmdb_cache import TMDbResponseCache, set_cache
+
+    data = dataset_dir(config.scale, config.seed, config.data_dir)
+    with ExitStack() as stack:
+        scratch_root = Path(stack.enter_context(tempfile.TemporaryDirectory()))
+        scratch = stack.enter_context(scratch_copy(data, scratch_root))
+        stack.enter_context(use_data_dir(scratch))
+        tmdb = stack.enter_context(FakeTMDbServer(config=FakeTMDbConfig(
+            latency=LatencyModel.parse(config.tmdb_latency), seed=config.seed)))
+
+        saved = (tmdb_service.TMDB_BASE_URL, tmdb_service.TMDB_API_KEY, tmdb_catalog_repo.CATALOG_PATH)
+        tmdb_service.TMDB_BASE_URL, tmdb_service.TMDB_API_KEY = tmdb.base_url, "loadtest"
+        tmdb_catalog_repo.CATALOG_PATH = scratch / "tmdb_catalog.sqlite3"
+        set_cache(TMDbResponseCache(path=str(scratch / "tmdb_cache.sqlite3")))
+        try:
+            yield tmdb
+        finally:
+            set_cache(None)
+            tmdb_service.TMDB_BASE_URL, tmdb_service.TMDB_API_KEY, tmdb_catalog_repo.CATALOG_PATH = saved
+
+
+def _set_threadpool_size(size: Optional[int]) -> None:
+    if size is not None:
+        anyio.to_thread.current_default_thread_limiter().total_tokens = size
+
+
+@asynccontextmanager
+async def _asgi_client(app, config: LoadConfig, sampler: ThreadpoolSampler) -> AsyncIterator[httpx.AsyncClient]:
+    # ASGITransport does not send lifespan events, so run the app's lifespan here.
+    async with app.router.lifespan_context(app):
+        _set_threadpool_size(config.threadpool_size)
+        sampling = asyncio.create_task(sampler.run())
+        try:
+            async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app, raise_app_exceptions=False), base_url="http://loadtest") as client:
+                yield client
+        finally:
+            sampling.cancel()
+
+
+@asynccontextmanager
+async def _uvicorn_client(app, config: LoadConfig, sampler: ThreadpoolSampler) -> AsyncIterator[httpx.AsyncClient]:
+    import uvicorn
+
+    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    sock.bind(("127.0.0.1", 0))
+    port = sock.getsockname()[1]
+    server = uvicorn.Server(uvicorn.Config(app, log_level="warning", lifespan="on"))
+    loop = asyncio.new_event_loop()
+
+    async def serve() -> None:
+        _set_threadpool_size(config.threadpool_size)
+        sampling = asyncio.create_task(sampler.run())
+        try:
+            await server.serve(sockets=[sock])
+        finally:
+            sampling.cancel()
+
+    thread = threading.Thread(target=loop.run_until_complete, args=(serve(),), daemon=True)
+    thread.start()
+    try:
+        while not server.started:
+            if not thread.is_alive():
+                raise RuntimeError("uvicorn failed to start")
+            await asyncio.sleep(0.01)
+        limits = httpx.Limits(max_connections=config.users, max_keepalive_connections=config.users)
+        async with httpx.AsyncClient(base_url=f"http://127.0.0.1:{port}", limits=limits, timeout=30) as client:
+            yield client
+    finally:
+        server.should_exit = True
+        await asyncio.to_thread(thread.join, 10)
+        loop.close()
+        sock.close()
+
+
+async def _drive(client: httpx.AsyncClient, config: LoadConfig, workload: Workload, recorder: Recorder) -> float:
+    """Log every user in, then run the scenario mix; returns the seconds under load."""
+    if not workload.usernames:
+        raise RuntimeError("The dataset has no active users to log in as")
+    rng = random.Random(config.seed)
+    users = [
+        VirtualUser(client, recorder, workload, workload.usernames[i % len(workload.usernames)], random.Random(rng.random()))
+        for i in range(config.users)
+    ]
+    await asyncio.gather(*(user.login() for user in users))
+
+    names, weights = list(config.mix), list(config.mix.values())
+    budget = [config.scenarios if config.scenarios is not None else float("inf")]
+    start = time.perf_counter()
+    deadline = start + config.duration if config.scenarios is None else float("inf")
+
+    async def run(user: VirtualUser) -> None:
+        while budget[0] > 0 and time.perf_counter() < deadline:
+            budget[0] -= 1
+            name = user.rng.choices(names, weights)[0]
+            recorder.scenarios[name] += 1
+            await SCENARIOS[name](user)
+            if config.think_time:
+                await asyncio.sleep(config.think_time)
+
+    await asyncio.gather(*(run(user) for user in users))
+    return time.perf_counter() - start
+
+
+async def run_load(config: LoadConfig) -> Dict[str, Any]:
+    """Run one load test and return the report."""
+    if config.target not in TARGETS:
+        raise ValueError(f"Unknown target: {config.target} (choose from {', '.join(TARGETS)})")
+    from app.main import app
+
+    recorder = Recorder()
+    sampler = ThreadpoolSampler()
+    with app_environment(config) as tmdb:
+        workload = Workload.load(tmdb)
+        connect = _asgi_client if config.target == "asgi" else _uvicorn_client
+        async with connect(app, config, sampler) as client:
+            elapsed = await _drive(client, config, workload, recorder)
+        tmdb_stats = dict(tmdb.stats)
+
+    report = recorder.report(elapsed)
+    meta = {key: value for key, value in asdict(config).items() if key != "data_dir"}
+    meta["elapsed_s"] = round(elapsed, 3)
+    return {"meta": meta, **report, "threadpool": sampler.report(), "tmdb": tmdb_stats}
+
+
+def format_report(report: Dict[str, Any]) -> str:
+    lines = [
+        f"{report['requests']} requests in {report['meta']['elapsed_s']:.1f}s "
+        f"({report['throughput_rps']:.1f} req/s), error rate {report['error_rate']:.2%}",
+        f"{'route':<34} {'reqs':>7} {'rps':>8} {'p50ms':>9} {'p95ms':>9} {'p99ms':>9} {'errors':>7}",
+    ]
+    for route, r in report["routes"].items():
+        lines.append(f"{route:<34} {r['requests']:>7} {r['rps']:>8.1f} {r['p50_ms']:>9.2f} "
+                     f"{r['p95_ms']:>9.2f} {r['p99_ms']:>9.2f} {r['errors']:>7}")
+    pool = report["threadpool"]
+    if pool.get("samples"):
+        lines.append(
+            f"threadpool: {pool['total_tokens']} threads, busy max {pool['max_busy']} mean {pool['mean_busy']}, "
+            f"saturated {pool['saturated_fraction']:.1%} of samples, waiting max {pool['max_waiting']}"
+        )
+    return "\n".join(lines)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Load-test the API in-process over a synthetic dataset.")
+    parser.add_argument("--scale", default="tiny", choices=sorted(SCALES))
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--users", type=int, default=20, help="concurrent virtual users")
+    parser.add_argument("--duration", type=float, default=10.0, help="seconds of load")
+    parser.add_argument("--scenarios", type=int, default=None, help="stop after this many scenarios instead")
+    parser.add_argument("--mix", default=",".join(f"{k}={v:g}" for k, v in DEFAULT_MIX.items()),
+                        help=f"weighted scenarios from {sorted(SCENARIOS)}")
+    parser.add_argument("--think-time", type=float, default=0.0, help="seconds between a user's scenarios")
+    parser.add_argument("--target", default="asgi", choices=TARGETS)
+    parser.add_argument("--threadpool-size", type=int, default=None, help="threads for sync endpoints")
+    parser.add_argument("--tmdb-latency", default="constant:20", help="fake TMDb latency, e.g. lognormal:40:15")
+    parser.add_argument("--data-dir", type=Path, default=CACHE_DIR, help="where generated datasets are cached")
+    parser.add_argument("--out", type=Path, default=None, help="write the report JSON here")
+    args = parser.parse_args(argv)
+
+    config = LoadConfig(
+        scale=args.scale,
+        seed=args.seed,
+        users=args.users,
+        duration=args.duration,
+        scenarios=args.scenarios,
+        mix=parse_mix(args.mix),
+        think_time=args.think_time,
+        target=args.target,
+        threadpool_size=args.threadpool_size,
+        tmdb_latency=args.tmdb_latency,
+        data_dir=args.data_dir,
+    )
+    report = asyncio.run(run_load(config))
+    print(format_report(report))
+    if args.out is not None:
+        args.out.write_text(json.dumps(report, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,95 @@
+"""Resident size of the reviews held in memory: parsed dicts vs ReviewStore.
+
+Dicts are measured as reviews.json used to hold them, text inline; the
+store is built from reviews.json as it is now, with titles and bodies left
+in reviews.text, so its figure covers the columns only. The size of both
+JSON layouts and the time to parse them are reported alongside.
+
+Examples (from backend/):
+    python -m benchmarks.memory --scale small
+    python -m benchmarks.memory --scale large       # 1M reviews
+"""
+import argparse
+import gc
+import json
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Any, Callable, Dict
+
+from app.cli.generate_dataset import SCALES
+from app.repositories.review_repo import TEXT_FIELDS
+from app.repositories.review_store import ReviewStore, text_span
+from app.utils.text_blob import BlobView
+from benchmarks.dataset import CACHE_DIR, dataset_dir
+
+
+def traced_size(build: Callable[[], Any]) -> int:
+    """Bytes still allocated by `build()`'s result once it returns."""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        value = build()
+        gc.collect()
+        size, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del value
+    return size
+
+
+def _parse_seconds(payload: str) -> float:
+    started = time.perf_counter()
+    json.loads(payload)
+    return round(time.perf_counter() - started, 4)
+
+
+def measure_reviews(reviews_path: Path) -> Dict[str, Any]:
+    reviews_path = Path(reviews_path)
+    payload = reviews_path.read_text(encoding="utf-8-sig")
+    text_file = BlobView(reviews_path.with_suffix(".text"))
+    rows = json.loads(payload)
+    count = len(rows)
+    for row in rows:
+        span = text_span(row)
+        if span is not None:
+            offset, title, body = span
+            row[TEXT_FIELDS[0]] = text_file.read(offset, title)
+            row[TEXT_FIELDS[1]] = text_file.read(offset + title, body)
+    # Both layouts hold the same title/body strings once read; report them apart from the per-review overhead.
+    text = sum(sys.getsizeof(r.get("reviewTitle", "")) + sys.getsizeof(r.get("reviewBody", "")) for r in rows)
+    inline_payload = json.dumps(rows, ensure_ascii=False, indent=2)
+    del rows
+    dicts = traced_size(lambda: json.loads(inline_payload))
+    store = traced_size(lambda: ReviewStore.from_rows(json.loads(payload), text_file))
+    return {
+        "reviews": count,
+        "json_bytes": len(payload.encode("utf-8")),
+        "inline_json_bytes": len(inline_payload.encode("utf-8")),
+        "text_file_bytes": text_file.size,
+        "json_load_seconds": _parse_seconds(payload),
+        "inline_json_load_seconds": _parse_seconds(inline_payload),
+        "text_bytes": text,
+        "dicts_bytes": dicts,
+        "store_bytes": store,
+        "dicts_bytes_per_review_excluding_text": round((dicts - text) / count, 1) if count else 0,
+        "store_bytes_per_review": round(store / count, 1) if count else 0,
+        "ratio": round(store / dicts, 3) if dicts else 0,
+    }
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Compare memory held by review dicts and the columnar ReviewStore.")
+    parser.add_argument("--scale", choices=sorted(SCALES), default="small")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--data-dir", type=Path, default=CACHE_DIR, help="where generated datasets are cached")
+    args = parser.parse_args(argv)
+
+    result = measure_reviews(dataset_dir(args.scale, args.seed, args.data_dir) / "reviews.json")
+    print(json.dumps(result, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,65 @@
+"""Run benchmark cases across dataset sizes and collect results."""
+import platform
+import subprocess
+import tempfile
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+from benchmarks.cases import Case, Fixtures
+from benchmarks.dataset import CACHE_DIR, dataset_dir, scratch_copy, use_data_dir
+from benchmarks.harness import Measurement, measure
+
+
+def _git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True,
+            cwd=Path(__file__).resolve().parent,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def _run_case(case: Case, data: Path, iterations: int, warmup: int, seed: int) -> Measurement:
+    with use_data_dir(data):
+        fn = case.build(Fixtures.load())
+        return measure(fn, iterations=iterations, warmup=warmup, seed=seed)
+
+
+def run_suite(
+    sizes: Sequence[str],
+    cases: Sequence[Case],
+    *,
+    iterations: int = 20,
+    warmup: int = 2,
+    seed: int = 1,
+    data_dir: Path = CACHE_DIR,
+    progress: Optional[Callable[[str, Measurement], None]] = None,
+) -> Dict[str, Any]:
+    """Measure every case on every size; results are keyed "case@size"."""
+    results: Dict[str, Dict[str, Any]] = {}
+    for size in sizes:
+        data = dataset_dir(size, seed, data_dir)
+        for case in cases:
+            if case.writes:
+                with tempfile.TemporaryDirectory() as scratch_root, scratch_copy(data, Path(scratch_root)) as scratch:
+                    measurement = _run_case(case, scratch, iterations, warmup, seed)
+            else:
+                measurement = _run_case(case, data, iterations, warmup, seed)
+            key = f"{case.name}@{size}"
+            results[key] = measurement.to_dict()
+            if progress:
+                progress(key, measurement)
+    return {
+        "meta": {
+            "created_at": datetime.now(timezone.utc).isoformat(),
+            "commit": _git_commit(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "sizes": list(sizes),
+            "seed": seed,
+            "iterations": iterations,
+        },
+        "results": results,
+    }
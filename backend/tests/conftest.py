@@ -25,6 +25,39 @@ def mock_logger(mocker, tmp_path):
     
     Logger._instance = original_instance
 
+@pytest.fixture(autouse=True)
+def reset_file_indexes():
+    """Rebuild repository indexes per test so patched load_all calls are honoured."""
+    from app.utils.file_index import invalidate_all
+    invalidate_all()
+    yield
+    invalidate_all()
+
+@pytest.fixture(autouse=True)
+def tmdb_cache(tmp_path):
+    """Give each test an empty TMDb cache backed by a throwaway sqlite file."""
+    from app.services.tmdb_cache import TMDbResponseCache, set_cache
+    cache = TMDbResponseCache(path=str(tmp_path / "tmdb_cache.sqlite3"))
+    set_cache(cache)
+    yield cache
+    set_cache(None)
+
+@pytest.fixture(autouse=True)
+def tmdb_catalog(monkeypatch, tmp_path):
+    """Point the TMDb catalog at a per-test path that starts out missing."""
+    path = tmp_path / "tmdb_catalog.sqlite3"
+    monkeypatch.setattr("app.repositories.tmdb_catalog_repo.CATALOG_PATH", path)
+    return path
+
+@pytest.fixture(autouse=True)
+def tmdb_resilience(monkeypatch):
+    """Fresh breaker and rate limiter per test; retries back off without sleeping."""
+    from app.services import tmdb_service
+    from app.services.tmdb_resilience import CircuitBreaker, TokenBucket
+    monkeypatch.setattr(tmdb_service, "_breaker", CircuitBreaker())
+    monkeypatch.setattr(tmdb_service, "_rate_limiter", TokenBucket())
+    monkeypatch.setattr("app.services.tmdb_resilience.TMDB_RETRY_BASE_DELAY", 0.0)
+
 @pytest.fixture
 def user_data():
     payload = {
@@ -52,4 +85,13 @@ def mock_unauthorized_user():
     return {"user_id": "1234",
                 "username": "user",
                 "exp": datetime.datetime.now() + datetime.timedelta(1),
-                "role": "user"}
\ No newline at end of file
+                "role": "user"}
+
+
+@pytest.fixture(autouse=True)
+def metrics_registry():
+    """Zero the shared metrics so each test sees only its own requests."""
+    from app.utils.metrics import REGISTRY
+    REGISTRY.reset()
+    yield REGISTRY
+    REGISTRY.reset()
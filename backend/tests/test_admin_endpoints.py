@@ -42,4 +42,22 @@ def test_admin_summary_unauthorized_user(mocker, client, mock_unauthorized_user,
     mocker.patch("app.services.admin_summary_service.get_warned_users", return_value=[penalized_user])
     response = client.get("/admin")
     app.dependency_overrides.clear()
-    assert response.status_code == 403
\ No newline at end of file
+    assert response.status_code == 403
+
+def test_moderation_queue_endpoint(mocker, client, mock_admin_user):
+    from app.schemas.admin import ModerationQueuePage
+    app.dependency_overrides[jwt_auth_dependency] = lambda: mock_admin_user
+    queue = mocker.patch("app.routers.admin_endpoints.get_moderation_queue",
+                         return_value=ModerationQueuePage(reviews=[], total=0))
+    response = client.get("/admin/flagged-reviews?limit=10&cursor=2_2024-01-01T00:00:00_5")
+    app.dependency_overrides.clear()
+    assert response.status_code == 200
+    assert response.json() == {"reviews": [], "total": 0, "next_cursor": None}
+    queue.assert_called_once_with(cursor="2_2024-01-01T00:00:00_5", limit=10)
+
+
+def test_moderation_queue_endpoint_unauthorized(client, mock_unauthorized_user):
+    app.dependency_overrides[jwt_auth_dependency] = lambda: mock_unauthorized_user
+    response = client.get("/admin/flagged-reviews")
+    app.dependency_overrides.clear()
+    assert response.status_code == 403
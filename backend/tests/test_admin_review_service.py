@@ -1,55 +1,96 @@
-from app.services.admin_review_service import get_flagged_reviews, hide_review
+import pytest
+from fastapi import HTTPException
+from app.services.admin_review_service import get_flagged_reviews, get_moderation_queue, hide_review
 from app.schemas.review import Review
 
-def test_get_flagged_reviews_no_reviews(mocker):
-    mocker.patch("app.services.admin_review_service.list_reviews", return_value=[])
-    result = get_flagged_reviews()
-    assert len(result) == 0
-
-def test_get_flagged_reviews_has_flagged(mocker):
-    flagged_review = [Review(**{
-        "id": 1,
+def _review(review_id, visible=True):
+    return {
+        "id": review_id,
         "movieId": "1234",
         "authorId": -1,
-        "rating": 5.5,
+        "rating": 4.0,
         "reviewTitle": "good movie",
         "reviewBody": "loved the movie",
         "flagged": True,
-        "votes": 5,
-        "date": "2022-01-01"
-    })]
-    mocker.patch("app.services.admin_review_service.list_reviews", return_value=flagged_review)
+        "votes": 0,
+        "date": "2022-01-01",
+        "visible": visible,
+    }
+
+def _flag(user_id, review_id, timestamp):
+    return {"user_id": user_id, "review_id": review_id, "timestamp": timestamp}
+
+def test_get_flagged_reviews_no_reviews(mocker):
+    mocker.patch("app.repositories.flag_repo.load_all", return_value=[])
+    mocker.patch("app.repositories.review_repo.load_all", return_value=[])
     result = get_flagged_reviews()
-    assert len(result) == 1
-    assert all([review.flagged for review in result])
+    assert len(result) == 0
 
-def test_get_flagged_reviews_has_flagged_and_unflagged(mocker):
-    flagged_review = [Review(**{
-        "id": 1,
-        "movieId": "1234",
-        "authorId": -1,
-        "rating": 5.5,
-        "reviewTitle": "good movie",
-        "reviewBody": "loved the movie",
-        "flagged": True,
-        "votes": 5,
-        "date": "2022-01-01"
-    }),
-    Review(**{
-        "id": 2,
-        "movieId": "5678",
-        "authorId": -1,
-        "rating": 5.5,
-        "reviewTitle": "another good movie",
-        "reviewBody": "loved the movie too",
-        "flagged": False,
-        "votes": 0,
-        "date": "2022-01-01"
-    })]
-    mocker.patch("app.services.admin_review_service.list_reviews", return_value=flagged_review)
+def test_get_flagged_reviews_has_flagged(mocker):
+    mocker.patch("app.repositories.flag_repo.load_all", return_value=[_flag("u1", 1, "2024-01-01T00:00:00")])
+    mocker.patch("app.repositories.review_repo.load_all", return_value=[_review(1)])
     result = get_flagged_reviews()
     assert len(result) == 1
     assert all([review.flagged for review in result])
+    assert result[0].flagCount == 1
+
+def test_get_flagged_reviews_skips_hidden_and_deleted(mocker):
+    mocker.patch("app.repositories.flag_repo.load_all", return_value=[
+        _flag("u1", 1, "2024-01-01T00:00:00"),
+        _flag("u1", 2, "2024-01-01T00:00:00"),
+        _flag("u1", 3, "2024-01-01T00:00:00"),
+    ])
+    mocker.patch("app.repositories.review_repo.load_all", return_value=[_review(1), _review(2, visible=False)])
+    result = get_flagged_reviews()
+    assert [review.id for review in result] == [1]
+    assert get_moderation_queue().total == 1
+
+def test_moderation_queue_orders_by_count_then_first_flag(mocker):
+    mocker.patch("app.repositories.flag_repo.load_all", return_value=[
+        _flag("u1", 1, "2024-03-01T00:00:00"),
+        _flag("u1", 2, "2024-02-01T00:00:00"),
+        _flag("u2", 2, "2024-02-05T00:00:00"),
+        _flag("u1", 3, "2024-01-01T00:00:00"),
+    ])
+    mocker.patch("app.repositories.review_repo.load_all", return_value=[_review(1), _review(2), _review(3)])
+    result = get_flagged_reviews()
+    assert [review.id for review in result] == [2, 3, 1]
+    assert [review.flagCount for review in result] == [2, 1, 1]
+    assert result[0].firstFlaggedAt.isoformat() == "2024-02-01T00:00:00"
+
+def test_moderation_queue_cursor_pagination(mocker):
+    mocker.patch("app.repositories.flag_repo.load_all", return_value=[
+        _flag("u1", review_id, f"2024-01-0{review_id}T00:00:00") for review_id in range(1, 6)
+    ])
+    mocker.patch("app.repositories.review_repo.load_all", return_value=[_review(i) for i in range(1, 6)])
+    first = get_moderation_queue(limit=2)
+    assert [review.id for review in first.reviews] == [1, 2]
+    assert first.total == 5
+    second = get_moderation_queue(cursor=first.next_cursor, limit=2)
+    assert [review.id for review in second.reviews] == [3, 4]
+    last = get_moderation_queue(cursor=second.next_cursor, limit=2)
+    assert [review.id for review in last.reviews] == [5]
+    assert last.next_cursor is None
+
+def test_moderation_queue_builds_reviews_from_store_rows(mocker):
+    mocker.patch("app.repositories.flag_repo.load_all", return_value=[
+        _flag("u1", 1, "2024-01-01T00:00:00"),
+        _flag("u2", 1, "2024-01-02T00:00:00"),
+    ])
+    stored = {**_review(1), "rating": 5, "legacyField": "x"}
+    mocker.patch("app.repositories.review_repo.load_all", return_value=[{"reviewTitle": "no id"}, stored])
+    page = get_moderation_queue()
+    assert page.total == 1
+    [review] = page.reviews
+    assert (review.id, review.rating, review.flagCount) == (1, 5.0, 2)
+    assert review.reviewBody == "loved the movie"
+    assert review.firstFlaggedAt.isoformat() == "2024-01-01T00:00:00"
+
+def test_moderation_queue_invalid_cursor(mocker):
+    mocker.patch("app.repositories.flag_repo.load_all", return_value=[])
+    with pytest.raises(HTTPException) as ex:
+        get_moderation_queue(cursor="garbage")
+    assert ex.value.status_code == 400
 
 def test_hide_review_hides_review(mocker):
     mocker.patch("app.services.admin_review_service.load_all", return_value=[
@@ -26,39 +26,52 @@ def warned_users():
 ]
 
 def test_get_user_count_one_user(mocker, user_data):
-    mocker.patch("app.services.admin_user_service.load_all", return_value=[user_data])
+    mocker.patch("app.repositories.user_repo.load_all", return_value=[user_data])
     total_users = get_user_count()
     assert total_users == 1
 
 def test_get_user_count_no_users(mocker):
-    mocker.patch("app.services.admin_user_service.load_all", return_value=[])
+    mocker.patch("app.repositories.user_repo.load_all", return_value=[])
     total_users = get_user_count()
     assert total_users == 0
 
 def test_get_warned_users(mocker, warned_users):
-    user_objects = [User(**usr) for usr in warned_users]
-    mocker.patch("app.services.admin_user_service.list_users", return_value=user_objects)
+    mocker.patch("app.repositories.user_repo.load_all", return_value=warned_users)
     total_warned_users = get_warned_users()
     assert len(total_warned_users) == 1
     assert total_warned_users[0].warnings == 5
 
 def test_get_warned_users_no_warned_users(mocker, warned_users):
-    user_objects = [User(**usr) for usr in warned_users]
-    user_objects[1].warnings = 0
-    mocker.patch("app.services.admin_user_service.list_users", return_value=user_objects)
+    warned_users[1]["warnings"] = 0
+    mocker.patch("app.repositories.user_repo.load_all", return_value=warned_users)
     total_warned_users = get_warned_users()
     assert len(total_warned_users) == 0
 
 def test_get_banned_users(mocker, warned_users):
-    user_objects = [User(**usr) for usr in warned_users]
-    mocker.patch("app.services.admin_user_service.list_users", return_value=user_objects)
+    mocker.patch("app.repositories.user_repo.load_all", return_value=warned_users)
     total_banned_users = get_banned_users()
     assert len(total_banned_users) == 1
     assert total_banned_users[0].active == False
 
 def test_get_banned_users_no_banned_users(mocker, warned_users):
-    user_objects = [User(**usr) for usr in warned_users]
-    user_objects[1].active = True
-    mocker.patch("app.services.admin_user_service.list_users", return_value=user_objects)
+    warned_users[1]["active"] = True
+    mocker.patch("app.repositories.user_repo.load_all", return_value=warned_users)
     total_banned_users = get_banned_users()
-    assert len(total_banned_users) == 0
\ No newline at end of file
+    assert len(total_banned_users) == 0
+
+def test_penalized_users_hide_passwords(mocker, warned_users):
+    mocker.patch("app.repositories.user_repo.load_all", return_value=warned_users)
+    assert all(user.hashed_password is None for user in get_warned_users() + get_banned_users())
+
+def test_counters_follow_saved_users(mocker, tmp_path, warned_users):
+    from app.repositories import user_repo
+    mocker.patch.object(user_repo, "DATA_PATH", tmp_path / "users.json")
+    user_repo.save_all(warned_users)
+    load = mocker.spy(user_repo, "load_all")
+    assert get_user_count() == 2
+    assert [user.id for user in get_banned_users()] == ["abcd"]
+    user_repo.save_all([{**warned_users[1], "active": True, "warnings": 0}])
+    assert get_user_count() == 1
+    assert get_banned_users() == []
+    assert get_warned_users() == []
+    assert not load.called
@@ -4,7 +4,9 @@ from fastapi import HTTPException, Request
 import jwt
 import os
 from datetime import datetime, timedelta, timezone
+import json
 from app.middleware.auth_middleware import jwt_auth_dependency
+from app.repositories import user_repo
 
 JWT_SECRET = os.getenv("JWT_SECRET")
 
@@ -25,6 +27,16 @@ def create_token(payload: dict, expired=False):
     return jwt.encode({**payload, "exp": exp}, JWT_SECRET, algorithm="HS256")
 
 
+@pytest.fixture(autouse=True)
+def users_file(tmp_path, monkeypatch):
+    path = tmp_path / "users.json"
+    path.write_text(json.dumps([
+        {"id": "123", "username": "tester", "role": "user", "active": True},
+    ]))
+    monkeypatch.setattr(user_repo, "DATA_PATH", path)
+    return path
+
+
 def test_missing_header():
     request = make_request_with_token(None)
     with pytest.raises(HTTPException) as exc:
@@ -45,3 +57,44 @@ def test_expired_token():
     request = make_request_with_token(token)
     with pytest.raises(HTTPException):
         asyncio.run(jwt_auth_dependency(request))
+
+
+def test_banned_user_rejected(users_file):
+    user_repo.save_all([{"id": "123", "username": "tester", "role": "user", "active": False}])
+    request = make_request_with_token(create_token({"user_id": "123"}))
+    with pytest.raises(HTTPException) as exc:
+        asyncio.run(jwt_auth_dependency(request))
+    assert exc.value.status_code == 403
+
+
+def test_unknown_user_rejected():
+    request = make_request_with_token(create_token({"user_id": "ghost"}))
+    with pytest.raises(HTTPException) as exc:
+        asyncio.run(jwt_auth_dependency(request))
+    assert exc.value.status_code == 401
+
+
+def test_token_from_older_epoch_revoked(users_file):
+    user_repo.save_all([{"id": "123", "username": "tester", "role": "user", "active": True, "token_epoch": 2}])
+    stale = make_request_with_token(create_token({"user_id": "123", "epoch": 1}))
+    with pytest.raises(HTTPException) as exc:
+        asyncio.run(jwt_auth_dependency(stale))
+    assert exc.value.status_code == 401
+    fresh = make_request_with_token(create_token({"user_id": "123", "epoch": 2}))
+    assert asyncio.run(jwt_auth_dependency(fresh))["user_id"] == "123"
+
+
+def test_role_change_applies_to_existing_token(users_file):
+    token = create_token({"user_id": "123", "role": "admin"})
+    assert asyncio.run(jwt_auth_dependency(make_request_with_token(token)))["role"] == "user"
+
+
+def test_external_file_change_reloads_status(users_file):
+    request = make_request_with_token(create_token({"user_id": "123"}))
+    asyncio.run(jwt_auth_dependency(request))
+    users_file.write_text(json.dumps([
+        {"id": "123", "username": "tester", "role": "user", "active": False, "extra": "changed"},
+    ]))
+    with pytest.raises(HTTPException) as exc:
+        asyncio.run(jwt_auth_dependency(make_request_with_token(create_token({"user_id": "123"}))))
+    assert exc.value.status_code == 403
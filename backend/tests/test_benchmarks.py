@@ -0,0 +1,76 @@
+"""
+Tests for the benchmark suite plumbing
+"""
+import json
+
+from app.repositories import review_repo
+from benchmarks.__main__ import main as bench_main
+from benchmarks.cases import CASES
+from benchmarks.compare import compare
+from benchmarks.dataset import dataset_dir, use_data_dir
+from benchmarks.harness import measure, percentile
+from benchmarks.memory import measure_reviews
+from benchmarks.runner import run_suite
+
+
+def test_percentile_nearest_rank():
+    values = [float(v) for v in range(1, 101)]
+    assert percentile(values, 50) == 50.0
+    assert percentile(values, 99) == 99.0
+    assert percentile([3.0], 90) == 3.0
+
+
+def test_measure_reports_latency_and_allocations():
+    result = measure(lambda: [0] * 100_000, iterations=3, warmup=0)
+    assert result.iterations == 3
+    assert result.min_ms <= result.p50_ms <= result.max_ms
+    assert result.alloc_peak_bytes >= 100_000 * 8
+
+
+def test_use_data_dir_redirects_and_restores(tmp_path):
+    original = review_repo.DATA_PATH
+    data = dataset_dir("tiny", 1, tmp_path)
+    with use_data_dir(data):
+        assert review_repo.DATA_PATH == data / "reviews.json"
+        assert len(review_repo.load_all(load_invisible=True)) == 200
+    assert review_repo.DATA_PATH == original
+
+
+def test_run_suite_covers_every_case_without_touching_cached_data(tmp_path):
+    data = dataset_dir("tiny", 1, tmp_path)
+    before = (data / "reviews.json").read_bytes()
+
+    results = run_suite(["tiny"], CASES, iterations=1, warmup=0, data_dir=tmp_path)
+
+    assert set(results["results"]) == {f"{case.name}@tiny" for case in CASES}
+    assert results["meta"]["sizes"] == ["tiny"]
+    assert (data / "reviews.json").read_bytes() == before
+
+
+def test_compare_flags_regressions_over_threshold():
+    baseline = {"results": {"a@tiny": {"p50_ms": 10.0, "read_bytes": None}, "b@tiny": {"p50_ms": 10.0}}}
+    current = {"results": {"a@tiny": {"p50_ms": 11.0, "read_bytes": 5}, "b@tiny": {"p50_ms": 13.0},
+                           "c@tiny": {"p50_ms": 99.0}}}
+    regressions = compare(current, baseline, threshold=0.2, metrics=["p50_ms", "read_bytes"])
+    assert [(r.key, r.metric) for r in regressions] == [("b@tiny", "p50_ms")]
+
+
+def test_cli_fails_on_regression(tmp_path):
+    args = ["--sizes", "tiny", "--cases", "get_leaderboard_reviews", "--iterations", "2",
+            "--warmup", "0", "--data-dir", str(tmp_path)]
+    baseline_path = tmp_path / "baseline.json"
+    assert bench_main(args + ["--save-baseline", str(baseline_path)]) == 0
+
+    baseline = json.loads(baseline_path.read_text())
+    for result in baseline["results"].values():
+        result["p50_ms"] = result["p50_ms"] / 100
+    baseline_path.write_text(json.dumps(baseline))
+    assert bench_main(args + ["--baseline", str(baseline_path)]) == 1
+
+
+def test_memory_report_compares_dicts_and_store(tmp_path):
+    report = measure_reviews(dataset_dir("tiny", 1, tmp_path) / "reviews.json")
+    assert report["reviews"] == 200
+    assert report["store_bytes_per_review"] < report["dicts_bytes_per_review_excluding_text"]
+    assert report["text_file_bytes"] > 0
+    assert report["json_bytes"] * 3 < report["inline_json_bytes"]
@@ -1,29 +1,76 @@
-from app.services.comment_service import get_comments_by_review_id, create_comment
+from app.services.comment_service import get_comments_by_review_id, get_comments_page, create_comment
 from app.schemas.comment import CommentCreate, Comment
 
 
+def _comment(comment_id, author_id="u1", review_id=10):
+    return {"id": comment_id, "reviewId": review_id, "authorId": author_id, "commentBody": f"Comment {comment_id}", "date": "2024-01-01"}
+
+
 def test_get_comments_by_review_id_returns_comments_with_usernames(mocker):
     mocker.patch(
-        "app.services.comment_service.load_all",
+        "app.services.comment_service.get_by_review_id",
         return_value=[
             {"id": 1, "reviewId": 10, "authorId": "u1", "commentBody": "Hello", "date": "2024-01-01"}
         ],
     )
-    mock_user = mocker.MagicMock()
-    mock_user.username = "bob"
-    mocker.patch("app.services.comment_service.get_user_by_id", return_value=mock_user)
+    mocker.patch("app.services.comment_service.get_usernames_by_ids", return_value={"u1": "bob"})
     result = get_comments_by_review_id(10)
     assert len(result) == 1
-    assert result[0]["authorUsername"] == "bob"
-    assert result[0]["commentBody"] == "Hello"
+    assert result[0].authorUsername == "bob"
+    assert result[0].commentBody == "Hello"
 
 
 def test_get_comments_by_review_id_returns_empty_list_when_no_comments(mocker):
-    mocker.patch("app.services.comment_service.load_all", return_value=[])
+    mocker.patch("app.services.comment_service.get_by_review_id", return_value=[])
     result = get_comments_by_review_id(99)
     assert result == []
 
 
+def test_get_comments_resolves_authors_in_one_lookup(mocker):
+    mocker.patch(
+        "app.services.comment_service.get_by_review_id",
+        return_value=[_comment(1, "u1"), _comment(2, "u2"), _comment(3, "u1")],
+    )
+    lookup = mocker.patch("app.services.comment_service.get_usernames_by_ids", return_value={"u1": "bob", "u2": "amy"})
+    result = get_comments_by_review_id(10)
+    lookup.assert_called_once_with({"u1", "u2"})
+    assert [c.authorUsername for c in result] == ["bob", "amy", "bob"]
+
+
+def test_get_comments_unknown_author_falls_back(mocker):
+    mocker.patch("app.services.comment_service.get_by_review_id", return_value=[_comment(1, "gone")])
+    mocker.patch("app.services.comment_service.get_usernames_by_ids", return_value={})
+    result = get_comments_by_review_id(10)
+    assert result[0].authorUsername == "Unknown User"
+
+
+def test_get_comments_page_walks_cursor(mocker):
+    mocker.patch(
+        "app.services.comment_service.get_by_review_id",
+        return_value=[_comment(1), _comment(4), _comment(7)],
+    )
+    mocker.patch("app.services.comment_service.get_usernames_by_ids", return_value={"u1": "bob"})
+
+    first = get_comments_page(10, limit=2)
+    assert [c.id for c in first.comments] == [1, 4]
+    assert first.next_cursor == 4
+
+    second = get_comments_page(10, cursor=first.next_cursor, limit=2)
+    assert [c.id for c in second.comments] == [7]
+    assert second.next_cursor is None
+
+
+def test_get_comments_page_without_limit_returns_rest(mocker):
+    mocker.patch(
+        "app.services.comment_service.get_by_review_id",
+        return_value=[_comment(1), _comment(4), _comment(7)],
+    )
+    mocker.patch("app.services.comment_service.get_usernames_by_ids", return_value={"u1": "bob"})
+    page = get_comments_page(10, cursor=1)
+    assert [c.id for c in page.comments] == [4, 7]
+    assert page.next_cursor is None
+
+
 def test_create_comment_adds_and_saves_comment(mocker):
     mocker.patch(
         "app.services.comment_service.load_all",
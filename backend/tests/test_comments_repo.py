@@ -0,0 +1,53 @@
+import json
+from app.repositories import comments_repo
+
+
+def _use_file(tmp_path, monkeypatch, comments):
+    path = tmp_path / "comments.json"
+    path.write_text(json.dumps(comments), encoding="utf-8")
+    monkeypatch.setattr(comments_repo, "DATA_PATH", path)
+    return path
+
+
+def test_get_by_review_id_groups_and_orders(tmp_path, monkeypatch):
+    _use_file(tmp_path, monkeypatch, [
+        {"id": 3, "reviewId": 1, "authorId": "a", "commentBody": "c", "date": "2024-01-01"},
+        {"id": 1, "reviewId": 1, "authorId": "a", "commentBody": "a", "date": "2024-01-01"},
+        {"id": 2, "reviewId": 2, "authorId": "b", "commentBody": "b", "date": "2024-01-01"},
+    ])
+    assert [c["id"] for c in comments_repo.get_by_review_id(1)] == [1, 3]
+    assert [c["id"] for c in comments_repo.get_by_review_id(2)] == [2]
+    assert comments_repo.get_by_review_id(99) == []
+
+
+def test_save_all_refreshes_index(tmp_path, monkeypatch):
+    _use_file(tmp_path, monkeypatch, [])
+    assert comments_repo.get_by_review_id(1) == []
+    comments_repo.save_all([{"id": 1, "reviewId": 1, "authorId": "a", "commentBody": "a", "date": "2024-01-01"}])
+    assert [c["id"] for c in comments_repo.get_by_review_id(1)] == [1]
+
+
+def test_count_by_review_id(tmp_path, monkeypatch):
+    _use_file(tmp_path, monkeypatch, [
+        {"id": 1, "reviewId": 1, "authorId": "a", "commentBody": "a", "date": "2024-01-01"},
+        {"id": 2, "reviewId": 1, "authorId": "b", "commentBody": "b", "date": "2024-01-01"},
+        {"id": 3, "reviewId": 2, "authorId": "b", "commentBody": "c", "date": "2024-01-01"},
+    ])
+    assert comments_repo.count_by_review_id() == {1: 2, 2: 1}
+
+
+def test_delete_by_review_id_updates_counts(tmp_path, monkeypatch):
+    path = _use_file(tmp_path, monkeypatch, [
+        {"id": 1, "reviewId": 1, "authorId": "a", "commentBody": "a", "date": "2024-01-01"},
+        {"id": 2, "reviewId": 2, "authorId": "b", "commentBody": "b", "date": "2024-01-01"},
+    ])
+    assert comments_repo.delete_by_review_id(1) == 1
+    assert comments_repo.count_by_review_id() == {2: 1}
+    assert [c["id"] for c in json.loads(path.read_text(encoding="utf-8"))] == [2]
+
+
+def test_delete_by_review_id_without_comments_skips_write(tmp_path, monkeypatch, mocker):
+    _use_file(tmp_path, monkeypatch, [])
+    mock_save = mocker.patch("app.repositories.comments_repo.save_all")
+    assert comments_repo.delete_by_review_id(5) == 0
+    assert not mock_save.called
@@ -0,0 +1,117 @@
+"""
+TMDb service behaviour against the local fake TMDb server.
+"""
+import asyncio
+import random
+
+import httpx
+import pytest
+from fastapi import HTTPException
+
+from app.cli.fake_tmdb import FakeTMDbConfig, FakeTMDbServer, LatencyModel, synthetic_catalog
+from app.services import tmdb_service
+from app.services.tmdb_resilience import CircuitBreaker
+
+CATALOG = {
+    1: {"id": 1, "title": "Inception", "overview": "Dreams.", "release_date": "2010-07-15",
+        "poster_path": "/inception.jpg", "backdrop_path": None, "runtime": 148,
+        "genres": [{"id": 1, "name": "Action"}], "popularity": 80.0},
+    2: {"id": 2, "title": "Inception: The Cobol Job", "overview": "", "release_date": "2010-12-07",
+        "poster_path": None, "backdrop_path": None, "runtime": 14, "genres": [], "popularity": 3.0},
+}
+
+
+@pytest.fixture
+def fake_tmdb(monkeypatch):
+    servers = []
+
+    def start(**config):
+        server = FakeTMDbServer(config=FakeTMDbConfig(**config), catalog=CATALOG).start()
+        servers.append(server)
+        monkeypatch.setattr(tmdb_service, "TMDB_BASE_URL", server.base_url)
+        monkeypatch.setattr(tmdb_service, "TMDB_API_KEY", "test_key")
+        return server
+
+    yield start
+    for server in servers:
+        server.stop()
+
+
+def test_latency_model_parse_and_sample():
+    rng = random.Random(1)
+    assert LatencyModel.parse("constant:50").sample(rng) == 0.05
+    assert 0.02 <= LatencyModel.parse("uniform:20:80").sample(rng) <= 0.08
+    assert LatencyModel.parse("lognormal:40:15").sample(rng) > 0
+    with pytest.raises(ValueError):
+        LatencyModel.parse("zipf:3")
+
+
+def test_synthetic_catalog_is_deterministic():
+    assert synthetic_catalog(50, seed=7) == synthetic_catalog(50, seed=7)
+    assert synthetic_catalog(50, seed=7) != synthetic_catalog(50, seed=8)
+
+
+def test_unknown_api_key_is_rejected(fake_tmdb):
+    server = fake_tmdb(api_key="right")
+    response = httpx.get(f"{server.base_url}/search/movie", params={"query": "x", "api_key": "wrong"})
+    assert response.status_code == 401
+    assert server.stats["unauthorized"] == 1
+
+
+async def test_search_and_details(fake_tmdb):
+    server = fake_tmdb()
+
+    results = await tmdb_service.search_tmdb_movies("incep")
+    details = await tmdb_service.get_tmdb_movie_details(1)
+
+    assert [m["title"] for m in results] == ["Inception", "Inception: The Cobol Job"]
+    assert details["duration"] == 148
+    assert details["genre"] == "Action"
+    assert server.stats["search"] == 1 and server.stats["details"] == 1
+
+
+async def test_missing_movie_is_404_and_cached(fake_tmdb):
+    server = fake_tmdb()
+    for _ in range(2):
+        with pytest.raises(HTTPException) as exc_info:
+            await tmdb_service.get_tmdb_movie_details(999)
+        assert exc_info.value.status_code == 404
+    assert server.stats["not_found"] == 1
+
+
+async def test_transient_errors_are_retried(fake_tmdb):
+    server = fake_tmdb(fail_first=2)
+    results = await tmdb_service.search_tmdb_movies("inception")
+    assert results
+    assert server.stats["errors"] == 2
+    assert server.stats["search"] == 1
+
+
+async def test_rate_limited_requests_honor_retry_after(fake_tmdb, monkeypatch):
+    monkeypatch.setattr("app.services.tmdb_resilience.TMDB_MAX_RETRIES", 10)
+    server = fake_tmdb(rate_limit_rate=0.5, retry_after=0, seed=3)
+
+    results = await asyncio.gather(*(tmdb_service.search_tmdb_movies(f"inception {i}") for i in range(10)))
+
+    assert len(results) == 10
+    assert server.stats["rate_limited"] > 0
+    assert server.stats["search"] == 10
+
+
+async def test_breaker_opens_against_failing_server(fake_tmdb, monkeypatch):
+    monkeypatch.setattr(tmdb_service, "_breaker", CircuitBreaker(threshold=2))
+    server = fake_tmdb(error_rate=1.0)
+
+    for i in range(4):
+        with pytest.raises(HTTPException) as exc_info:
+            await tmdb_service.search_tmdb_movies(f"q{i}")
+        assert exc_info.value.status_code == 503
+
+    assert tmdb_service._breaker.state == "open"
+    assert server.stats["requests"] == 2 * 3  # two calls with retries, then fail-fast
+
+
+async def test_concurrent_identical_searches_hit_server_once(fake_tmdb):
+    server = fake_tmdb(latency=LatencyModel.parse("constant:50"))
+    await asyncio.gather(*(tmdb_service.search_tmdb_movies("inception") for _ in range(8)))
+    assert server.stats["requests"] == 1
@@ -0,0 +1,67 @@
+import json
+
+from app.utils.file_index import FileIndex, file_signature
+
+
+def _make_index(path, calls):
+    def load():
+        calls.append(1)
+        if not path.exists():
+            return []
+        return json.loads(path.read_text())
+
+    return FileIndex(lambda: path, load, lambda rows: {row["id"] for row in rows})
+
+
+def test_file_signature_missing_file(tmp_path):
+    assert file_signature(tmp_path / "missing.json") is None
+
+
+def test_get_loads_once_while_file_unchanged(tmp_path):
+    path = tmp_path / "data.json"
+    path.write_text(json.dumps([{"id": 1}]))
+    calls = []
+    index = _make_index(path, calls)
+
+    assert index.get() == {1}
+    assert index.get() == {1}
+    assert len(calls) == 1
+
+
+def test_get_reloads_after_file_change(tmp_path):
+    path = tmp_path / "data.json"
+    path.write_text(json.dumps([{"id": 1}]))
+    calls = []
+    index = _make_index(path, calls)
+    index.get()
+
+    path.write_text(json.dumps([{"id": 1}, {"id": 2}]))
+
+    assert index.get() == {1, 2}
+    assert len(calls) == 2
+
+
+def test_prime_skips_reload(tmp_path):
+    path = tmp_path / "data.json"
+    calls = []
+    index = _make_index(path, calls)
+    rows = [{"id": 5}]
+    path.write_text(json.dumps(rows))
+
+    index.prime(rows)
+
+    assert index.get() == {5}
+    assert calls == []
+
+
+def test_invalidate_forces_reload(tmp_path):
+    path = tmp_path / "data.json"
+    path.write_text(json.dumps([{"id": 1}]))
+    calls = []
+    index = _make_index(path, calls)
+    index.get()
+
+    index.invalidate()
+    index.get()
+
+    assert len(calls) == 2
@@ -137,4 +137,30 @@ def test_unflag_review_not_found(mocker, client, mock_admin_user):
     response = client.post("/reviews/123/unflag")
     app.dependency_overrides.clear()
     
-    assert response.status_code == 404
\ No newline at end of file
+    assert response.status_code == 404
+
+def test_batch_flag_status_requires_authentication(client):
+    response = client.get("/reviews/flag-status?review_ids=1")
+    assert response.status_code == 401
+
+
+def test_batch_flag_status_returns_each_review(mocker, client, mock_user):
+    app.dependency_overrides[jwt_auth_dependency] = lambda: mock_user
+    mocker.patch("app.services.flag_service.flag_repo.has_flagged", side_effect=lambda u, r: r == 2)
+    mocker.patch("app.services.flag_service.flag_repo.count_for_review", side_effect=lambda r: {2: 3}.get(r, 0))
+
+    response = client.get("/reviews/flag-status?review_ids=1&review_ids=2&review_ids=1")
+    app.dependency_overrides.clear()
+
+    assert response.status_code == 200
+    assert response.json() == [
+        {"review_id": 1, "has_flagged": False, "flag_count": 0},
+        {"review_id": 2, "has_flagged": True, "flag_count": 3},
+    ]
+
+
+def test_batch_flag_status_requires_ids(client, mock_user):
+    app.dependency_overrides[jwt_auth_dependency] = lambda: mock_user
+    response = client.get("/reviews/flag-status")
+    app.dependency_overrides.clear()
+    assert response.status_code == 422
@@ -38,7 +38,7 @@ def test_flag_review_integration_persists_and_marks_review(tmp_path, monkeypatch
     ])
 
     # Patch repository data locations
-    monkeypatch.setattr(flag_repo, "DATA_FILE", str(flags_file))
+    monkeypatch.setattr(flag_repo, "DATA_PATH", flags_file)
     monkeypatch.setattr(review_repo, "DATA_PATH", reviews_file)
 
     user = {"user_id": "user-123", "username": "tester", "role": "user"}
@@ -78,7 +78,7 @@ def test_flag_review_integration_duplicate(tmp_path, monkeypatch, client):
         }
     ])
 
-    monkeypatch.setattr(flag_repo, "DATA_FILE", str(flags_file))
+    monkeypatch.setattr(flag_repo, "DATA_PATH", flags_file)
     monkeypatch.setattr(review_repo, "DATA_PATH", reviews_file)
 
     user = {"user_id": "user-999", "username": "tester", "role": "user"}
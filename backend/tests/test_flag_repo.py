@@ -0,0 +1,81 @@
+import json
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from app.repositories import flag_repo
+
+
+def _use_file(tmp_path, monkeypatch, flags):
+    path = tmp_path / "flags.json"
+    path.write_text(json.dumps(flags), encoding="utf-8")
+    monkeypatch.setattr(flag_repo, "DATA_PATH", path)
+    return path
+
+
+def test_data_path_is_absolute():
+    assert flag_repo.DATA_PATH.is_absolute()
+    assert flag_repo.DATA_PATH.name == "flags.json"
+
+
+def test_load_all_invalid_json_returns_empty(tmp_path, monkeypatch):
+    path = tmp_path / "flags.json"
+    path.write_text("{not json", encoding="utf-8")
+    monkeypatch.setattr(flag_repo, "DATA_PATH", path)
+    assert flag_repo.load_all() == []
+
+
+def test_save_all_replaces_file_atomically(tmp_path, monkeypatch, mocker):
+    path = _use_file(tmp_path, monkeypatch, [])
+    replace = mocker.spy(flag_repo.os, "replace")
+    flag_repo.save_all([{"user_id": "u1", "review_id": 1, "timestamp": "2024-01-01T00:00:00"}])
+    replace.assert_called_once()
+    tmp, target = replace.call_args[0]
+    assert target == path
+    assert Path(tmp).parent == tmp_path and Path(tmp).name != "flags.tmp"
+    assert not Path(tmp).exists()
+    assert json.loads(path.read_text(encoding="utf-8"))[0]["user_id"] == "u1"
+
+
+def test_concurrent_add_flag_keeps_every_flag(tmp_path, monkeypatch):
+    path = _use_file(tmp_path, monkeypatch, [])
+
+    def flag(n):
+        return flag_repo.add_flag({"user_id": f"u{n}", "review_id": 1, "timestamp": "2024-01-01T00:00:00"})
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        counts = list(pool.map(flag, range(40)))
+
+    assert sorted(counts) == list(range(1, 41))
+    saved = json.loads(path.read_text(encoding="utf-8"))
+    assert sorted(f["user_id"] for f in saved) == sorted(f"u{n}" for n in range(40))
+    assert list(tmp_path.glob("*.tmp")) == []
+
+
+def test_add_flag_rejects_a_repeat_pair(tmp_path, monkeypatch):
+    _use_file(tmp_path, monkeypatch, [{"user_id": "u1", "review_id": 1, "timestamp": "2024-01-01T00:00:00"}])
+    assert flag_repo.add_flag({"user_id": "u1", "review_id": 1, "timestamp": "2024-01-02T00:00:00"}) is None
+    assert flag_repo.count_for_review(1) == 1
+
+
+def test_index_answers_pairs_and_counts(tmp_path, monkeypatch):
+    _use_file(tmp_path, monkeypatch, [
+        {"user_id": "u1", "review_id": 1, "timestamp": "2024-01-01T00:00:00"},
+        {"user_id": "u2", "review_id": 1, "timestamp": "2024-01-01T00:00:00"},
+        {"user_id": "u1", "review_id": 2, "timestamp": "2024-01-01T00:00:00"},
+    ])
+    assert flag_repo.has_flagged("u1", 1)
+    assert not flag_repo.has_flagged("u2", 2)
+    assert flag_repo.count_for_review(1) == 2
+    assert flag_repo.count_for_review(3) == 0
+
+
+def test_save_all_refreshes_index(tmp_path, monkeypatch):
+    _use_file(tmp_path, monkeypatch, [])
+    assert flag_repo.count_for_review(1) == 0
+    flags = flag_repo.all_flags()
+    flags.append({"user_id": "u1", "review_id": 1, "timestamp": "2024-01-01T00:00:00"})
+    flag_repo.save_all(flags)
+    assert flag_repo.has_flagged("u1", 1)
+    assert flag_repo.count_for_review(1) == 1
+    flag_repo.save_all([])
+    assert not flag_repo.has_flagged("u1", 1)
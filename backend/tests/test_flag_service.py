@@ -210,3 +210,18 @@ def test_unflag_review_not_found(mocker, mock_flagged_review):
         flag_service.unflag_review(review_id=123)
     assert ex.value.status_code == 404
 
+
+
+def test_get_flag_statuses_uses_index(mocker):
+    """Batch status reads counts and pairs from the flag index in one pass"""
+    mocker.patch("app.repositories.flag_repo.load_all", return_value=[
+        {"user_id": "u-1", "review_id": 7},
+        {"user_id": "u-2", "review_id": 7},
+        {"user_id": "u-2", "review_id": 8},
+    ])
+    statuses = flag_service.get_flag_statuses("u-1", [7, 8, 9])
+    assert [(s.review_id, s.has_flagged, s.flag_count) for s in statuses] == [
+        (7, True, 2),
+        (8, False, 1),
+        (9, False, 0),
+    ]
@@ -0,0 +1,105 @@
+"""
+Tests for the synthetic dataset generator
+"""
+import json
+from collections import Counter
+
+import bcrypt
+import pytest
+
+from app.cli.generate_dataset import SCALES, SYNTHETIC_PASSWORD, generate, main, write_json_array
+from app.repositories import review_repo
+from app.schemas.battle import Battle
+from app.schemas.comment import Comment
+from app.schemas.flag import Flag
+from app.schemas.movie import Movie
+from app.schemas.review import Review
+from app.schemas.user import User
+from app.schemas.watchlist import Watchlist
+
+FILES = ["users", "movies", "reviews", "battles", "flags", "comments", "watchlist"]
+
+
+@pytest.fixture(scope="module")
+def dataset(tmp_path_factory):
+    out = tmp_path_factory.mktemp("dataset")
+    counts = generate(SCALES["tiny"], out)
+    data = {name: json.loads((out / f"{name}.json").read_text(encoding="utf-8-sig")) for name in FILES}
+    return out, counts, data
+
+
+def test_write_json_array_matches_json_dump(tmp_path):
+    rows = [{"id": 1, "nested": {"a": [1, 2]}, "text": "é"}, {"id": 2}]
+    write_json_array(tmp_path / "rows.json", rows)
+    assert (tmp_path / "rows.json").read_text(encoding="utf-8") == json.dumps(rows, ensure_ascii=False, indent=2)
+    write_json_array(tmp_path / "empty.json", [])
+    assert (tmp_path / "empty.json").read_text() == "[]"
+
+
+def test_output_is_deterministic_for_a_seed(tmp_path, dataset):
+    out, _, _ = dataset
+    generate(SCALES["tiny"], tmp_path)
+    for name in FILES:
+        assert (tmp_path / f"{name}.json").read_bytes() == (out / f"{name}.json").read_bytes()
+    assert (tmp_path / "reviews.text").read_bytes() == (out / "reviews.text").read_bytes()
+
+
+def test_counts_and_formats(dataset):
+    out, counts, data = dataset
+    spec = SCALES["tiny"]
+    assert counts["users"] == spec.users and counts["reviews"] == spec.reviews
+    assert (out / "reviews.json").read_bytes().startswith(b"\xef\xbb\xbf")  # review_repo writes utf-8-sig
+    for name in FILES:
+        raw = (out / f"{name}.json").read_text(encoding="utf-8-sig")
+        assert raw == json.dumps(data[name], ensure_ascii=False, indent=2)
+
+
+def test_rows_validate_against_schemas(dataset, monkeypatch):
+    out, _, data = dataset
+    monkeypatch.setattr(review_repo, "DATA_PATH", out / "reviews.json")
+    rows = dict(data, reviews=review_repo.with_text(data["reviews"]))
+    for model, name in [(User, "users"), (Movie, "movies"), (Review, "reviews"), (Battle, "battles"),
+                        (Flag, "flags"), (Comment, "comments"), (Watchlist, "watchlist")]:
+        for row in rows[name]:
+            model(**row)
+
+
+def test_review_text_is_laid_out_as_review_repo_writes_it(dataset):
+    out, _, data = dataset
+    ends = [r["textOffset"] + r["titleLength"] + r["bodyLength"] for r in data["reviews"]]
+    assert [r["textOffset"] for r in data["reviews"][1:]] == ends[:-1]
+    assert (out / "reviews.text").stat().st_size == ends[-1]
+
+
+def test_dataset_is_consistent(dataset):
+    _, _, data = dataset
+    user_ids = {u["id"] for u in data["users"]}
+    movie_ids = {m["id"] for m in data["movies"]}
+    reviews = {r["id"]: r for r in data["reviews"]}
+
+    assert all(r["authorId"] in user_ids and r["movieId"] in movie_ids for r in reviews.values())
+    wins = Counter(b["winnerId"] for b in data["battles"] if b["winnerId"] is not None)
+    assert all(r["votes"] == wins.get(r["id"], 0) for r in reviews.values())
+    flagged = {f["review_id"] for f in data["flags"]}
+    assert {r["id"] for r in reviews.values() if r["flagged"]} == flagged
+    assert all(b["userId"] in user_ids and b["review1Id"] != b["review2Id"] for b in data["battles"])
+    assert all(c["reviewId"] in reviews for c in data["comments"])
+    assert all(set(w["movieIds"]) <= movie_ids for w in data["watchlist"])
+
+
+def test_ratings_skew_high_and_users_can_log_in(dataset):
+    _, _, data = dataset
+    ratings = Counter(r["rating"] for r in data["reviews"])
+    assert ratings.most_common(1)[0][0] == 5.0
+    user = data["users"][0]
+    assert user["role"] == "admin"
+    assert bcrypt.checkpw(SYNTHETIC_PASSWORD.encode(), user["hashed_password"].encode())
+
+
+def test_cli_refuses_to_overwrite_without_force(tmp_path, capsys):
+    out = tmp_path / "data"
+    args = ["--out", str(out), "--scale", "tiny", "--battles", "0"]
+    assert main(args) == 0
+    assert json.loads((out / "battles.json").read_text()) == []
+    assert main(args) == 1
+    assert main(args + ["--force"]) == 0
@@ -2,9 +2,14 @@ import pytest
 from fastapi.testclient import TestClient
 
 from app.main import app
+from app.repositories.review_store import ReviewStore
 from app.schemas.review import Review
 
 
+def _store(reviews):
+    return ReviewStore.from_rows([review.model_dump(mode="json") for review in reviews])
+
+
 @pytest.fixture
 def client():
     with TestClient(app) as c:
@@ -49,8 +54,8 @@ def test_endpoint_returns_reviews_in_vote_order(mocker, client):
     ]
 
     mocker.patch(
-        "app.services.review_service.list_reviews",
-        return_value=reviews,
+        "app.services.review_service.load_store",
+        return_value=_store(reviews),
     )
 
     resp = client.get("/leaderboard")
@@ -78,8 +83,8 @@ def test_limit_parameter_works_default_and_custom(mocker, client):
     ]
 
     mocker.patch(
-        "app.services.review_service.list_reviews",
-        return_value=reviews,
+        "app.services.review_service.load_store",
+        return_value=_store(reviews),
     )
 
     resp_default = client.get("/leaderboard")
@@ -136,8 +141,8 @@ def test_tie_breaking_by_date_recent_first(mocker, client):
     ]
 
     mocker.patch(
-        "app.services.review_service.list_reviews",
-        return_value=reviews,
+        "app.services.review_service.load_store",
+        return_value=_store(reviews),
     )
 
     resp = client.get("/leaderboard", params={"limit": 3})
@@ -0,0 +1,66 @@
+"""
+Tests for the in-process load-test harness
+"""
+import json
+
+import pytest
+
+from app.repositories import battle_repo
+from benchmarks.dataset import dataset_dir
+from benchmarks.loadtest import LoadConfig, Recorder, main as loadtest_main, parse_mix, run_load
+
+
+def test_parse_mix_reads_weights():
+    assert parse_mix("browse=5, search=2,login") == {"browse": 5.0, "search": 2.0, "login": 1.0}
+
+
+@pytest.mark.parametrize("spec", ["browse=1,shopping=2", "browse=0", ""])
+def test_parse_mix_rejects_bad_specs(spec):
+    with pytest.raises(ValueError):
+        parse_mix(spec)
+
+
+def test_recorder_reports_percentiles_and_errors():
+    recorder = Recorder()
+    for ms in range(1, 101):
+        recorder.record("GET /reviews", ms / 1000, "500" if ms == 100 else "200")
+    route = recorder.report(elapsed=2.0)["routes"]["GET /reviews"]
+    assert (route["p50_ms"], route["p95_ms"], route["p99_ms"]) == (50.0, 95.0, 99.0)
+    assert route["rps"] == 50.0
+    assert route["errors"] == 1
+    assert route["status"] == {"200": 99, "500": 1}
+
+
+async def test_run_load_over_asgi_covers_every_scenario(tmp_path):
+    original = battle_repo.DATA_PATH
+    data = dataset_dir("tiny", 1, tmp_path)
+    before = (data / "battles.json").read_bytes()
+
+    config = LoadConfig(users=1, scenarios=40, data_dir=tmp_path, tmdb_latency="constant:0")
+    report = await run_load(config)
+
+    assert sum(report["scenarios"].values()) == 40
+    assert set(report["scenarios"]) == {"browse", "search", "battle", "login", "dashboard"}
+    assert {"POST /login", "GET /reviews", "GET /movies/search/all", "POST /battles", "GET /home/"} <= set(report["routes"])
+    assert report["errors"] == 0
+    assert report["routes"]["POST /battles"]["status"] == {"201": report["routes"]["POST /battles"]["requests"]}
+    assert report["threadpool"]["total_tokens"] == 40
+    assert report["threadpool"]["samples"] > 0
+    # Writes went to a scratch copy; the cached dataset and real paths are untouched.
+    assert (data / "battles.json").read_bytes() == before
+    assert battle_repo.DATA_PATH == original
+
+
+def test_cli_over_uvicorn_writes_report(tmp_path, capsys):
+    out = tmp_path / "load.json"
+    code = loadtest_main([
+        "--users", "2", "--scenarios", "10", "--mix", "browse=1,dashboard=1", "--target", "uvicorn",
+        "--threadpool-size", "3", "--tmdb-latency", "constant:0", "--data-dir", str(tmp_path / "data"),
+        "--out", str(out),
+    ])
+    assert code == 0
+    report = json.loads(out.read_text())
+    assert report["meta"]["target"] == "uvicorn"
+    assert set(report["scenarios"]) <= {"browse", "dashboard"}
+    assert report["threadpool"]["total_tokens"] == 3
+    assert "req/s" in capsys.readouterr().out
@@ -0,0 +1,101 @@
+"""
+Tests for the tracemalloc diagnostics endpoints
+"""
+import tracemalloc
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.main import app
+from app.repositories import review_repo
+from app.middleware.admin_dependency import admin_required
+from app.services import memory_diagnostics_service as memory
+
+
+@pytest.fixture
+def client():
+    app.dependency_overrides[admin_required] = lambda: {"user_id": "admin-1", "role": "admin"}
+    with TestClient(app) as client:
+        yield client
+    app.dependency_overrides.clear()
+
+
+@pytest.fixture(autouse=True)
+def stop_tracing():
+    yield
+    if tracemalloc.is_tracing():
+        tracemalloc.stop()
+    memory._snapshots.clear()
+
+
+_held = []
+
+
+def test_endpoints_require_admin():
+    with TestClient(app) as client:
+        assert client.get("/admin/memory").status_code == 401
+
+
+def test_snapshot_requires_tracing(client):
+    assert client.post("/admin/memory/snapshots").status_code == 409
+
+
+def test_trace_snapshot_top_and_diff(client):
+    started = client.post("/admin/memory/tracing/start", params={"frames": 2}).json()
+    assert started["tracing"] is True and started["frames"] == 2
+    assert client.post("/admin/memory/tracing/start").status_code == 409
+
+    base = client.post("/admin/memory/snapshots").json()
+    _held.append([bytearray(1024) for _ in range(2000)])  # ~2MB allocated from this test module
+    target = client.post("/admin/memory/snapshots").json()
+    assert int(target["id"]) > int(base["id"])
+
+    top = client.get(f"/admin/memory/snapshots/{target['id']}", params={"limit": 5}).json()
+    assert top["top"][0]["site"] == __name__
+    assert top["top"][0]["size_bytes"] >= 2000 * 1024
+
+    diff = client.get("/admin/memory/diff", params={"base": base["id"], "target": target["id"]}).json()
+    grown = {row["site"]: row for row in diff["top"]}
+    assert grown[__name__]["size_diff_bytes"] >= 2000 * 1024
+    assert grown[__name__]["count_diff"] >= 2000
+
+    by_line = client.get(f"/admin/memory/snapshots/{target['id']}", params={"group_by": "line", "limit": 1}).json()
+    assert by_line["top"][0]["site"].startswith(__file__.replace(".pyc", ".py"))
+
+    listed = client.get("/admin/memory").json()["snapshots"]
+    assert [s["id"] for s in listed] == [base["id"], target["id"]]
+
+    stopped = client.post("/admin/memory/tracing/stop").json()
+    assert stopped["tracing"] is False and stopped["snapshots"] == []
+    _held.clear()
+
+
+def test_unknown_snapshot_and_bad_grouping(client):
+    client.post("/admin/memory/tracing/start")
+    assert client.get("/admin/memory/snapshots/999").status_code == 404
+    assert client.delete("/admin/memory/snapshots/999").status_code == 404
+    snapshot = client.post("/admin/memory/snapshots").json()
+    assert client.get(f"/admin/memory/snapshots/{snapshot['id']}", params={"group_by": "class"}).status_code == 422
+    assert client.delete(f"/admin/memory/snapshots/{snapshot['id']}").status_code == 204
+
+
+def test_snapshots_are_capped(client, monkeypatch):
+    monkeypatch.setattr(memory, "MEMORY_MAX_SNAPSHOTS", 2)
+    client.post("/admin/memory/tracing/start")
+    ids = [client.post("/admin/memory/snapshots").json()["id"] for _ in range(3)]
+    assert [s["id"] for s in client.get("/admin/memory").json()["snapshots"]] == ids[1:]
+
+
+def test_deep_sizeof_counts_nested_rows_once():
+    row = {"id": 1, "text": "x" * 1000}
+    single = memory.deep_sizeof([row])
+    assert single > 1000
+    assert memory.deep_sizeof([row, row]) - single < 100  # the shared row is not counted twice
+
+
+def test_cache_sizes_report_built_indexes(client):
+    review_repo.get_by_id(1)  # builds the review store
+    sizes = {row["cache"]: row for row in client.get("/admin/memory/caches").json()}
+    assert sizes["reviews.json:_build_store"]["built"] is True
+    assert sizes["reviews.json:_build_store"]["bytes"] > 0
+    assert "tmdb_cache:memory" in sizes
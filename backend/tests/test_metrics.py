@@ -0,0 +1,104 @@
+"""
+Tests for the metrics registry, the per-route middleware and /metrics
+"""
+import httpx
+import pytest
+from fastapi.testclient import TestClient
+
+from app.main import app
+from app.services import tmdb_service
+from app.utils.metrics import Registry
+
+
+@pytest.fixture
+def client():
+    with TestClient(app) as client:
+        yield client
+
+
+def test_counter_and_gauge_render_in_text_format():
+    registry = Registry()
+    requests = registry.counter("jobs_total", "Jobs run.", ("kind",))
+    requests.inc(kind="import")
+    requests.inc(2, kind='say "hi"')
+    registry.gauge("queue_depth", "Queued jobs.").set(3)
+
+    text = registry.render()
+    assert "# HELP jobs_total Jobs run.\n# TYPE jobs_total counter\n" in text
+    assert 'jobs_total{kind="import"} 1\n' in text
+    assert 'jobs_total{kind="say \\"hi\\""} 2\n' in text
+    assert "# TYPE queue_depth gauge\nqueue_depth 3\n" in text
+
+
+def test_histogram_buckets_are_cumulative():
+    registry = Registry()
+    latency = registry.histogram("op_seconds", "Op time.", ("op",), buckets=(0.1, 1.0))
+    for value in (0.05, 0.5, 5.0):
+        latency.observe(value, op="read")
+
+    text = registry.render()
+    assert 'op_seconds_bucket{op="read",le="0.1"} 1\n' in text
+    assert 'op_seconds_bucket{op="read",le="1"} 2\n' in text
+    assert 'op_seconds_bucket{op="read",le="+Inf"} 3\n' in text
+    assert 'op_seconds_sum{op="read"} 5.55\n' in text
+    assert 'op_seconds_count{op="read"} 3\n' in text
+
+
+def test_registry_returns_existing_metric_and_rejects_conflicts():
+    registry = Registry()
+    counter = registry.counter("hits_total", "Hits.", ("route",))
+    assert registry.counter("hits_total", "Hits.", ("route",)) is counter
+    with pytest.raises(ValueError):
+        registry.gauge("hits_total", "Hits.", ("route",))
+    with pytest.raises(ValueError):
+        counter.inc(path="/")
+
+
+def test_requests_are_labelled_by_route_template(client, metrics_registry):
+    statuses = {client.get("/reviews/1").status_code, client.get("/reviews/2").status_code}
+    client.get("/no/such/page")
+
+    requests = metrics_registry.get("http_requests_total")
+    latency = metrics_registry.get("http_request_duration_seconds")
+    assert sum(requests.value(method="GET", route="/reviews/{review_id}", status=s) for s in statuses) == 2
+    assert requests.value(method="GET", route="unmatched", status="404") == 1
+    assert latency.value(method="GET", route="/reviews/{review_id}") == 2
+    assert metrics_registry.get("http_requests_in_flight").value(method="GET") == 0
+
+
+def test_wrong_method_keeps_the_route_template(client, metrics_registry):
+    response = client.delete("/leaderboard")
+    assert response.status_code == 405
+    assert metrics_registry.get("http_requests_total").value(method="DELETE", route="/leaderboard", status="405") == 1
+
+
+def test_metrics_endpoint_serves_prometheus_text(client):
+    client.get("/")
+    response = client.get("/metrics")
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+    assert 'http_requests_total{method="GET",route="/",status="200"} 1' in response.text
+    assert "# TYPE http_request_duration_seconds histogram" in response.text
+
+
+def test_metrics_endpoint_requires_token_when_configured(client, monkeypatch):
+    monkeypatch.setattr("app.routers.metrics.METRICS_TOKEN", "scrape-me")
+    assert client.get("/metrics").status_code == 401
+    assert client.get("/metrics", headers={"Authorization": "Bearer scrape-me"}).status_code == 200
+
+
+async def test_tmdb_requests_are_counted_by_endpoint_and_outcome(mocker, monkeypatch, metrics_registry):
+    monkeypatch.setattr(tmdb_service, "TMDB_API_KEY", "test_key")
+    monkeypatch.setattr("app.services.tmdb_resilience.TMDB_MAX_RETRIES", 1)
+    request = httpx.Request("GET", "https://tmdb.test/movie/603")
+    responses = [httpx.Response(503, request=request), httpx.Response(200, json={"id": 603}, request=request)]
+    client = mocker.AsyncMock()
+    client.get.side_effect = responses
+    mocker.patch.object(tmdb_service, "_client_session", return_value=mocker.AsyncMock(__aenter__=mocker.AsyncMock(return_value=client)))
+
+    assert await tmdb_service._tmdb_get("/movie/603") == {"id": 603}
+
+    requests = metrics_registry.get("tmdb_requests_total")
+    assert requests.value(endpoint="/movie/{id}", outcome="503") == 1
+    assert requests.value(endpoint="/movie/{id}", outcome="200") == 1
+    assert metrics_registry.get("tmdb_request_duration_seconds").value(endpoint="/movie/{id}") == 2
@@ -203,6 +203,45 @@ async def test_cache_tmdb_movie_fetches_and_saves(mocker):
     assert any(m["id"] == "tmdb_27205" for m in saved_movies)
 
 
+@pytest.mark.asyncio
+async def test_cache_tmdb_movie_saves_off_the_event_loop(mocker):
+    """Waiting on movies.json's write lock must not stall other requests."""
+    import asyncio
+    import threading
+    from unittest.mock import AsyncMock
+    from app.repositories import movie_repo
+    from app.services.movie_service import cache_tmdb_movie
+
+    loop_thread = threading.get_ident()
+    save_threads = []
+    mocker.patch("app.repositories.movie_repo.load_all", return_value=[])
+    mocker.patch("app.repositories.movie_repo.save_all", side_effect=lambda movies: save_threads.append(threading.get_ident()))
+    mocker.patch("app.services.movie_service.get_tmdb_movie_details", new=AsyncMock(return_value={
+        "tmdb_id": 27205, "title": "Inception", "description": "", "duration": 148,
+        "genre": "Action", "release": "2010-07-15",
+    }))
+
+    held, release = threading.Event(), threading.Event()
+
+    def hold_lock():
+        with movie_repo.write_lock:
+            held.set()
+            release.wait(5)
+
+    holder = threading.Thread(target=hold_lock)
+    holder.start()
+    held.wait(5)
+    import_task = asyncio.ensure_future(cache_tmdb_movie("tmdb_27205"))
+    await asyncio.sleep(0.05)  # the loop keeps running while the import waits for the lock
+    assert not import_task.done()
+    release.set()
+    result = await asyncio.wait_for(import_task, timeout=5)
+    holder.join()
+
+    assert result.id == "tmdb_27205"
+    assert save_threads and loop_thread not in save_threads
+
+
 @pytest.mark.asyncio
 async def test_cache_tmdb_movie_not_found(mocker):
     """Raises 404 if TMDb returns no data."""
@@ -228,3 +267,31 @@ async def test_cache_tmdb_movie_invalid_id(mocker):
     with pytest.raises(HTTPException) as ex:
         await cache_tmdb_movie("invalid_id")
     assert ex.value.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_cache_tmdb_movie_concurrent_calls_append_once(mocker):
+    """Concurrent imports of the same TMDb movie fetch and save it once."""
+    import asyncio
+    from app.services.movie_service import cache_tmdb_movie
+
+    stored = []
+
+    async def slow_details(tmdb_id):
+        await asyncio.sleep(0.01)
+        return {"tmdb_id": tmdb_id, "title": "Inception", "description": "A thief...",
+                "duration": 148, "genre": "Action", "release": "2010-07-15"}
+
+    def save(movies):
+        stored[:] = [dict(m) for m in movies]
+
+    mocker.patch("app.repositories.movie_repo.load_all", side_effect=lambda: [dict(m) for m in stored])
+    mock_save = mocker.patch("app.repositories.movie_repo.save_all", side_effect=save)
+    mock_tmdb = mocker.patch("app.services.movie_service.get_tmdb_movie_details", side_effect=slow_details)
+
+    results = await asyncio.gather(*(cache_tmdb_movie("tmdb_27205") for _ in range(5)))
+
+    assert all(r.id == "tmdb_27205" for r in results)
+    assert mock_tmdb.call_count == 1
+    assert mock_save.call_count == 1
+    assert [m["id"] for m in stored] == ["tmdb_27205"]
@@ -58,6 +58,7 @@ def test_penalty_service_valid_ban(mocker, user_object):
     assert user_object.active == True
     user = ban_user(user_object.id)
     assert user.active == False
+    assert user.token_epoch == 1
     assert save.called
 
 def test_penalty_service_warn_invalid_ban(mocker, user_object):
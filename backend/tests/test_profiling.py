@@ -0,0 +1,143 @@
+"""
+Tests for on-demand request profiling
+"""
+import asyncio
+import time
+
+import pytest
+from fastapi.testclient import TestClient
+
+import app.repositories.profile_repo as profile_repo
+from app.main import app
+from app.middleware.admin_dependency import admin_required
+from app.repositories.user_repo import UserStatus
+from app.services.user_login_service import _build_access_token
+from app.utils import profiling
+
+
+@pytest.fixture(autouse=True)
+def profiles_dir(tmp_path, monkeypatch):
+    path = tmp_path / "profiles"
+    monkeypatch.setattr(profile_repo, "PROFILES_DIR", path)
+    return path
+
+
+@pytest.fixture
+def client():
+    with TestClient(app) as client:
+        yield client
+
+
+@pytest.fixture
+def as_admin(mocker):
+    mocker.patch("app.middleware.profiling_middleware._admin", return_value=True)
+    app.dependency_overrides[admin_required] = lambda: {"user_id": "admin-1", "role": "admin"}
+    yield
+    app.dependency_overrides.clear()
+
+
+def _token(mocker, role):
+    mocker.patch("app.middleware.auth_middleware.get_user_status", return_value=UserStatus(True, role, 0))
+    return _build_access_token({"id": "u-1", "username": "someone", "role": role})
+
+
+def test_admin_check_uses_current_role(mocker):
+    from app.middleware.profiling_middleware import _admin
+    from starlette.datastructures import Headers
+
+    token = _token(mocker, "admin")
+    assert _admin(Headers({"Authorization": f"Bearer {token}"})) is True
+    mocker.patch("app.middleware.auth_middleware.get_user_status", return_value=UserStatus(True, "user", 0))
+    assert _admin(Headers({"Authorization": f"Bearer {token}"})) is False
+    assert _admin(Headers({"Authorization": "Bearer not-a-jwt"})) is False
+    assert _admin(Headers({})) is False
+
+
+def test_non_admin_flag_is_ignored(client, mocker, profiles_dir):
+    token = _token(mocker, "user")
+    response = client.get("/", headers={"X-Profile": "1", "Authorization": f"Bearer {token}"})
+    assert response.status_code == 200
+    assert "X-Profile-Id" not in response.headers
+    assert not profiles_dir.exists()
+
+
+def test_profiled_sync_request_is_stored_listed_and_downloadable(client, as_admin, mocker):
+    def slow_list_movies(*args, **kwargs):
+        deadline = time.perf_counter() + 0.05
+        while time.perf_counter() < deadline:
+            pass
+        return []
+    mocker.patch("app.routers.movies.list_movies", side_effect=slow_list_movies)
+
+    response = client.get("/movies?_profile=1")
+    assert response.status_code == 200
+    profile_id = response.headers["X-Profile-Id"]
+    assert response.headers["X-Profile-Status"] == "captured"
+
+    listed = client.get("/admin/profiles").json()
+    assert [p["id"] for p in listed] == [profile_id]
+    assert listed[0]["route"] == "/movies"
+    assert listed[0]["status"] == 200
+    assert listed[0]["samples"] > 0
+
+    stacks = client.get(f"/admin/profiles/{profile_id}")
+    assert stacks.status_code == 200
+    lines = stacks.text.splitlines()
+    assert lines and all(line.rsplit(" ", 1)[1].isdigit() for line in lines)
+    assert any("slow_list_movies" in line for line in lines)
+
+    assert client.delete(f"/admin/profiles/{profile_id}").status_code == 204
+    assert client.get(f"/admin/profiles/{profile_id}").status_code == 404
+
+
+def test_unknown_or_malformed_profile_id_is_404(client, as_admin):
+    assert client.get("/admin/profiles/20260101T000000-deadbeef").status_code == 404
+    assert client.get("/admin/profiles/..%2Fusers").status_code == 404
+
+
+async def test_sampler_ignores_work_outside_the_session():
+    session = profiling.ProfileSession(interval=0.001)
+
+    def spin(seconds):
+        deadline = time.perf_counter() + seconds
+        while time.perf_counter() < deadline:
+            pass
+
+    def other_request_work():
+        spin(0.05)
+
+    def profiled_work():
+        spin(0.05)
+
+    token = profiling.activate(session)
+    session.start()
+    try:
+        await asyncio.gather(asyncio.to_thread(profiled_work), _outside(other_request_work))
+    finally:
+        session.stop()
+        profiling.deactivate(token)
+
+    collapsed = session.collapsed()
+    assert "profiled_work" in collapsed
+    assert "other_request_work" not in collapsed
+
+
+async def _outside(fn):
+    # A task created with an empty context, like a request the profiler is not tracking.
+    import contextvars
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(None, contextvars.Context().run, fn)
+
+
+def test_prune_keeps_the_newest_profiles(monkeypatch, profiles_dir):
+    monkeypatch.setattr(profile_repo, "PROFILES_MAX_COUNT", 2)
+    for second in range(4):
+        profile_repo.save(f"20260101T00000{second}-0000000{second}", "a;b 1\n", {"route": "/"})
+    assert [p["id"] for p in profile_repo.list_all()] == ["20260101T000003-00000003", "20260101T000002-00000002"]
+
+
+def test_prune_enforces_total_size(monkeypatch, profiles_dir):
+    monkeypatch.setattr(profile_repo, "PROFILES_MAX_BYTES", 1000)
+    for second in range(3):
+        profile_repo.save(f"20260101T00000{second}-0000000{second}", "x" * 600 + " 1\n", {"route": "/"})
+    assert len(profile_repo.list_all()) == 1
@@ -0,0 +1,77 @@
+"""
+Tests for repository I/O instrumentation
+"""
+import json
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.main import app
+from app.repositories import movie_repo
+from app.utils import repo_io
+
+
+@pytest.fixture
+def client(monkeypatch):
+    monkeypatch.setattr("app.middleware.repo_io_middleware.REPO_IO_DEBUG_HEADER", True)
+    with TestClient(app) as client:
+        yield client
+
+
+@pytest.fixture
+def movies_file(tmp_path, monkeypatch):
+    path = tmp_path / "movies.json"
+    path.write_text(json.dumps([{
+        "id": "m1", "title": "Heat", "genre": "Crime", "release": "1995-12-15",
+        "description": "A crew of thieves and the detective chasing them.", "duration": 170,
+    }]))
+    monkeypatch.setattr(movie_repo, "DATA_PATH", path)
+    return path
+
+
+def test_load_and_save_are_counted_with_bytes(movies_file, metrics_registry):
+    movies = movie_repo.load_all()
+    movie_repo.save_all(movies + [{"id": "m2", "title": "Ronin"}])
+
+    calls = metrics_registry.get("repository_io_calls_total")
+    written = metrics_registry.get("repository_io_bytes_total")
+    assert calls.value(repository="movies", op="load", route="none") == 1
+    assert calls.value(repository="movies", op="save", route="none") == 1
+    assert written.value(repository="movies", op="save", route="none") == movies_file.stat().st_size
+    assert metrics_registry.get("repository_io_seconds").value(repository="movies", op="load") == 1
+
+
+def test_request_io_collects_calls_made_inside_track_request(movies_file):
+    with repo_io.track_request(lambda: "/movies") as request_io:
+        movie_repo.load_all()
+        movie_repo.load_all()
+    movie_repo.load_all()  # after the request: not attributed to it
+
+    totals = request_io.totals()
+    assert totals["movies.load"]["calls"] == 2
+    assert totals["movies.load"]["bytes"] == 2 * movies_file.stat().st_size
+    assert request_io.header_value().startswith("movies.load;calls=2;bytes=")
+    assert repo_io.current() is None
+
+
+def test_failed_calls_are_still_recorded(tmp_path, monkeypatch, metrics_registry):
+    path = tmp_path / "movies.json"
+    path.write_text("not json")
+    monkeypatch.setattr(movie_repo, "DATA_PATH", path)
+    with pytest.raises(json.JSONDecodeError):
+        movie_repo.load_all()
+    assert metrics_registry.get("repository_io_calls_total").value(repository="movies", op="load", route="none") == 1
+
+
+def test_sync_endpoint_io_is_reported_in_header_and_by_route(client, movies_file, metrics_registry):
+    response = client.get("/movies")
+
+    assert response.status_code == 200
+    assert f"movies.load;calls=1;bytes={movies_file.stat().st_size};ms=" in response.headers["X-Repo-IO"]
+    calls = metrics_registry.get("repository_io_calls_total")
+    assert calls.value(repository="movies", op="load", route="/movies") == 1
+
+
+def test_header_is_off_unless_enabled(client, movies_file, monkeypatch):
+    monkeypatch.setattr("app.middleware.repo_io_middleware.REPO_IO_DEBUG_HEADER", False)
+    assert "X-Repo-IO" not in client.get("/movies").headers
@@ -2,6 +2,7 @@ import pytest
 from fastapi.testclient import TestClient
 from app.main import app
 from app.middleware.auth_middleware import jwt_auth_dependency
+from app.repositories.review_store import ReviewStore
 
 @pytest.fixture
 def client():
@@ -9,8 +10,8 @@ def client():
         yield client
 
 def test_list_reviews(mocker, client):
-    mocker.patch("app.services.review_service.load_all",
-    return_value=[{
+    mocker.patch("app.services.review_service.load_store",
+    return_value=ReviewStore.from_rows([{
         "id": 1234,
         "movieId": 'UUID-movie-1234',
         "authorId": 'UUID-author-1234',
@@ -20,7 +21,7 @@ def test_list_reviews(mocker, client):
         "flagged": False,
         "votes": 5,
         "date": "2022-01-01"
-    }])
+    }]))
     response = client.get("/reviews")
     assert response.status_code == 200
     data = response.json()
@@ -151,6 +152,7 @@ def test_delete_review_valid_review(mocker, client):
         "date": "2022-01-01"
     }])
     mock_save = mocker.patch("app.services.review_service.save_all")
+    mocker.patch("app.services.review_service.comments_repo.delete_by_review_id")
     response = client.delete("/reviews/1234")
     app.dependency_overrides.clear()
     assert response.status_code == 204
@@ -290,28 +292,42 @@ def test_hide_review_not_found(mocker, client, mock_admin_user):
     assert response.status_code == 404
 
 def test_get_comments_endpoint_returns_list(mocker, client):
-    from app.schemas.comment import CommentWithAuthor
+    from app.schemas.comment import CommentWithAuthor, CommentPage
     mocker.patch(
-        "app.routers.reviews.get_comments_by_review_id",
-        return_value=[CommentWithAuthor(**{"id": 1, "reviewId": 10, "authorId": "u1", "commentBody": "Hi", "date": "2024-05-02", "authorUsername": "bob"})],
+        "app.routers.reviews.get_comments_page",
+        return_value=CommentPage(comments=[CommentWithAuthor(**{"id": 1, "reviewId": 10, "authorId": "u1", "commentBody": "Hi", "date": "2024-05-02", "authorUsername": "bob"})]),
     )
     res = client.get("/reviews/10/comments")
     assert res.status_code == 200
     data = res.json()
     assert len(data) == 1
     assert data[0]["authorUsername"] == "bob"
+    assert "X-Next-Cursor" not in res.headers
 
 
 def test_get_comments_returns_empty_list(mocker, client):
+    from app.schemas.comment import CommentPage
     mocker.patch(
-        "app.routers.reviews.get_comments_by_review_id",
-        return_value=[],
+        "app.routers.reviews.get_comments_page",
+        return_value=CommentPage(comments=[]),
     )
     res = client.get("/reviews/999/comments")
     assert res.status_code == 200
     assert res.json() == []
 
 
+def test_get_comments_sets_next_cursor_header(mocker, client):
+    from app.schemas.comment import CommentWithAuthor, CommentPage
+    page_mock = mocker.patch(
+        "app.routers.reviews.get_comments_page",
+        return_value=CommentPage(comments=[CommentWithAuthor(**{"id": 4, "reviewId": 10, "authorId": "u1", "commentBody": "Hi", "date": "2024-05-02", "authorUsername": "bob"})], next_cursor=4),
+    )
+    res = client.get("/reviews/10/comments?cursor=3&limit=1")
+    assert res.status_code == 200
+    assert res.headers["X-Next-Cursor"] == "4"
+    page_mock.assert_called_once_with(10, cursor=3, limit=1)
+
+
 def test_post_comment_creates_comment(mocker, client, mock_admin_user):
     mocker.patch(
         "app.routers.reviews.create_comment",
@@ -0,0 +1,103 @@
+from datetime import date
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.main import app
+from app.repositories.review_store import ReviewStore
+from app.services import review_query
+from app.services.review_query import ReviewQuery
+
+
+@pytest.fixture
+def client():
+    with TestClient(app) as c:
+        yield c
+
+
+def _review(review_id, **overrides):
+    review = {
+        "id": review_id,
+        "movieId": "m1",
+        "authorId": "u1",
+        "rating": 3.0,
+        "reviewTitle": f"Title {review_id}",
+        "reviewBody": f"Body {review_id}",
+        "flagged": False,
+        "votes": 0,
+        "date": "2024-01-01",
+        "visible": True,
+    }
+    review.update(overrides)
+    return review
+
+
+STORE = ReviewStore.from_rows([
+    _review(1, rating=5, votes=3, date="2024-01-05", movieId="m2", authorId=-1),
+    _review(2, rating="4.5", votes=3, date="2024-01-07", flagged=True),
+    _review(3, rating=None, votes=9, date="2024-01-01", movieId=7),
+    _review(4, rating=2, votes=0, date="2024-01-09", visible=False),
+    _review(5, rating=5.0, votes=1, date="2024-01-03", movieId="m3", authorId="u2"),
+])
+TITLES = {"m1": "Zeta", "m2": "Alpha", "m3": "Alpha"}
+
+
+def _ids(query, titles=None):
+    return [STORE.ids[pos] for pos in review_query.select(STORE, query, titles)]
+
+
+@pytest.mark.parametrize("query, expected", [
+    (ReviewQuery(), [1, 2, 3, 5]),
+    (ReviewQuery(visible=None), [1, 2, 3, 4, 5]),
+    (ReviewQuery(visible=False), [4]),
+    (ReviewQuery(rating=5), [1, 5]),
+    (ReviewQuery(min_rating=4.5), [1, 2, 5]),
+    (ReviewQuery(min_rating=3, max_rating=4.5), [2]),
+    (ReviewQuery(date_from=date(2024, 1, 3), date_to=date(2024, 1, 6)), [1, 5]),
+    (ReviewQuery(flagged=True), [2]),
+    (ReviewQuery(flagged=False), [1, 3, 5]),
+    (ReviewQuery(movie_id="m1"), [2]),
+    (ReviewQuery(movie_id="missing"), []),
+    (ReviewQuery(author_id="u2"), [5]),
+    (ReviewQuery(author_id="-1"), [1]),
+])
+def test_filters(query, expected):
+    assert _ids(query) == expected
+
+
+@pytest.mark.parametrize("sort_by, order, expected", [
+    # Missing ratings first either way; equal ratings keep file order.
+    ("rating", "asc", [3, 2, 1, 5]),
+    ("rating", "desc", [3, 1, 5, 2]),
+    # Vote ties are broken by date in the same direction.
+    ("votes", "desc", [3, 2, 1, 5]),
+    ("votes", "asc", [5, 1, 2, 3]),
+    ("date", "desc", [2, 1, 5, 3]),
+    # Non-string movieIds first ascending, last descending.
+    ("movieId", "asc", [3, 2, 1, 5]),
+    ("movieId", "desc", [5, 1, 2, 3]),
+    ("movieTitle", "asc", [3, 1, 5, 2]),
+    ("movieTitle", "desc", [2, 1, 5, 3]),
+    ("unknown", "asc", [1, 2, 3, 5]),
+])
+def test_sorts(sort_by, order, expected):
+    assert _ids(ReviewQuery(sort_by=sort_by, order=order), TITLES) == expected
+
+
+def test_sort_positions_orders_a_subset():
+    query = ReviewQuery(sort_by="votes", order="desc")
+    positions = review_query.sort_positions(STORE, [0, 4], query)
+    assert [STORE.ids[pos] for pos in positions] == [1, 5]
+
+
+def test_empty_store():
+    assert list(review_query.select(ReviewStore.from_rows([]), ReviewQuery(rating=5, sort_by="rating"))) == []
+
+
+def test_list_endpoint_accepts_range_and_vote_sort(mocker, client):
+    mocker.patch("app.services.review_service.load_store", return_value=STORE)
+    resp = client.get("/reviews", params={
+        "min_rating": 4, "date_from": "2024-01-02", "sort_by": "votes", "order": "desc",
+    })
+    assert resp.status_code == 200
+    assert [r["id"] for r in resp.json()["reviews"]] == [2, 1, 5]
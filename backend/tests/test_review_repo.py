@@ -51,7 +51,9 @@ def test_load_all_with_data(mocker):
     mock_open.assert_called_once_with("r", encoding="utf-8-sig")
 
 
-def test_save_all_saves_data(mocker):
+def test_save_all_saves_data(tmp_path, monkeypatch):
+    path = tmp_path / "reviews.json"
+    monkeypatch.setattr("app.repositories.review_repo.DATA_PATH", path)
     reviews = [{
         "id": "1234",
         "movieId": "1234",
@@ -64,20 +66,25 @@ def test_save_all_saves_data(mocker):
         "date": "2022-01-01"
     }]
 
-    mock_file = mocker.mock_open()
-    mocker.patch.object(Path, "open", mock_file)
-
-    mock_replace = mocker.patch("app.repositories.review_repo.os.replace")
-
     save_all(reviews)
 
-    tmp_path = DATA_PATH.with_suffix(".tmp")
-    mock_file.assert_called_once_with("w", encoding="utf-8-sig")
-
-    handle = mock_file()
-    handle.write.assert_called()
-
-    mock_replace.assert_called_once_with(tmp_path, DATA_PATH)
+    assert path.read_bytes().startswith(b"\xef\xbb\xbf")
+    assert not path.with_suffix(".tmp").exists()
+    (saved,) = json.loads(path.read_text(encoding="utf-8-sig"))
+    assert saved == {
+        "id": "1234",
+        "movieId": "1234",
+        "authorId": "1234",
+        "rating": "5.5",
+        "flagged": "False",
+        "votes": 5,
+        "date": "2022-01-01",
+        "textOffset": 0,
+        "titleLength": 10,
+        "bodyLength": 15,
+    }
+    assert path.with_suffix(".text").read_text() == "good movieloved the movie"
+    assert "reviewTitle" in reviews[0]  # the caller's rows are left alone
 
 def test_sort_by_rating_ascending_descending(mocker):
     data = [
@@ -2,6 +2,7 @@ import pytest
 from fastapi.testclient import TestClient
 from app.main import app
 from app.services.review_service import list_reviews_paginated
+from app.repositories.review_store import ReviewStore
 
 
 @pytest.fixture
@@ -23,7 +24,7 @@ def test_search_by_review_title(mocker):
         {"id": "B", "title": "Inception"},
         {"id": "C", "title": "Avatar"},
     ]
-    mocker.patch("app.services.review_service.load_all", return_value=reviews)
+    mocker.patch("app.services.review_service.load_store", return_value=ReviewStore.from_rows(reviews))
     mocker.patch("app.repositories.movie_repo.load_all", return_value=movies)
 
     result = list_reviews_paginated(search="Amazing")
@@ -42,7 +43,7 @@ def test_search_by_review_body(mocker):
         {"id": "B", "title": "Inception"},
         {"id": "C", "title": "Avatar"},
     ]
-    mocker.patch("app.services.review_service.load_all", return_value=reviews)
+    mocker.patch("app.services.review_service.load_store", return_value=ReviewStore.from_rows(reviews))
     mocker.patch("app.repositories.movie_repo.load_all", return_value=movies)
 
     result = list_reviews_paginated(search="incredible")
@@ -61,7 +62,7 @@ def test_search_by_movie_title(mocker):
         {"id": "B", "title": "Inception"},
         {"id": "C", "title": "Avatar"},
     ]
-    mocker.patch("app.services.review_service.load_all", return_value=reviews)
+    mocker.patch("app.services.review_service.load_store", return_value=ReviewStore.from_rows(reviews))
     mocker.patch("app.repositories.movie_repo.load_all", return_value=movies)
 
     result = list_reviews_paginated(search="Matrix")
@@ -79,7 +80,7 @@ def test_search_case_insensitive(mocker):
         {"id": "A", "title": "The Matrix"},
         {"id": "B", "title": "Inception"},
     ]
-    mocker.patch("app.services.review_service.load_all", return_value=reviews)
+    mocker.patch("app.services.review_service.load_store", return_value=ReviewStore.from_rows(reviews))
     mocker.patch("app.repositories.movie_repo.load_all", return_value=movies)
 
     result = list_reviews_paginated(search="amazing")
@@ -98,7 +99,7 @@ def test_search_multiple_matches(mocker):
         {"id": "B", "title": "Inception"},
         {"id": "C", "title": "Avatar"},
     ]
-    mocker.patch("app.services.review_service.load_all", return_value=reviews)
+    mocker.patch("app.services.review_service.load_store", return_value=ReviewStore.from_rows(reviews))
     mocker.patch("app.repositories.movie_repo.load_all", return_value=movies)
 
     result = list_reviews_paginated(search="great")
@@ -117,7 +118,7 @@ def test_search_no_matches(mocker):
         {"id": "A", "title": "The Matrix"},
         {"id": "B", "title": "Inception"},
     ]
-    mocker.patch("app.services.review_service.load_all", return_value=reviews)
+    mocker.patch("app.services.review_service.load_store", return_value=ReviewStore.from_rows(reviews))
     mocker.patch("app.repositories.movie_repo.load_all", return_value=movies)
 
     result = list_reviews_paginated(search="nonexistent")
@@ -134,7 +135,7 @@ def test_search_empty_string_returns_all(mocker):
         {"id": "A", "title": "The Matrix"},
         {"id": "B", "title": "Inception"},
     ]
-    mocker.patch("app.services.review_service.load_all", return_value=reviews)
+    mocker.patch("app.services.review_service.load_store", return_value=ReviewStore.from_rows(reviews))
     mocker.patch("app.repositories.movie_repo.load_all", return_value=movies)
 
     result = list_reviews_paginated(search="")
@@ -148,7 +149,7 @@ def test_search_with_pagination(mocker):
         for i in range(1, 11)
     ]
     movies = [{"id": "A", "title": "The Matrix"}]
-    mocker.patch("app.services.review_service.load_all", return_value=reviews)
+    mocker.patch("app.services.review_service.load_store", return_value=ReviewStore.from_rows(reviews))
     mocker.patch("app.repositories.movie_repo.load_all", return_value=movies)
 
     result = list_reviews_paginated(search="Great", per_page=3, page=1)
@@ -173,7 +174,7 @@ def test_search_combined_with_rating_filter(mocker):
         {"id": "B", "title": "Inception"},
         {"id": "C", "title": "Avatar"},
     ]
-    mocker.patch("app.services.review_service.load_all", return_value=reviews)
+    mocker.patch("app.services.review_service.load_store", return_value=ReviewStore.from_rows(reviews))
     mocker.patch("app.repositories.movie_repo.load_all", return_value=movies)
 
     result = list_reviews_paginated(search="Great", rating=5)
@@ -192,7 +193,7 @@ def test_search_endpoint_basic(mocker, client):
         {"id": "A", "title": "The Matrix"},
         {"id": "B", "title": "Inception"},
     ]
-    mocker.patch("app.services.review_service.load_all", return_value=reviews)
+    mocker.patch("app.services.review_service.load_store", return_value=ReviewStore.from_rows(reviews))
     mocker.patch("app.repositories.movie_repo.load_all", return_value=movies)
 
     resp = client.get("/reviews", params={"search": "Amazing"})
@@ -211,7 +212,7 @@ def test_search_endpoint_movie_title(mocker, client):
         {"id": "A", "title": "The Matrix"},
         {"id": "B", "title": "Inception"},
     ]
-    mocker.patch("app.services.review_service.load_all", return_value=reviews)
+    mocker.patch("app.services.review_service.load_store", return_value=ReviewStore.from_rows(reviews))
     mocker.patch("app.repositories.movie_repo.load_all", return_value=movies)
 
     resp = client.get("/reviews", params={"search": "Inception"})
@@ -232,7 +233,7 @@ def test_search_endpoint_with_sort(mocker, client):
         {"id": "B", "title": "Beta"},
         {"id": "C", "title": "Gamma"},
     ]
-    mocker.patch("app.services.review_service.load_all", return_value=reviews)
+    mocker.patch("app.services.review_service.load_store", return_value=ReviewStore.from_rows(reviews))
     mocker.patch("app.repositories.movie_repo.load_all", return_value=movies)
 
     resp = client.get("/reviews", params={"search": "Great", "sort_by": "rating", "order": "desc"})
@@ -255,7 +256,7 @@ def test_search_by_tmdb_movie_title(mocker):
         {"id": "A", "title": "The Matrix"},
         {"id": "tmdb_12345", "title": "Wicked: For Good"},
     ]
-    mocker.patch("app.services.review_service.load_all", return_value=reviews)
+    mocker.patch("app.services.review_service.load_store", return_value=ReviewStore.from_rows(reviews))
     mocker.patch("app.repositories.movie_repo.load_all", return_value=movies)
 
     # Search for "Wicked" should find the TMDb movie review
@@ -274,7 +275,7 @@ def test_search_by_tmdb_movie_partial_title(mocker):
     movies = [
         {"id": "tmdb_67890", "title": "Wicked: For Good"},
     ]
-    mocker.patch("app.services.review_service.load_all", return_value=reviews)
+    mocker.patch("app.services.review_service.load_store", return_value=ReviewStore.from_rows(reviews))
     mocker.patch("app.repositories.movie_repo.load_all", return_value=movies)
 
     # Partial search should work
@@ -298,7 +299,7 @@ def test_search_mixed_local_and_tmdb_movies(mocker):
         {"id": "tmdb_11111", "title": "Wicked: Part One"},
         {"id": "tmdb_22222", "title": "Wicked: For Good"},
     ]
-    mocker.patch("app.services.review_service.load_all", return_value=reviews)
+    mocker.patch("app.services.review_service.load_store", return_value=ReviewStore.from_rows(reviews))
     mocker.patch("app.repositories.movie_repo.load_all", return_value=movies)
 
     # Search "Wicked" should find both TMDb movies
@@ -312,3 +313,18 @@ def test_search_mixed_local_and_tmdb_movies(mocker):
     result2 = list_reviews_paginated(search="Wizard")
     assert result2.total == 1
     assert result2.reviews[0].id == 2
+
+
+def test_paginated_reviews_include_comment_counts(mocker):
+    reviews = [
+        {"id": 1, "movieId": "A", "authorId": 1, "rating": 5, "reviewTitle": "Amazing Film", "reviewBody": "Great movie", "date": "2020-01-01", "visible": True},
+        {"id": 2, "movieId": "A", "authorId": 2, "rating": 4, "reviewTitle": "Good Movie", "reviewBody": "Enjoyed it", "date": "2020-01-02", "visible": True},
+    ]
+    mocker.patch("app.services.review_service.load_store", return_value=ReviewStore.from_rows(reviews))
+    mocker.patch("app.repositories.movie_repo.load_all", return_value=[{"id": "A", "title": "The Matrix"}])
+    mocker.patch("app.services.review_service.comments_repo.count_by_review_id", return_value={1: 3})
+
+    result = list_reviews_paginated()
+
+    counts = {rv.id: rv.commentCount for rv in result.reviews}
+    assert counts == {1: 3, 2: 0}
@@ -2,15 +2,16 @@ import pytest
 import datetime
 from fastapi import HTTPException
 from app.services.review_service import create_review, update_review, get_review_by_id, list_reviews, delete_review, increment_vote, get_reviews_by_author
+from app.repositories.review_store import ReviewStore
 from app.schemas.review import ReviewCreate, Review
 
 def test_list_review_empty_list(mocker):
-    mocker.patch("app.services.review_service.load_all", return_value=[])
+    mocker.patch("app.services.review_service.load_store", return_value=ReviewStore.from_rows([]))
     reviews = list_reviews()
     assert reviews == []
 
 def test_list_review_has_reviews(mocker):
-    mocker.patch("app.services.review_service.load_all", return_value=[
+    mocker.patch("app.services.review_service.load_store", return_value=ReviewStore.from_rows([
     {
         "id": 1,
         "movieId": "1234",
@@ -21,7 +22,7 @@ def test_list_review_has_reviews(mocker):
         "flagged": False,
         "votes": 5,
         "date": "2022-01-01"
-    }])
+    }]))
     reviews = list_reviews()
     assert reviews[0].id == 1
     assert reviews[0].movieId == "1234"
@@ -165,10 +166,12 @@ def test_delete_review_valid_review(mocker):
         "date": "2022-01-01"
     }])
     mock_save = mocker.patch("app.services.review_service.save_all")
+    mock_delete_comments = mocker.patch("app.services.review_service.comments_repo.delete_by_review_id")
     delete_review(1234)
     saved_reviews = mock_save.call_args[0][0]
     assert all(m['id'] != 1234 for m in saved_reviews)
     assert mock_save.called
+    mock_delete_comments.assert_called_once_with(1234)
 
 def test_delete_review_invalid_review(mocker):
     mocker.patch("app.services.review_service.load_all", return_value=[])
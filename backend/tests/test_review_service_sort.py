@@ -1,5 +1,6 @@
 import pytest
 from app.services.review_service import list_reviews
+from app.repositories.review_store import ReviewStore
 
 
 def test_list_reviews_no_sort_returns_models_and_does_not_mutate(mocker):
@@ -7,7 +8,7 @@ def test_list_reviews_no_sort_returns_models_and_does_not_mutate(mocker):
         {"id": 1, "movieId": "A", "rating": 4.0, "authorId": 1, "reviewTitle": "t", "reviewBody": "b", "date": "2020-01-01"},
         {"id": 2, "movieId": "B", "rating": 5.0, "authorId": 1, "reviewTitle": "t", "reviewBody": "b", "date": "2020-01-02"},
     ]
-    mocker.patch("app.services.review_service.load_all", return_value=data)
+    mocker.patch("app.services.review_service.load_store", return_value=ReviewStore.from_rows(data))
     result = list_reviews()
     assert [r.id for r in result] == [1, 2]
     assert [r.movieId for r in result] == ["A", "B"]
@@ -22,7 +23,7 @@ def test_filter_by_rating_exact_match(mocker):
         {"id": 3, "movieId": "C", "rating": 4.0, "authorId": 1, "reviewTitle": "t", "reviewBody": "b", "date": "2020-01-03"},
         {"id": 4, "movieId": "D", "authorId": 1, "reviewTitle": "t", "reviewBody": "b", "date": "2020-01-04"},
     ]
-    mocker.patch("app.services.review_service.load_all", return_value=data)
+    mocker.patch("app.services.review_service.load_store", return_value=ReviewStore.from_rows(data))
     only_fives = list_reviews(rating=5)
     assert [r.id for r in only_fives] == [1, 2]
 
@@ -34,7 +35,7 @@ def test_sort_by_rating_ascending_descending(mocker):
         {"id": 3, "movieId": "C", "rating": 0, "authorId": 1, "reviewTitle": "t", "reviewBody": "b", "date": "2020-01-03"},
         {"id": 4, "movieId": "D", "rating": 5.0, "authorId": 1, "reviewTitle": "t", "reviewBody": "b", "date": "2020-01-04"},
     ]
-    mocker.patch("app.services.review_service.load_all", return_value=data)
+    mocker.patch("app.services.review_service.load_store", return_value=ReviewStore.from_rows(data))
 
     asc = list_reviews(sort_by="rating", order="asc")
     assert [r.id for r in asc] == [3, 1, 2, 4]
@@ -57,7 +58,7 @@ def test_sort_by_movie_id_supports_uuid_and_index(mocker):
         {"id": "B", "title": "Alpha"},
         {"id": "C", "title": "Omega"},
     ]
-    mocker.patch("app.services.review_service.load_all", return_value=reviews)
+    mocker.patch("app.services.review_service.load_store", return_value=ReviewStore.from_rows(reviews))
     mocker.patch("app.repositories.movie_repo.load_all", return_value=movies)
 
     asc = list_reviews(sort_by="movieId", order="asc")
@@ -79,7 +80,7 @@ def test_sort_by_movie_title_ascending_descending(mocker):
         {"id": "B", "title": "Alpha"},
         {"id": "C", "title": "Omega"},
     ]
-    mocker.patch("app.services.review_service.load_all", return_value=reviews)
+    mocker.patch("app.services.review_service.load_store", return_value=ReviewStore.from_rows(reviews))
     mocker.patch("app.repositories.movie_repo.load_all", return_value=movies)
 
     asc = list_reviews(sort_by="movieTitle", order="asc")
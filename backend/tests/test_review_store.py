@@ -0,0 +1,245 @@
+import json
+import tracemalloc
+from datetime import date
+
+import pytest
+
+from app.cli.migrate_review_text import main as migrate_main
+from app.repositories import review_repo
+from app.repositories.review_store import ReviewStore
+from app.schemas.review import Review
+
+
+def _review(review_id, **overrides):
+    review = {
+        "id": review_id,
+        "movieId": "m1",
+        "authorId": "u1",
+        "rating": 4.0,
+        "reviewTitle": f"Title {review_id}",
+        "reviewBody": f"Body {review_id}",
+        "flagged": False,
+        "votes": 0,
+        "date": "2024-05-01",
+        "visible": True,
+    }
+    review.update(overrides)
+    return review
+
+
+@pytest.fixture
+def reviews_file(tmp_path, monkeypatch):
+    path = tmp_path / "reviews.json"
+    monkeypatch.setattr(review_repo, "DATA_PATH", path)
+    return path
+
+
+def test_rows_read_back_every_field():
+    store = ReviewStore.from_rows([
+        _review(1, rating="4.5", votes=7, flagged=True, authorId=-1),
+        _review(2, movieId="m2", visible=False),
+    ])
+
+    first, second = store.rows()
+    assert (first.id, first.rating, first.votes, first.flagged, first.authorId) == (1, 4.5, 7, True, -1)
+    assert first.date == date(2024, 5, 1)
+    assert (first.reviewTitle, first.reviewBody) == ("Title 1", "Body 1")
+    assert (second.movieId, second.visible, second.flagged) == ("m2", False, False)
+
+
+def test_to_dict_builds_the_same_model_as_the_source_row():
+    source = _review(3, rating=5, votes=2, flagged=True)
+    row = ReviewStore.from_rows([source]).row(0)
+    assert Review(**row.to_dict()) == Review(**source)
+
+
+def test_unparseable_rating_and_date_are_left_out():
+    row = ReviewStore.from_rows([_review(1, rating="n/a", date=None)]).row(0)
+    assert row.rating is None and row.date is None
+    assert "rating" not in row.to_dict() and "date" not in row.to_dict()
+
+
+def test_rows_without_a_usable_id_are_skipped():
+    rows = [_review(1), _review(None), {"reviewTitle": "no id"}, _review("abc"), _review(2, reviewTitle="Kept")]
+    store = ReviewStore.from_rows(rows)
+
+    assert list(store.ids) == [1, 2]
+    assert store.row(store.position(2)).reviewTitle == "Kept"
+    assert store.text_matches("no id") == set()
+
+
+def test_ids_are_interned_once_per_distinct_value():
+    store = ReviewStore.from_rows([_review(i, movieId=f"m{i % 2}") for i in range(1, 7)])
+    assert store.movie_table.values == ["m1", "m0"]
+    assert list(store.movies) == [0, 1, 0, 1, 0, 1]
+    assert store.movie_code("m0") == 1
+    assert store.author_code("nobody") is None
+
+
+@pytest.mark.parametrize("ids", [[1, 2, 5, 9], [9, 1, 5, 2]])
+def test_position_finds_ids_in_any_order(ids):
+    store = ReviewStore.from_rows([_review(i) for i in ids])
+    for pos, review_id in enumerate(ids):
+        assert store.position(review_id) == pos
+    assert store.position(3) is None
+
+
+def test_visible_positions_skip_hidden_rows():
+    store = ReviewStore.from_rows([_review(1), _review(2, visible=False), _review(3)])
+    assert store.visible_positions() == [0, 2]
+
+
+def test_store_uses_less_memory_than_dicts():
+    rows = [_review(i, movieId=f"m{i % 50}", authorId=f"u{i % 200}", votes=i % 17) for i in range(1, 5001)]
+    for i, row in enumerate(rows):  # as reviews.json stores them, with the text in the text file
+        del row["reviewTitle"], row["reviewBody"]
+        row.update(textOffset=20 * i, titleLength=10, bodyLength=10)
+    payload = json.dumps(rows)
+
+    def traced(build):
+        tracemalloc.start()
+        try:
+            value = build()
+            size, _ = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        del value
+        return size
+
+    as_dicts = traced(lambda: json.loads(payload))
+    as_store = traced(lambda: ReviewStore.from_rows(json.loads(payload)))  # the parsed dicts are freed
+    assert as_store < as_dicts / 2
+
+
+def _saved_store(*rows):
+    review_repo.save_all(list(rows))
+    return review_repo.load_store()
+
+
+def test_save_all_moves_text_to_the_text_file(reviews_file):
+    review_repo.save_all([_review(1, reviewTitle="Café", reviewBody="Ünïcode body")])
+
+    (row,) = json.loads(reviews_file.read_text(encoding="utf-8-sig"))
+    assert "reviewTitle" not in row and "reviewBody" not in row
+    assert (row["textOffset"], row["titleLength"], row["bodyLength"]) == (0, 5, 14)
+    assert review_repo.text_path().read_bytes() == "CaféÜnïcode body".encode("utf-8")
+
+    store = review_repo.load_store()
+    assert (store.title(0), store.body(0)) == ("Café", "Ünïcode body")
+
+
+def test_load_all_leaves_text_to_with_text(reviews_file):
+    review_repo.save_all([_review(1), _review(2)])
+
+    rows = review_repo.load_all()
+    assert all("reviewBody" not in row for row in rows)
+    assert [row["reviewBody"] for row in review_repo.with_text(rows[1:])] == ["Body 2"]
+    assert Review(**review_repo.with_text(rows)[0]) == Review(**_review(1))
+
+
+def test_saving_only_appends_new_and_edited_text(reviews_file):
+    old_store = _saved_store(_review(1), _review(2))
+    size = review_repo.text_path().stat().st_size
+
+    rows = review_repo.load_all(load_invisible=True)
+    rows[0]["votes"] = 5
+    rows[1] = _review(2, reviewBody="Edited")
+    store = _saved_store(*rows, _review(3))
+
+    assert review_repo.text_path().stat().st_size == size + len("Title 2Edited") + len("Title 3Body 3")
+    assert [store.body(pos) for pos in range(3)] == ["Body 1", "Edited", "Body 3"]
+    assert old_store.body(1) == "Body 2"  # a store built earlier still reads its own text
+
+
+def test_rows_with_inline_text_are_read_and_migrated_on_save(reviews_file):
+    reviews_file.write_text(json.dumps([_review(1), _review(2, reviewTitle="Old format")]), encoding="utf-8-sig")
+
+    store = review_repo.load_store()
+    assert store.title(1) == "Old format" and store.text_matches("old") == {1}
+    assert not review_repo.text_path().exists()
+
+    review_repo.save_all(review_repo.load_all(load_invisible=True))
+    rows = json.loads(reviews_file.read_text(encoding="utf-8-sig"))
+    assert all("reviewTitle" not in row and "textOffset" in row for row in rows)
+    assert review_repo.load_store().title(1) == "Old format"
+
+
+def test_migrate_cli_moves_inline_text(reviews_file, capsys):
+    reviews_file.write_text(json.dumps([_review(1), _review(2)]), encoding="utf-8-sig")
+
+    assert migrate_main([]) == 0
+    assert "Moved the text of 2 of 2 reviews" in capsys.readouterr().out
+    assert all("textOffset" in row for row in review_repo.load_all())
+
+    assert migrate_main(["--compact"]) == 0
+    assert "Moved the text of 0 of 2 reviews" in capsys.readouterr().out
+    assert review_repo.get_by_id(2)["reviewBody"] == "Body 2"
+
+
+def test_compact_text_keeps_only_live_text(reviews_file):
+    review_repo.save_all([_review(1), _review(2)])
+    review_repo.save_all([_review(1, reviewBody="Edited")])
+
+    assert review_repo.compact_text() == len("Title 1Body 1Title 2Body 2")
+    assert review_repo.text_path().read_text() == "Title 1Edited"
+    assert review_repo.get_by_id(1)["reviewBody"] == "Edited"
+
+
+def test_text_past_the_end_of_the_file_reads_as_empty(reviews_file):
+    review_repo.save_all([_review(1)])
+    rows = review_repo.load_all()
+    rows[0]["bodyLength"] = 500
+    reviews_file.write_text(json.dumps(rows), encoding="utf-8-sig")
+
+    store = review_repo.load_store()
+    assert (store.title(0), store.body(0)) == ("", "")
+
+
+def test_text_matches_ignores_case_stale_text_and_the_title_body_boundary(reviews_file):
+    review_repo.save_all([
+        _review(1, reviewTitle="Great Film", reviewBody="Loved it"),
+        _review(2, reviewTitle="Meh", reviewBody="GREAT? no"),
+        _review(3, reviewTitle="Ending", reviewBody="Starts well"),
+        _review(4, reviewTitle="Ça", reviewBody="ÉLAN and Straße"),
+    ])
+    rows = review_repo.load_all(load_invisible=True)
+    rows[0] = _review(1, reviewTitle="Fine Film", reviewBody="Loved it")  # "great" is now stale text
+    rows.append(_review(5, reviewTitle="inline", reviewBody="Not migrated, great"))
+    reviews_file.write_text(json.dumps(rows), encoding="utf-8-sig")
+    store = review_repo.load_store()
+
+    assert store.text_matches("great") == {1, 4}
+    assert store.text_matches("film") == {0}
+    assert store.text_matches("endingstarts") == set()
+    assert store.text_matches("gstarts") == set()
+    assert store.text_matches("élan") == {3}
+    assert store.text_matches("ça") == {3}
+    assert store.text_matches("straße") == {3}
+    assert store.text_matches("title") == set()
+
+
+def test_get_by_id_reads_the_store(reviews_file):
+    reviews_file.write_text(json.dumps([_review(1), _review(2, visible=False)]))
+
+    assert review_repo.get_by_id(1)["reviewTitle"] == "Title 1"
+    assert review_repo.get_by_id(2) is None
+    assert review_repo.get_by_id(2, include_invisible=True)["visible"] is False
+    assert review_repo.get_by_id(3) is None
+
+
+def test_get_by_id_rebuilds_the_dict_from_columns(reviews_file):
+    reviews_file.write_text(json.dumps([_review(1, rating=5, legacyField="x"), _review(2, rating="n/a")]))
+
+    review = review_repo.get_by_id(1)
+    assert review["rating"] == 5.0 and isinstance(review["rating"], float)
+    assert "legacyField" not in review
+    assert "rating" not in review_repo.get_by_id(2)
+
+
+def test_save_all_refreshes_the_store(reviews_file):
+    review_repo.save_all([_review(1)])
+    assert len(review_repo.load_store()) == 1
+
+    review_repo.save_all([_review(1), _review(2, votes=4)])
+    store = review_repo.load_store()
+    assert store.row(store.position(2)).votes == 4
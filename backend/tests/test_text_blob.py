@@ -0,0 +1,43 @@
+from app.utils.text_blob import BlobView, append_texts
+
+
+def test_append_returns_offsets_and_encoded_lengths(tmp_path):
+    path = tmp_path / "blob.text"
+    assert append_texts(path, ["abc", ""]) == (0, [3, 0])
+    assert append_texts(path, ["héllo"]) == (3, [6])
+    assert path.stat().st_size == 9
+
+    view = BlobView(path)
+    assert view.read(0, 3) == "abc"
+    assert view.read(3, 6) == "héllo"
+    assert view.read(3, 0) == ""
+
+
+def test_view_is_unaffected_by_later_appends(tmp_path):
+    path = tmp_path / "blob.text"
+    append_texts(path, ["first"])
+    view = BlobView(path)
+    append_texts(path, ["second"])
+
+    assert view.size == 5
+    assert view.read(0, 5) == "first"
+    assert view.read(5, 6) == ""  # past the end of this view
+    assert BlobView(path).read(5, 6) == "second"
+
+
+def test_view_survives_the_file_being_replaced(tmp_path):
+    path = tmp_path / "blob.text"
+    append_texts(path, ["old text"])
+    view = BlobView(path)
+    replacement = tmp_path / "blob.tmp"
+    append_texts(replacement, ["new"])
+    replacement.replace(path)
+
+    assert view.read(0, 8) == "old text"
+
+
+def test_missing_file_maps_as_empty(tmp_path):
+    view = BlobView(tmp_path / "missing.text")
+    assert view.size == 0
+    assert view.read(0, 0) == ""
+
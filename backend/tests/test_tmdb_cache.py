@@ -0,0 +1,171 @@
+"""
+Tests for the two-tier TMDb response cache
+"""
+import pytest
+import httpx
+from unittest.mock import patch, AsyncMock, Mock
+from fastapi import HTTPException
+
+from app.services import tmdb_service
+from app.services.tmdb_cache import MISS, MemoryTTLCache, TMDbResponseCache, search_key
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+def _mock_client(mocker, response=None, side_effect=None):
+    client = AsyncMock()
+    client.get = AsyncMock(return_value=response, side_effect=side_effect)
+    client.__aenter__ = AsyncMock(return_value=client)
+    client.__aexit__ = AsyncMock(return_value=None)
+    mocker.patch("httpx.AsyncClient", return_value=client)
+    return client
+
+
+def _json_response(payload):
+    response = Mock()
+    response.json.return_value = payload
+    response.raise_for_status = Mock()
+    return response
+
+
+def test_search_key_normalizes_case_and_spacing():
+    assert search_key("  The   Matrix ") == search_key("the matrix")
+
+
+def test_memory_cache_evicts_least_recently_used():
+    cache = MemoryTTLCache(max_size=2)
+    cache.set("a", 1, expires_at=100)
+    cache.set("b", 2, expires_at=100)
+    cache.get("a", now=0)
+    cache.set("c", 3, expires_at=100)
+    assert cache.get("b", now=0) is MISS
+    assert cache.get("a", now=0) == 1
+
+
+def test_entries_expire_after_ttl(tmp_path):
+    clock = FakeClock()
+    cache = TMDbResponseCache(path=str(tmp_path / "c.sqlite3"), clock=clock)
+    cache.set("k", {"v": 1}, ttl=10)
+    assert cache.get("k") == {"v": 1}
+    clock.now += 11
+    assert cache.get("k") is MISS
+
+
+def test_disk_tier_survives_restart(tmp_path):
+    path = str(tmp_path / "c.sqlite3")
+    first = TMDbResponseCache(path=path)
+    first.set("k", [{"title": "Inception"}], ttl=60)
+    first.close()
+
+    second = TMDbResponseCache(path=path)
+    assert second.get("k") == [{"title": "Inception"}]
+    assert second.stats()["disk_hits"] == 1
+    assert second.get("k") == [{"title": "Inception"}]
+    assert second.stats()["memory_hits"] == 1
+
+
+def test_negative_results_use_short_ttl(tmp_path, monkeypatch):
+    monkeypatch.setattr("app.services.tmdb_cache.TMDB_NEGATIVE_CACHE_TTL", 5)
+    clock = FakeClock()
+    cache = TMDbResponseCache(path=None, clock=clock)
+    cache.set("k", [], ttl=3600)
+    assert cache.get("k") == []
+    clock.now += 6
+    assert cache.get("k") is MISS
+
+
+def test_stats_report_hit_rate():
+    cache = TMDbResponseCache(path=None)
+    cache.get("k")
+    cache.set("k", {"v": 1}, ttl=60)
+    cache.get("k")
+    stats = cache.stats()
+    assert stats["misses"] == 1
+    assert stats["memory_hits"] == 1
+    assert stats["hit_rate"] == 0.5
+    assert stats["disk_enabled"] is False
+
+
+@pytest.mark.asyncio
+@patch("app.services.tmdb_service.TMDB_API_KEY", "test_key")
+async def test_search_served_from_cache_for_equivalent_queries(mocker):
+    client = _mock_client(mocker, _json_response({"results": [{"id": 1, "title": "Inception"}]}))
+    await tmdb_service.search_tmdb_movies("Inception")
+    results = await tmdb_service.search_tmdb_movies("  inception ")
+    assert results[0]["title"] == "Inception"
+    assert client.get.await_count == 1
+
+
+@pytest.mark.asyncio
+@patch("app.services.tmdb_service.TMDB_API_KEY", "test_key")
+async def test_cached_results_are_copies(mocker):
+    _mock_client(mocker, _json_response({"results": [{"id": 1, "title": "Inception"}]}))
+    first = await tmdb_service.search_tmdb_movies("Inception")
+    first[0]["movie_id"] = "tmdb_1"
+    second = await tmdb_service.search_tmdb_movies("Inception")
+    assert "movie_id" not in second[0]
+
+
+@pytest.mark.asyncio
+@patch("app.services.tmdb_service.TMDB_API_KEY", "test_key")
+async def test_details_404_is_cached(mocker):
+    request = httpx.Request("GET", "https://api.themoviedb.org/3/movie/1")
+    not_found = httpx.HTTPStatusError("404", request=request, response=httpx.Response(404, request=request))
+    client = _mock_client(mocker, side_effect=not_found)
+    for _ in range(2):
+        with pytest.raises(HTTPException) as exc_info:
+            await tmdb_service.get_tmdb_movie_details(1)
+        assert exc_info.value.status_code == 404
+    assert client.get.await_count == 1
+
+
+@pytest.mark.asyncio
+@patch("app.services.tmdb_service.TMDB_API_KEY", "test_key")
+async def test_network_errors_are_not_cached(mocker, monkeypatch):
+    monkeypatch.setattr("app.services.tmdb_resilience.TMDB_MAX_RETRIES", 0)
+    client = _mock_client(mocker, side_effect=httpx.ConnectError("down"))
+    for _ in range(2):
+        with pytest.raises(HTTPException):
+            await tmdb_service.get_tmdb_movie_details(1)
+    assert client.get.await_count == 2
+
+
+def test_expired_entries_can_be_served_stale(tmp_path):
+    clock = FakeClock()
+    cache = TMDbResponseCache(path=str(tmp_path / "c.sqlite3"), clock=clock)
+    cache.set("k", {"v": 1}, ttl=10)
+    clock.now += 11
+    assert cache.get("k") is MISS
+    assert cache.get_stale("k") == {"v": 1}
+    cache.clear_memory()
+    assert cache.get_stale("k") == {"v": 1}
+    assert cache.stats()["stale_hits"] == 2
+
+
+@pytest.mark.asyncio
+async def test_async_access_keeps_sqlite_off_the_event_loop(tmp_path, mocker):
+    import threading
+    cache = TMDbResponseCache(path=str(tmp_path / "c.sqlite3"))
+    loop_thread = threading.get_ident()
+    threads = []
+    for name in ("peek", "set"):
+        original = getattr(cache.disk, name)
+        def record(*args, _original=original):
+            threads.append(threading.get_ident())
+            return _original(*args)
+        mocker.patch.object(cache.disk, name, side_effect=record)
+
+    await cache.aset("k", {"v": 1}, ttl=10)
+    cache.clear_memory()
+    assert await cache.aget("k") == {"v": 1}
+    assert await cache.aget("k") == {"v": 1}  # memory hit, answered inline
+    assert await cache.aget_stale("missing") is MISS
+
+    assert len(threads) == 3
+    assert loop_thread not in threads
@@ -0,0 +1,116 @@
+"""
+Tests for the local TMDb catalog import and search
+"""
+import gzip
+import json
+from unittest.mock import patch
+
+import pytest
+
+from app.cli.import_tmdb_catalog import main as import_cli
+from app.repositories import tmdb_catalog_repo
+from app.services.tmdb_catalog_service import import_export, iter_export, search_catalog
+from app.services.unified_search_service import search_all_movies
+
+EXPORT = [
+    {"adult": False, "id": 27205, "original_title": "Inception", "popularity": 80.5, "video": False},
+    {"adult": False, "id": 157336, "original_title": "Interstellar", "popularity": 95.1, "video": False},
+    {"adult": False, "id": 1, "original_title": "Inception: The Cobol Job", "popularity": 3.2, "video": False},
+    {"adult": True, "id": 2, "original_title": "Adult Title", "popularity": 1.0, "video": False},
+    {"adult": False, "id": 3, "original_title": "Some Trailer", "popularity": 1.0, "video": True},
+]
+
+
+def _write_export(path, entries, extra_lines=()):
+    lines = [json.dumps(entry) for entry in entries] + list(extra_lines)
+    opener = gzip.open if path.suffix == ".gz" else open
+    with opener(path, "wt", encoding="utf-8") as f:
+        f.write("\n".join(lines) + "\n")
+    return path
+
+
+def test_tokenize():
+    assert tmdb_catalog_repo.tokenize("Inception: The  Cobol-Job") == ["inception", "the", "cobol", "job"]
+
+
+def test_iter_export_skips_adult_videos_and_bad_lines(tmp_path):
+    path = _write_export(tmp_path / "export.json", EXPORT, ["not json", json.dumps({"id": "x"})])
+    counts = {}
+    rows = list(iter_export(path, counts=counts))
+    assert [row["tmdb_id"] for row in rows] == [27205, 157336, 1]
+    assert counts == {"skipped": 2, "malformed": 2}
+
+
+def test_import_gzipped_export_and_search(tmp_path):
+    path = _write_export(tmp_path / "export.json.gz", EXPORT)
+
+    result = import_export(path, batch_size=2)
+
+    assert result.imported == 3
+    assert result.skipped == 2
+    assert tmdb_catalog_repo.count() == 3
+    titles = [movie["title"] for movie in search_catalog("incep")]
+    assert titles == ["Inception", "Inception: The Cobol Job"]  # most popular first
+    assert [m["tmdb_id"] for m in search_catalog("cobol incep")] == [1]
+    assert search_catalog("matrix") == []
+
+
+def test_import_holds_one_batch_at_a_time(tmp_path, mocker):
+    path = _write_export(tmp_path / "export.json", EXPORT[:3])
+    add_batch = mocker.spy(tmdb_catalog_repo.CatalogWriter, "add_batch")
+
+    import_export(path, batch_size=2)
+
+    assert [len(call.args[1]) for call in add_batch.call_args_list] == [2, 1]
+
+
+def test_reimport_replaces_catalog(tmp_path):
+    import_export(_write_export(tmp_path / "a.json", EXPORT[:1]))
+    assert search_catalog("inception")
+    import_export(_write_export(tmp_path / "b.json", EXPORT[1:2]))
+    assert search_catalog("inception") == []
+    assert search_catalog("interstellar")[0]["tmdb_id"] == 157336
+
+
+def test_failed_import_keeps_previous_catalog(tmp_path, mocker):
+    import_export(_write_export(tmp_path / "a.json", EXPORT[:1]))
+    mocker.patch.object(tmdb_catalog_repo.CatalogWriter, "finish", side_effect=RuntimeError("disk full"))
+    with pytest.raises(RuntimeError):
+        import_export(_write_export(tmp_path / "b.json", EXPORT[1:2]))
+    assert search_catalog("inception")[0]["tmdb_id"] == 27205
+
+
+def test_search_without_catalog_returns_nothing():
+    assert search_catalog("inception") == []
+
+
+def test_cli_imports_file(tmp_path, capsys):
+    path = _write_export(tmp_path / "export.json", EXPORT)
+    assert import_cli([str(path)]) == 0
+    assert "Imported 3 movies" in capsys.readouterr().out
+    assert import_cli([str(tmp_path / "missing.json")]) == 1
+
+
+@pytest.mark.asyncio
+@patch("app.services.unified_search_service.search_movies_titles", return_value=[])
+@patch("app.services.unified_search_service.search_tmdb_movies")
+async def test_unified_search_prefers_catalog_and_cancels_tmdb(mock_tmdb, mock_local, tmp_path):
+    import asyncio
+    import_export(_write_export(tmp_path / "export.json", EXPORT))
+    cancelled = asyncio.Event()
+
+    async def hanging_tmdb(query):
+        try:
+            await asyncio.sleep(5)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+
+    mock_tmdb.side_effect = hanging_tmdb
+
+    result = await search_all_movies("inception", deadline=2.0)
+
+    assert [m["movie_id"] for m in result["external"]] == ["tmdb_27205", "tmdb_1"]
+    assert result["source"] == "tmdb"
+    assert result["partial"] is False
+    await asyncio.wait_for(cancelled.wait(), timeout=1.0)
@@ -0,0 +1,59 @@
+"""
+Shared TMDb client tests against the local fake TMDb server.
+"""
+import json
+import time
+
+import pytest
+
+from app.cli.fake_tmdb import FakeTMDbServer
+from app.services import tmdb_service
+
+
+@pytest.fixture
+def stand_in(monkeypatch):
+    with FakeTMDbServer() as server:
+        monkeypatch.setattr(tmdb_service, "TMDB_BASE_URL", server.base_url)
+        monkeypatch.setattr(tmdb_service, "TMDB_API_KEY", "test_key")
+        yield server
+
+
+async def _timed_searches(count: int) -> float:
+    start = time.perf_counter()
+    for i in range(count):
+        await tmdb_service.search_tmdb_movies(f"stand-in {i}")  # distinct keys bypass the cache
+    return time.perf_counter() - start
+
+
+async def test_shared_client_reuses_connection(stand_in):
+    await tmdb_service.start_client()
+    try:
+        pooled_seconds = await _timed_searches(10)
+    finally:
+        await tmdb_service.close_client()
+    assert stand_in.stats["search"] == 10
+    assert stand_in.stats["connections"] == 1
+    print(f"pooled: 10 requests in {pooled_seconds * 1000:.1f} ms over 1 connection")
+
+
+async def test_without_shared_client_each_call_connects(stand_in):
+    unpooled_seconds = await _timed_searches(10)
+    assert stand_in.stats["connections"] == 10
+    print(f"unpooled: 10 requests in {unpooled_seconds * 1000:.1f} ms over 10 connections")
+
+
+async def test_close_client_resets_state():
+    await tmdb_service.start_client()
+    await tmdb_service.close_client()
+    assert tmdb_service._client is None
+    await tmdb_service.close_client()  # idempotent
+
+
+async def test_http2_falls_back_without_h2(monkeypatch, mock_logger):
+    monkeypatch.setattr(tmdb_service, "TMDB_HTTP2", True)
+    monkeypatch.setattr(tmdb_service, "_http2_available", lambda: False)
+    monkeypatch.setattr(tmdb_service, "logger", mock_logger)
+    client = tmdb_service._build_client()
+    await client.aclose()
+    logs = json.loads(mock_logger.log_file.read_text())
+    assert "h2 is not installed" in logs[0]["message"]
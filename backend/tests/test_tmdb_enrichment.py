@@ -0,0 +1,173 @@
+"""
+Tests for the background TMDb enrichment worker
+"""
+import asyncio
+import threading
+
+import pytest
+
+from app.services.tmdb_enrichment import EnrichmentWorker, needs_enrichment
+from app.services.movie_service import get_movie_by_id
+
+DETAILS = {
+    "poster_url": "https://image.tmdb.org/t/p/w500/poster.jpg",
+    "description": "A thief who steals corporate secrets...",
+    "genre": "Action",
+}
+
+
+@pytest.fixture
+def movies(mocker):
+    stored = [
+        {"id": "tmdb_1", "title": "One", "genre": "", "description": "", "duration": 100, "release": "2010-01-01"},
+        {"id": "tmdb_2", "title": "Two", "genre": "Drama", "description": "", "duration": 100, "release": "2011-01-01"},
+        {"id": "local", "title": "Local", "genre": "Drama", "description": "x", "duration": 90, "release": "2012-01-01"},
+    ]
+
+    def save(rows):
+        stored[:] = [dict(r) for r in rows]
+
+    mocker.patch("app.repositories.movie_repo.load_all", side_effect=lambda: [dict(r) for r in stored])
+    save_mock = mocker.patch("app.repositories.movie_repo.save_all", side_effect=save)
+    return stored, save_mock
+
+
+def test_needs_enrichment():
+    assert needs_enrichment({"id": "tmdb_1", "description": "x"})
+    assert not needs_enrichment({"id": "tmdb_1", "description": "x", "posterUrl": "p"})
+    assert not needs_enrichment({"id": "local"})
+
+
+def test_enqueue_deduplicates_and_bounds():
+    worker = EnrichmentWorker(max_pending=2)
+    assert worker.enqueue("tmdb_1")
+    assert not worker.enqueue("tmdb_1")
+    assert worker.enqueue("tmdb_2")
+    assert not worker.enqueue("tmdb_3")
+    assert worker.pending() == ["tmdb_1", "tmdb_2"]
+    assert worker.snapshot()["dropped"] == 1
+
+
+async def test_drain_bounds_concurrency_and_writes_once(mocker, movies):
+    stored, save_mock = movies
+    active = 0
+    peak = 0
+
+    async def details(tmdb_id):
+        nonlocal active, peak
+        active += 1
+        peak = max(peak, active)
+        await asyncio.sleep(0.01)
+        active -= 1
+        return DETAILS
+
+    mocker.patch("app.services.tmdb_enrichment.get_tmdb_movie_details", side_effect=details)
+    worker = EnrichmentWorker(concurrency=1)
+    worker.enqueue("tmdb_1")
+    worker.enqueue("tmdb_2")
+
+    assert await worker.drain() == 2
+    assert peak == 1
+    assert save_mock.call_count == 1
+    assert stored[0]["posterUrl"] == DETAILS["poster_url"]
+    assert stored[0]["genre"] == "Action"
+    assert stored[1]["genre"] == "Drama"
+    assert worker.pending() == []
+
+
+def test_get_movie_by_id_enqueues_without_calling_tmdb(mocker, movies):
+    worker = EnrichmentWorker()
+    mocker.patch("app.services.movie_service.enrichment_worker", worker)
+    mocker.patch("app.services.movie_service._get_reviews_for_movie", return_value=[])
+    tmdb = mocker.patch("app.services.tmdb_enrichment.get_tmdb_movie_details")
+
+    movie = get_movie_by_id("tmdb_1")
+
+    assert movie.posterUrl is None
+    assert worker.pending() == ["tmdb_1"]
+    tmdb.assert_not_called()
+
+
+async def test_running_worker_picks_up_items_from_other_threads(mocker, movies):
+    stored, _ = movies
+    mocker.patch("app.services.tmdb_enrichment.get_tmdb_movie_details", return_value=DETAILS)
+    worker = EnrichmentWorker(batch_delay=0)
+    await worker.start()
+    try:
+        thread = threading.Thread(target=worker.enqueue, args=("tmdb_1",))
+        thread.start()
+        thread.join()
+        for _ in range(100):
+            if worker.snapshot()["enriched"]:
+                break
+            await asyncio.sleep(0.01)
+    finally:
+        await worker.stop()
+
+    assert stored[0]["posterUrl"] == DETAILS["poster_url"]
+
+
+def test_needs_enrichment_waits_before_retrying_an_answered_movie():
+    from datetime import datetime, timedelta, timezone
+    from app.services.tmdb_enrichment import ENRICHED_AT_FIELD, TMDB_ENRICH_RETRY_AFTER
+
+    now = datetime(2024, 1, 10, tzinfo=timezone.utc)
+    movie = {"id": "tmdb_1", "description": "", ENRICHED_AT_FIELD: now.isoformat()}
+    assert not needs_enrichment(movie, now=now + timedelta(hours=1))
+    assert needs_enrichment(movie, now=now + timedelta(seconds=TMDB_ENRICH_RETRY_AFTER))
+    assert needs_enrichment({**movie, ENRICHED_AT_FIELD: "garbage"}, now=now)
+
+
+async def test_movie_tmdb_has_nothing_for_is_not_requeued(mocker, movies):
+    from fastapi import HTTPException
+    from app.services.tmdb_enrichment import ENRICHED_AT_FIELD
+
+    stored, save_mock = movies
+
+    async def details(tmdb_id):
+        if tmdb_id == 1:
+            return {"description": "", "genre": ""}
+        raise HTTPException(status_code=404, detail="Movie not found on TMDb")
+
+    mocker.patch("app.services.tmdb_enrichment.get_tmdb_movie_details", side_effect=details)
+    worker = EnrichmentWorker()
+    worker.enqueue("tmdb_1")
+    worker.enqueue("tmdb_2")
+
+    assert await worker.drain() == 0
+    assert save_mock.call_count == 1
+    assert stored[0][ENRICHED_AT_FIELD] and stored[1][ENRICHED_AT_FIELD]
+    assert "posterUrl" not in stored[0]
+    assert not needs_enrichment(stored[0]) and not needs_enrichment(stored[1])
+
+
+def test_apply_details_does_not_lose_a_concurrently_added_movie(tmp_path, monkeypatch):
+    import json
+    import time
+    from app.repositories import movie_repo
+    from app.schemas.movie import MovieCreate
+    from app.services.movie_service import create_movie
+    from app.services.tmdb_enrichment import _apply_details
+
+    path = tmp_path / "movies.json"
+    path.write_text(json.dumps([
+        {"id": "tmdb_1", "title": "One", "genre": "", "description": "", "duration": 100, "release": "2010-01-01"},
+    ]), encoding="utf-8")
+    monkeypatch.setattr(movie_repo, "DATA_PATH", path)
+    load_all = movie_repo.load_all
+
+    def slow_load():
+        movies = load_all()
+        time.sleep(0.2)
+        return movies
+
+    monkeypatch.setattr(movie_repo, "load_all", slow_load)
+    enrich = threading.Thread(target=_apply_details, args=({"tmdb_1": DETAILS},))
+    enrich.start()
+    time.sleep(0.05)
+    create_movie(MovieCreate(title="New", genre="Drama", release="2020-01-01", description="x", duration=90))
+    enrich.join()
+
+    saved = json.loads(path.read_text(encoding="utf-8"))
+    assert [m["title"] for m in saved] == ["One", "New"]
+    assert saved[0]["posterUrl"] == DETAILS["poster_url"]
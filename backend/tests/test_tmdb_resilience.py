@@ -0,0 +1,248 @@
+"""
+Tests for TMDb rate limiting, retries and circuit breaker
+"""
+import pytest
+import httpx
+from unittest.mock import AsyncMock, Mock
+from fastapi import HTTPException
+from fastapi.testclient import TestClient
+
+from app.main import app
+from app.services import tmdb_service
+from app.services.tmdb_cache import search_key
+from app.services.tmdb_resilience import (
+    CLOSED,
+    HALF_OPEN,
+    OPEN,
+    CircuitBreaker,
+    TokenBucket,
+    parse_retry_after,
+)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+
+def _status_error(status, headers=None):
+    request = httpx.Request("GET", "https://api.themoviedb.org/3/search/movie")
+    response = httpx.Response(status, request=request, headers=headers or {})
+    return httpx.HTTPStatusError(str(status), request=request, response=response)
+
+
+def _ok(payload):
+    response = Mock()
+    response.json.return_value = payload
+    response.raise_for_status = Mock()
+    return response
+
+
+def _mock_client(mocker, side_effect):
+    client = AsyncMock()
+    client.get = AsyncMock(side_effect=side_effect)
+    client.__aenter__ = AsyncMock(return_value=client)
+    client.__aexit__ = AsyncMock(return_value=None)
+    mocker.patch("httpx.AsyncClient", return_value=client)
+    return client
+
+
+def test_token_bucket_waits_once_burst_is_spent():
+    clock = FakeClock()
+    bucket = TokenBucket(rate=2, burst=2, clock=clock)
+    assert bucket._reserve() == 0
+    assert bucket._reserve() == 0
+    assert bucket._reserve() == pytest.approx(0.5)
+    clock.now += 1.5
+    assert bucket._reserve() == 0
+
+
+def test_token_bucket_defer_holds_back_callers():
+    clock = FakeClock()
+    bucket = TokenBucket(rate=10, burst=10, clock=clock)
+    bucket.defer(3)
+    assert bucket._reserve() == pytest.approx(3)
+    assert bucket.snapshot()["blocked_for"] == pytest.approx(3)
+
+
+def test_breaker_opens_after_threshold_and_recovers():
+    clock = FakeClock()
+    breaker = CircuitBreaker(threshold=2, reset_timeout=30, clock=clock)
+    breaker.record_failure()
+    assert breaker.state == CLOSED
+    breaker.record_failure()
+    assert breaker.state == OPEN
+    with pytest.raises(tmdb_service.CircuitOpenError):
+        breaker.before_call()
+
+    clock.now += 30
+    assert breaker.state == HALF_OPEN
+    breaker.before_call()
+    breaker.record_success()
+    assert breaker.state == CLOSED
+    assert breaker.snapshot()["consecutive_failures"] == 0
+
+
+def test_breaker_half_open_failure_reopens():
+    clock = FakeClock()
+    breaker = CircuitBreaker(threshold=1, reset_timeout=10, clock=clock)
+    breaker.record_failure()
+    clock.now += 10
+    assert breaker.state == HALF_OPEN
+    breaker.record_failure()
+    assert breaker.state == OPEN
+    assert breaker.snapshot()["total_opens"] == 2
+
+
+def test_breaker_half_open_admits_a_single_trial():
+    from concurrent.futures import ThreadPoolExecutor
+
+    clock = FakeClock()
+    breaker = CircuitBreaker(threshold=1, reset_timeout=10, clock=clock)
+    breaker.record_failure()
+    clock.now += 10
+
+    def attempt(_):
+        try:
+            return breaker.before_call()
+        except tmdb_service.CircuitOpenError:
+            return None
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        outcomes = list(pool.map(attempt, range(20)))
+
+    assert outcomes.count(True) == 1
+    assert outcomes.count(None) == 19
+    breaker.record_success()
+    assert breaker.before_call() is False
+
+
+def test_breaker_released_or_stale_trial_lets_another_through():
+    clock = FakeClock()
+    breaker = CircuitBreaker(threshold=1, reset_timeout=10, clock=clock)
+    breaker.record_failure()
+    clock.now += 10
+    assert breaker.before_call() is True
+    breaker.release()
+    assert breaker.before_call() is True
+    with pytest.raises(tmdb_service.CircuitOpenError):
+        breaker.before_call()
+    clock.now += 10  # the trial never reported back
+    assert breaker.before_call() is True
+
+
+@pytest.mark.asyncio
+async def test_half_open_breaker_sends_one_concurrent_request(mocker, monkeypatch):
+    import asyncio
+
+    monkeypatch.setattr(tmdb_service, "TMDB_API_KEY", "test_key")
+    clock = FakeClock()
+    monkeypatch.setattr(tmdb_service, "_breaker", CircuitBreaker(threshold=1, reset_timeout=10, clock=clock))
+    tmdb_service._breaker.record_failure()
+    clock.now += 10
+
+    async def slow_ok(*args, **kwargs):
+        await asyncio.sleep(0.05)
+        return _ok({"results": [{"id": 1, "title": "Inception"}]})
+
+    client = _mock_client(mocker, slow_ok)
+    results = await asyncio.gather(
+        *(tmdb_service.search_tmdb_movies(f"Inception {n}") for n in range(5)),
+        return_exceptions=True,
+    )
+
+    assert client.get.await_count == 1
+    assert sum(isinstance(r, list) for r in results) == 1
+    assert all(r.status_code == 503 for r in results if isinstance(r, HTTPException))
+    assert tmdb_service._breaker.state == CLOSED
+
+
+def test_parse_retry_after():
+    assert parse_retry_after("3") == 3.0
+    assert parse_retry_after(None) is None
+    assert parse_retry_after("soon") is None
+    assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+
+
+@pytest.mark.asyncio
+async def test_429_is_retried_after_retry_after(mocker, monkeypatch):
+    monkeypatch.setattr(tmdb_service, "TMDB_API_KEY", "test_key")
+    delay = mocker.patch("app.services.tmdb_service.backoff_delay", return_value=0)
+    client = _mock_client(mocker, [
+        _status_error(429, {"Retry-After": "2"}),
+        _ok({"results": [{"id": 1, "title": "Inception"}]}),
+    ])
+
+    results = await tmdb_service.search_tmdb_movies("Inception")
+
+    assert results[0]["title"] == "Inception"
+    assert client.get.await_count == 2
+    delay.assert_called_once_with(0, 2.0)
+    assert tmdb_service._breaker.state == CLOSED
+
+
+@pytest.mark.asyncio
+async def test_exhausted_retries_return_503_and_count_towards_breaker(mocker, monkeypatch):
+    monkeypatch.setattr(tmdb_service, "TMDB_API_KEY", "test_key")
+    client = _mock_client(mocker, httpx.ConnectTimeout("slow"))
+
+    with pytest.raises(HTTPException) as exc_info:
+        await tmdb_service.search_tmdb_movies("Inception")
+
+    assert exc_info.value.status_code == 503
+    assert client.get.await_count == 3
+    assert tmdb_service._breaker.snapshot()["consecutive_failures"] == 1
+
+
+@pytest.mark.asyncio
+async def test_not_found_is_not_retried(mocker, monkeypatch):
+    monkeypatch.setattr(tmdb_service, "TMDB_API_KEY", "test_key")
+    client = _mock_client(mocker, _status_error(404))
+
+    with pytest.raises(HTTPException) as exc_info:
+        await tmdb_service.get_tmdb_movie_details(1)
+
+    assert exc_info.value.status_code == 404
+    assert client.get.await_count == 1
+
+
+@pytest.mark.asyncio
+async def test_open_breaker_fails_fast(mocker, monkeypatch):
+    monkeypatch.setattr(tmdb_service, "TMDB_API_KEY", "test_key")
+    monkeypatch.setattr(tmdb_service, "_breaker", CircuitBreaker(threshold=1))
+    tmdb_service._breaker.record_failure()
+    client = _mock_client(mocker, _ok({"results": []}))
+
+    with pytest.raises(HTTPException) as exc_info:
+        await tmdb_service.search_tmdb_movies("Inception")
+
+    assert exc_info.value.status_code == 503
+    assert client.get.await_count == 0
+
+
+@pytest.mark.asyncio
+async def test_open_breaker_serves_stale_cache(mocker, monkeypatch, tmdb_cache):
+    monkeypatch.setattr(tmdb_service, "TMDB_API_KEY", "test_key")
+    monkeypatch.setattr(tmdb_service, "_breaker", CircuitBreaker(threshold=1))
+    tmdb_cache.set(search_key("Inception"), [{"tmdb_id": 1, "title": "Inception"}], ttl=-1)
+    tmdb_service._breaker.record_failure()
+    _mock_client(mocker, _ok({"results": []}))
+
+    results = await tmdb_service.search_tmdb_movies("Inception")
+
+    assert results == [{"tmdb_id": 1, "title": "Inception"}]
+
+
+def test_health_endpoint_reports_breaker_state(monkeypatch):
+    monkeypatch.setattr(tmdb_service, "_breaker", CircuitBreaker(threshold=1))
+    with TestClient(app) as client:
+        assert client.get("/tmdb/health").json()["status"] == "ok"
+        tmdb_service._breaker.record_failure()
+        body = client.get("/tmdb/health").json()
+
+    assert body["status"] == "unavailable"
+    assert body["circuit"]["state"] == OPEN
+    assert "available_tokens" in body["rate_limiter"]
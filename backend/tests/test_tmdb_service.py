@@ -167,3 +167,28 @@ async def test_get_tmdb_movie_details_api_error(mocker):
     with pytest.raises(HTTPException) as exc_info:
         await get_tmdb_movie_details(27205)
     assert exc_info.value.status_code == 404
+
+
+@pytest.mark.asyncio
+@patch("app.services.tmdb_service.TMDB_API_KEY", "test_key")
+async def test_concurrent_identical_searches_share_one_request(mocker):
+    import asyncio
+
+    async def slow_get(*args, **kwargs):
+        await asyncio.sleep(0.01)
+        return mock_response
+
+    mock_response = Mock()
+    mock_response.json.return_value = {"results": [{"id": 27205, "title": "Inception"}]}
+    mock_response.raise_for_status = Mock()
+
+    mock_client = AsyncMock()
+    mock_client.get = AsyncMock(side_effect=slow_get)
+    mock_client.__aenter__ = AsyncMock(return_value=mock_client)
+    mock_client.__aexit__ = AsyncMock(return_value=None)
+    mocker.patch("httpx.AsyncClient", return_value=mock_client)
+
+    results = await asyncio.gather(*(search_tmdb_movies("Inception") for _ in range(5)))
+
+    assert mock_client.get.await_count == 1
+    assert all(r[0]["title"] == "Inception" for r in results)
@@ -11,7 +11,7 @@ from app.schemas.movie import MovieSummary
 @patch("app.services.unified_search_service.search_movies_titles")
 @patch("app.services.unified_search_service.search_tmdb_movies")
 async def test_search_with_many_local_results(mock_tmdb, mock_local):
-    """When 3+ local results exist, don't query TMDb"""
+    """When 3+ local results exist, TMDb results are not used"""
     # Mock 3 local results
     mock_local.return_value = [
         MovieSummary(id="1", title="Inception Documentary"),
@@ -24,7 +24,7 @@ async def test_search_with_many_local_results(mock_tmdb, mock_local):
     assert len(result["local"]) == 3
     assert len(result["external"]) == 0
     assert result["source"] == "local"
-    mock_tmdb.assert_not_called()
+    assert result["partial"] is False
 
 
 @pytest.mark.asyncio
@@ -111,3 +111,106 @@ async def test_search_empty_query():
     assert len(result["local"]) == 0
     assert len(result["external"]) == 0
     assert result["source"] == "local"
+
+
+@pytest.mark.asyncio
+@patch("app.services.unified_search_service.search_movies_titles")
+@patch("app.services.unified_search_service.search_tmdb_movies")
+async def test_search_runs_local_and_tmdb_concurrently(mock_tmdb, mock_local):
+    """Local and TMDb searches overlap instead of running back to back"""
+    import asyncio
+    import time
+
+    def slow_local(query):
+        time.sleep(0.2)
+        return []
+
+    async def slow_tmdb(query):
+        await asyncio.sleep(0.2)
+        return [{"tmdb_id": 27205, "title": "Inception"}]
+
+    mock_local.side_effect = slow_local
+    mock_tmdb.side_effect = slow_tmdb
+
+    started = time.perf_counter()
+    result = await search_all_movies("inception", deadline=1.0)
+    elapsed = time.perf_counter() - started
+
+    assert len(result["external"]) == 1
+    assert result["partial"] is False
+    assert elapsed < 0.35
+
+
+@pytest.mark.asyncio
+@patch("app.services.unified_search_service.search_movies_titles")
+@patch("app.services.unified_search_service.search_tmdb_movies")
+async def test_search_returns_partial_when_tmdb_misses_deadline(mock_tmdb, mock_local):
+    """Local results come back on time, flagged partial, if TMDb is too slow"""
+    import asyncio
+
+    async def hanging_tmdb(query):
+        await asyncio.sleep(5)
+        return []
+
+    mock_local.return_value = [MovieSummary(id="1", title="Inception Documentary")]
+    mock_tmdb.side_effect = hanging_tmdb
+
+    result = await search_all_movies("inception", deadline=0.05)
+
+    assert len(result["local"]) == 1
+    assert result["external"] == []
+    assert result["source"] == "local"
+    assert result["partial"] is True
+
+
+@pytest.mark.asyncio
+@patch("app.services.unified_search_service.search_movies_titles", return_value=[])
+async def test_search_that_misses_deadline_still_fills_tmdb_cache(mock_local, tmdb_cache):
+    """The timed-out TMDb request keeps running and caches its results"""
+    import asyncio
+    from app.services import unified_search_service
+    from app.services.tmdb_cache import MISS, search_key
+
+    async def slow_get(endpoint, params=None):
+        await asyncio.sleep(0.2)
+        return {"results": [{"id": 27205, "title": "Inception"}]}
+
+    with patch("app.services.tmdb_service._tmdb_get", side_effect=slow_get):
+        result = await search_all_movies("inception", deadline=0.05)
+        assert result["partial"] is True
+        assert tmdb_cache.get(search_key("inception")) is MISS
+
+        background = list(unified_search_service._background_searches)
+        assert len(background) == 1
+        await asyncio.wait(background, timeout=1.0)
+
+    assert tmdb_cache.get(search_key("inception"))[0]["tmdb_id"] == 27205
+    assert not unified_search_service._background_searches
+
+
+@pytest.mark.asyncio
+@patch("app.services.unified_search_service.search_movies_titles")
+@patch("app.services.unified_search_service.search_tmdb_movies")
+async def test_deadline_also_bounds_a_slow_local_search(mock_tmdb, mock_local):
+    """The deadline runs from the start of the request and covers every search"""
+    import asyncio
+    import time
+
+    def slow_local(query):
+        time.sleep(0.5)
+        return [MovieSummary(id="1", title="Inception Documentary")]
+
+    async def quick_tmdb(query):
+        return [{"tmdb_id": 27205, "title": "Inception"}]
+
+    mock_local.side_effect = slow_local
+    mock_tmdb.side_effect = quick_tmdb
+
+    started = time.perf_counter()
+    result = await search_all_movies("inception", deadline=0.1)
+    elapsed = time.perf_counter() - started
+
+    assert elapsed < 0.3
+    assert result["local"] == []
+    assert [m["movie_id"] for m in result["external"]] == ["tmdb_27205"]
+    assert result["partial"] is True
@@ -1,7 +1,7 @@
 import pytest
 import datetime
 from fastapi import HTTPException
-from app.services.user_service import create_user, update_user, get_user_by_id, list_users, delete_user
+from app.services.user_service import create_user, update_user, get_user_by_id, list_users, delete_user, get_usernames_by_ids
 from app.schemas.user import UserCreate, User, UserUpdate
 
 @pytest.fixture
@@ -150,4 +150,16 @@ def test_delete_user_invalid_user(mocker):
     with pytest.raises(HTTPException) as ex:
         delete_user("1234")
     assert ex.value.status_code == 404
-    assert "not found" in ex.value.detail
\ No newline at end of file
+    assert "not found" in ex.value.detail
+
+def test_get_usernames_by_ids_single_load(mocker, user_data):
+    other = {**user_data, "id": "5678", "username": "someoneelse"}
+    mock_load = mocker.patch("app.services.user_service.load_all", return_value=[user_data, other])
+    result = get_usernames_by_ids(["1234", "5678", "missing"])
+    assert result == {"1234": "testmovielover", "5678": "someoneelse"}
+    mock_load.assert_called_once()
+
+def test_get_usernames_by_ids_empty_skips_load(mocker):
+    mock_load = mocker.patch("app.services.user_service.load_all")
+    assert get_usernames_by_ids([]) == {}
+    assert not mock_load.called